@@ -0,0 +1,223 @@
+"""
+Tamanho de `links` e dos seus índices e tempo de varredura do get_subgraph
+com os textos âncora guardados como JSON de strings em cada linha (esquema
+antigo, tabela legacy_links) e internados em anchor_texts, com os links
+guardando só os ids (esquema atual).
+
+Os textos âncora seguem uma distribuição de Zipf sobre um vocabulário fixo,
+como na Wikipedia ("brasil", "século xx" etc. se repetem em milhares de
+páginas). Os tamanhos vêm do dbstat no SQLite e de pg_relation_size no
+PostgreSQL.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_anchor_storage.py --pages 10000 --links-per-page 20
+    python benchmarks/bench_anchor_storage.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import accumulate
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.engine import make_engine
+from db.repositories.page import CHUNK_SIZE, PageRepository, aggregate_links
+from models.graph_objects import LinkBase, PageBase
+
+LEGACY_DDL = [
+    "CREATE TABLE legacy_links (source_page_id INTEGER NOT NULL,"
+    " target_page_id INTEGER NOT NULL, anchor_texts JSON, multiplicity INTEGER NOT NULL,"
+    " PRIMARY KEY (source_page_id, target_page_id))",
+    "CREATE INDEX ix_legacy_links_target_source"
+    " ON legacy_links (target_page_id, source_page_id)",
+]
+
+
+def make_vocabulary(size, rng):
+    letters = "abcdefghijklmnopqrstuvwxyzáéíóúçã"
+    return [
+        " ".join(
+            "".join(rng.choices(letters, k=rng.randint(3, 10)))
+            for _ in range(rng.randint(1, 3))
+        )
+        for _ in range(size)
+    ]
+
+
+def make_pairs(num_pages, links_per_page, vocabulary, rng):
+    # Zipf (s = 1): o k-ésimo texto mais comum tem peso 1/k
+    cum_weights = list(accumulate(1 / k for k in range(1, len(vocabulary) + 1)))
+    pairs = []
+    for i in range(1, num_pages + 1):
+        anchors = rng.choices(vocabulary, cum_weights=cum_weights, k=links_per_page)
+        pairs.append(
+            (
+                PageBase(page_id=i, title=f"Página {i}", url=f"p{i}"),
+                [
+                    LinkBase(
+                        source_page_id=i,
+                        target_page_id=((i * 7 + j * 13) % num_pages) + 1,
+                        anchor_text=anchor,
+                    )
+                    for j, anchor in enumerate(anchors)
+                ],
+            )
+        )
+    return pairs
+
+
+def relation_sizes(connection, names):
+    """Bytes ocupados por tabela/índice."""
+    if connection.dialect.name == "postgresql":
+        query = text("SELECT pg_relation_size(CAST(:name AS regclass))")
+        return {
+            name: connection.execute(query, {"name": name}).scalar() for name in names
+        }
+    rows = connection.execute(
+        text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+    ).all()
+    sizes = dict(rows)
+    return {name: sizes.get(name, 0) for name in names}
+
+
+def legacy_subgraph(session, page_ids):
+    """get_subgraph sobre legacy_links, com o JSON decodificado."""
+    pages_query = text("SELECT * FROM pages WHERE page_id IN :page_ids").bindparams(
+        bindparam("page_ids", expanding=True)
+    )
+    links_query = text(
+        "SELECT * FROM legacy_links WHERE source_page_id IN :page_ids"
+    ).bindparams(bindparam("page_ids", expanding=True))
+    id_set = set(page_ids)
+    pages, links = [], []
+    for i in range(0, len(page_ids), CHUNK_SIZE):
+        chunk = {"page_ids": page_ids[i : i + CHUNK_SIZE]}
+        pages.extend(
+            dict(row) for row in session.execute(pages_query, chunk).mappings()
+        )
+        for row in session.execute(links_query, chunk):
+            if row.target_page_id in id_set:
+                link = dict(row._mapping)
+                if isinstance(link["anchor_texts"], str):
+                    link["anchor_texts"] = json.loads(link["anchor_texts"])
+                links.append(link)
+    return pages, links
+
+
+def timed(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def mb(size):
+    return f"{size / 2**20:7.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=10_000)
+    parser.add_argument("--links-per-page", type=int, default=20)
+    parser.add_argument("--vocabulary", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pairs = make_pairs(
+        args.pages, args.links_per_page, make_vocabulary(args.vocabulary, rng), rng
+    )
+    page_ids = list(range(1, args.pages + 1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            for statement in LEGACY_DDL:
+                connection.execute(text(statement))
+            rows = aggregate_links([link for _, links in pairs for link in links])
+            connection.execute(
+                text("INSERT INTO legacy_links VALUES (:s, :t, :a, :m)"),
+                [
+                    {"s": s, "t": t, "a": json.dumps(a, ensure_ascii=False), "m": m}
+                    for s, t, a, m in rows
+                ],
+            )
+        session = sessionmaker(bind=engine)()
+        repository = PageRepository(session)
+        repository.save_pages_with_links(pairs)
+        session.execute(text("ANALYZE"))
+        session.commit()
+        print(
+            f"{engine.dialect.name}: {len(rows)} links, "
+            f"vocabulário de {args.vocabulary} textos âncora (Zipf)"
+        )
+
+        legacy_pk = "legacy_links_pkey"
+        current_pk = "links_pkey"
+        if engine.dialect.name == "sqlite":
+            legacy_pk = "sqlite_autoindex_legacy_links_1"
+            current_pk = "sqlite_autoindex_links_1"
+        sizes = relation_sizes(
+            session.connection(),
+            [
+                "legacy_links",
+                legacy_pk,
+                "ix_legacy_links_target_source",
+                "links",
+                current_pk,
+                "ix_links_target_source",
+                "anchor_texts",
+                "ix_anchor_texts_text",
+            ],
+        )
+
+        legacy_time, (_, legacy) = timed(
+            lambda: legacy_subgraph(session, page_ids), args.repeat
+        )
+
+        def current_subgraph():
+            # Cache frio: os ids são resolvidos no banco a cada repetição
+            repository.anchors.cache.clear()
+            return repository.get_subgraph(page_ids)
+
+        current_time, (_, current) = timed(current_subgraph, args.repeat)
+        assert len(legacy) == len(current)
+        assert legacy[0]["anchor_texts"] == current[0]["anchor_texts"]
+
+        print(
+            f"{'JSON de strings':<18} tabela {mb(sizes['legacy_links'])}  "
+            f"índices {mb(sizes[legacy_pk] + sizes['ix_legacy_links_target_source'])}  "
+            f"get_subgraph {legacy_time * 1000:8.1f} ms"
+        )
+        print(
+            f"{'ids internados':<18} tabela {mb(sizes['links'])}  "
+            f"índices {mb(sizes[current_pk] + sizes['ix_links_target_source'])}  "
+            f"get_subgraph {current_time * 1000:8.1f} ms"
+        )
+        print(
+            f"{'':<18} anchor_texts {mb(sizes['anchor_texts'])}  "
+            f"índice {mb(sizes['ix_anchor_texts_text'])}"
+        )
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Teste de carga da API: latência de GET /api/pages/{id} sozinho e enquanto
+vários GET /api/graph/build longos rodam ao mesmo tempo. Só parte da wiki
+está no banco; a fronteira de cada grafo é baixada de um servidor MediaWiki
+falso com latência artificial. Com as rotas async e o AsyncPageRepository
+os builds esperam a rede sem prender threads nem conexões, e a latência das
+consultas simples deve ficar estável.
+
+Roda a aplicação em processo (httpx.ASGITransport) sobre um SQLite
+temporário, ou sobre o banco de --database-url (URL síncrona; a API usa a
+versão assíncrona dela).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_api_load.py --builders 4 --latency 0.2 --duration 10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BACK_END = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACK_END)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def probe(client, page_ids, stop, latencies):
+    rnd = random.Random()
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(f"/api/pages/{rnd.choice(page_ids)}")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def build(client, seeds, depth, stop, durations):
+    rnd = random.Random()
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(
+            "/api/graph/build", params={"seed": rnd.choice(seeds), "depth": depth}
+        )
+        response.raise_for_status()
+        durations.append(time.perf_counter() - start)
+
+
+async def run_phase(app, args, page_ids, seeds, builders):
+    import httpx
+
+    latencies, builds = [], []
+    stop = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        tasks = [
+            asyncio.create_task(probe(client, page_ids, stop, latencies))
+            for _ in range(args.probers)
+        ] + [
+            asyncio.create_task(build(client, seeds, args.depth, stop, builds))
+            for _ in range(builders)
+        ]
+        await asyncio.sleep(args.duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    label = f"{builders} builds em paralelo"
+    return (
+        f"{label:<24} /pages/{{id}}: {len(latencies):>6} req  "
+        f"p50 {statistics.median(latencies) * 1000:6.1f} ms  "
+        f"p95 {percentile(latencies, 0.95) * 1000:6.1f} ms  "
+        f"p99 {percentile(latencies, 0.99) * 1000:6.1f} ms"
+        + (
+            f"  | /graph/build: {len(builds)} ok, "
+            f"média {statistics.mean(builds):.2f}s"
+            if builds
+            else ""
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=50_000)
+    parser.add_argument("--cached", type=int, default=5_000)
+    parser.add_argument("--links-per-page", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--builders", type=int, default=4)
+    parser.add_argument("--probers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = args.database_url or (
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        # Cache da API e outros arquivos relativos ficam no diretório temporário
+        os.chdir(tmp)
+
+        from main import app  # cria as tabelas no banco de DATABASE_URL
+        from benchmarks.bench_write_path import make_pairs
+        from benchmarks.fake_mediawiki import FakeWiki, serve, unthrottled_limiter
+        from db.engine import async_engine, engine
+        from db.repositories.page import PageRepository, get_async_page_repository
+        from db.session import SessionLocal
+        from fastapi import Depends
+        from scraper.api_client import APIClient
+        from scraper.wiki_scraper import WikiScraper
+        from services.page import PageService, get_page_service
+
+        # Mesmos links da FakeWiki; só as primeiras `cached` páginas no banco
+        pairs = make_pairs(args.pages, args.links_per_page)[: args.cached]
+        session = SessionLocal()
+        PageRepository(session).save_pages_with_links(pairs)
+        session.close()
+
+        page_ids = [page.page_id for page, _ in pairs]
+        seeds = [page.title for page, _ in pairs]
+        print(
+            f"{engine.dialect.name}: {args.cached}/{args.pages} páginas em cache, "
+            f"latência da wiki {args.latency * 1000:.0f} ms, depth {args.depth}, "
+            f"{args.probers} clientes em /pages/{{id}}"
+        )
+
+        wiki = FakeWiki(args.pages, args.links_per_page)
+        with serve(wiki, latency=args.latency) as url:
+            with contextlib.redirect_stdout(io.StringIO()):
+                scraper = WikiScraper(
+                    APIClient(api_url=url, rate_limiter=unthrottled_limiter())
+                )
+
+            async def fake_wiki_service(
+                repository=Depends(get_async_page_repository),
+            ) -> PageService:
+                return PageService(repository, scraper=scraper)
+
+            app.dependency_overrides[get_page_service] = fake_wiki_service
+
+            async def run():
+                # Os logs do scraper vão para stdout; só os resultados aparecem
+                with contextlib.redirect_stdout(io.StringIO()):
+                    idle = await run_phase(app, args, page_ids, seeds, 0)
+                    loaded = await run_phase(app, args, page_ids, seeds, args.builders)
+                await async_engine.dispose()
+                print(idle)
+                print(loaded)
+
+            asyncio.run(run())
+
+        engine.dispose()
+        os.chdir(BACK_END)
+
+
+if __name__ == "__main__":
+    main()
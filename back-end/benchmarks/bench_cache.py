@@ -0,0 +1,61 @@
+"""
+Re-crawl frio vs. quente com o ResponseCache em disco, contra o servidor
+MediaWiki falso com latência artificial.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_cache.py --depth 2 --latency 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_mediawiki import FakeWiki, serve, unthrottled_limiter
+from benchmarks.memory_repository import InMemoryPageRepository
+from scraper.api_client import APIClient
+from scraper.cache import ResponseCache
+from scraper.wiki_scraper import WikiScraper
+from services.crawler import AsyncBFSCrawler
+
+
+def crawl(url, cache, depth, max_neighbors):
+    repository = InMemoryPageRepository()
+    with contextlib.redirect_stdout(io.StringIO()):
+        api = APIClient(api_url=url, cache=cache, rate_limiter=unthrottled_limiter())
+        crawler = AsyncBFSCrawler(repository, WikiScraper(api))
+        start = time.perf_counter()
+        crawler.run("Página 1", depth, max_neighbors)
+        elapsed = time.perf_counter() - start
+    return len(repository.pages), api.stats["requests"], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--links", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--max-neighbors", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    wiki = FakeWiki(args.pages, args.links)
+    with tempfile.TemporaryDirectory() as tmp, serve(wiki, args.latency) as url:
+        cache = ResponseCache(os.path.join(tmp, "cache.sqlite3"))
+        print(f"{'run':>5} {'pages':>6} {'http':>6} {'secs':>7} {'pages/s':>8}")
+        for label in ("cold", "warm"):
+            pages, requests, elapsed = crawl(url, cache, args.depth, args.max_neighbors)
+            print(
+                f"{label:>5} {pages:>6} {requests:>6} {elapsed:>7.2f} "
+                f"{pages / elapsed:>8.1f}"
+            )
+        print(f"cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
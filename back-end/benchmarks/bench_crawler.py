@@ -0,0 +1,68 @@
+"""
+Benchmark do AsyncBFSCrawler contra um servidor MediaWiki falso local.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_crawler.py --depth 2 --latency 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_mediawiki import FakeWiki, serve, unthrottled_limiter
+from benchmarks.memory_repository import InMemoryPageRepository
+from scraper.api_client import APIClient
+from scraper.wiki_scraper import WikiScraper
+from services.crawler import AsyncBFSCrawler
+
+
+def run_once(url: str, depth: int, max_neighbors: int, concurrency: int):
+    repository = InMemoryPageRepository()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = WikiScraper(
+            APIClient(api_url=url, rate_limiter=unthrottled_limiter())
+        )
+        crawler = AsyncBFSCrawler(repository, scraper, max_concurrency=concurrency)
+        visited = crawler.run("Página 1", depth, max_neighbors)
+    elapsed = time.perf_counter() - start
+    return visited, len(repository.pages), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--links", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--max-neighbors", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    wiki = FakeWiki(args.pages, args.links)
+    baseline = None
+    with serve(wiki, latency=args.latency) as url:
+        print(
+            f"{'concurrency':>11} {'scraped':>8} {'visited':>8} {'secs':>8} {'pages/s':>8}"
+        )
+        for concurrency in args.concurrency:
+            visited, scraped, elapsed = run_once(
+                url, args.depth, args.max_neighbors, concurrency
+            )
+            if baseline is None:
+                baseline = visited
+            assert visited == baseline, "conjunto visitado difere entre execuções"
+            print(
+                f"{concurrency:>11} {scraped:>8} {len(visited):>8} "
+                f"{elapsed:>8.2f} {scraped / elapsed:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Carga de dumps sintéticos (page/redirect/pagelinks, gzip) pelo DumpImporter,
+para medir linhas/s do parser em streaming + inserção em lote.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_dump_import.py --pages 100000 --links-per-page 30
+    python benchmarks/bench_dump_import.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+
+from db.base import Base
+from dumps.importer import DumpImporter
+
+# Tuplas por INSERT, como no mysqldump dos dumps da Wikimedia (~1 MB por linha)
+ROWS_PER_INSERT = 2000
+
+
+def write_dump(path, table, columns, rows):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(f"CREATE TABLE `{table}` (\n")
+        for column in columns:
+            f.write(f"  `{column}` int(8) NOT NULL,\n")
+        f.write(f"  PRIMARY KEY (`{columns[0]}`)\n) ENGINE=InnoDB;\n")
+        batch = []
+        for row in rows:
+            batch.append("(" + ",".join(row) + ")")
+            if len(batch) == ROWS_PER_INSERT:
+                f.write(f"INSERT INTO `{table}` VALUES {','.join(batch)};\n")
+                batch = []
+        if batch:
+            f.write(f"INSERT INTO `{table}` VALUES {','.join(batch)};\n")
+
+
+def make_dumps(directory, num_pages, links_per_page):
+    # Uma página em cada 10 é redirect para a seguinte
+    def is_redirect(page_id):
+        return page_id % 10 == 0
+
+    page = os.path.join(directory, "page.sql.gz")
+    write_dump(
+        page,
+        "page",
+        [
+            "page_id",
+            "page_namespace",
+            "page_title",
+            "page_is_redirect",
+            "page_touched",
+            "page_latest",
+            "page_len",
+        ],
+        (
+            [
+                str(i),
+                "0",
+                f"'Página_{i}'",
+                str(int(is_redirect(i))),
+                "'20250101000000'",
+                str(10_000 + i),
+                str(1000 + i),
+            ]
+            for i in range(1, num_pages + 1)
+        ),
+    )
+    redirect = os.path.join(directory, "redirect.sql.gz")
+    write_dump(
+        redirect,
+        "redirect",
+        ["rd_from", "rd_namespace", "rd_title", "rd_interwiki"],
+        (
+            [str(i), "0", f"'Página_{i % num_pages + 1}'", "''"]
+            for i in range(1, num_pages + 1)
+            if is_redirect(i)
+        ),
+    )
+    pagelinks = os.path.join(directory, "pagelinks.sql.gz")
+    write_dump(
+        pagelinks,
+        "pagelinks",
+        ["pl_from", "pl_namespace", "pl_title", "pl_from_namespace"],
+        (
+            [str(i), "0", f"'Página_{t}'", "0"]
+            for i in range(1, num_pages + 1)
+            for t in sorted(
+                {((i * 7 + j * 13) % num_pages) + 1 for j in range(links_per_page)}
+            )
+        ),
+    )
+    return page, redirect, pagelinks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100_000)
+    parser.add_argument("--links-per-page", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        page, redirect, pagelinks = make_dumps(tmp, args.pages, args.links_per_page)
+        sizes = sum(os.path.getsize(p) for p in (page, redirect, pagelinks))
+        print(
+            f"Dumps: {sizes / 1e6:.1f} MB gzip "
+            f"({time.perf_counter() - start:.1f}s para gerar)"
+        )
+
+        engine = create_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine)
+        importer = DumpImporter(engine, batch_size=args.batch_size)
+        importer.clear_tables()
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = importer.run(page, redirect_path=redirect, pagelinks_path=pagelinks)
+        elapsed = time.perf_counter() - start
+
+    rows = stats["pages"] + stats["links"]
+    print(f"{engine.dialect.name}: {stats}")
+    print(f"{elapsed:.1f}s, {rows / elapsed:,.0f} linhas/s")
+
+
+if __name__ == "__main__":
+    main()
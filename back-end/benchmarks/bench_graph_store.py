@@ -0,0 +1,126 @@
+"""
+Carga do grafo para o PageRank: o caminho atual (get_subgraph → PageResponse
+/ LinkBase → build_graph, um dict de sets) vs. o CSRGraph do
+services.graph_store lido do banco e aberto do snapshot (np.memmap e
+np.fromfile). Mede o tempo de carga e os bytes por aresta da estrutura que
+fica em memória (tracemalloc para o dict de sets, nbytes para o CSR).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_graph_store.py --pages 20000 --links-per-page 25
+    python benchmarks/bench_graph_store.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.engine import make_engine
+from db.repositories.page import PageRepository
+from models.graph_objects import LinkBase, PageResponse
+from services.graph_store import CSRGraph
+from services.pagerank import build_graph
+from benchmarks.bench_write_path import make_pairs
+
+
+def dict_of_sets(repository, page_ids):
+    """Carga atual de calculate_pagerank."""
+    pages, links = repository.get_subgraph(page_ids)
+    nodes = [PageResponse(**page) for page in pages]
+    edges = [
+        LinkBase(
+            source_page_id=link["source_page_id"],
+            target_page_id=link["target_page_id"],
+        )
+        for link in links
+    ]
+    return build_graph(nodes, edges)
+
+
+def retained_bytes(load):
+    """Tempo de `load()` e bytes que o resultado mantém alocados."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained, result
+
+
+def timed(load):
+    start = time.perf_counter()
+    result = load()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20_000)
+    parser.add_argument("--links-per-page", type=int, default=25)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        repository = PageRepository(session)
+        repository.save_pages_with_links(make_pairs(args.pages, args.links_per_page))
+        page_ids = list(range(1, args.pages + 1))
+        snapshot = os.path.join(tmp, "graph.csr")
+
+        # O tempo do dict de sets vem sem tracemalloc, que o deixa mais lento
+        dict_time, _ = timed(lambda: dict_of_sets(repository, page_ids))
+        _, dict_bytes, (_, out_neighbors, _) = retained_bytes(
+            lambda: dict_of_sets(repository, page_ids)
+        )
+        num_edges = sum(len(targets) for targets in out_neighbors.values())
+        del out_neighbors
+
+        db_time, graph = timed(lambda: CSRGraph.from_repository(repository))
+        graph.save(snapshot)
+        mmap_time, mapped = timed(lambda: CSRGraph.load(snapshot)[0])
+        read_time, _ = timed(lambda: CSRGraph.load(snapshot, mmap=False)[0])
+        # Primeiro acesso às páginas mapeadas (o que o PageRank pagaria)
+        touch_time, _ = timed(lambda: int(mapped.indices.sum()))
+        assert graph.num_edges == num_edges
+
+        print(
+            f"{engine.dialect.name}: {args.pages} páginas, {num_edges} arestas, "
+            f"snapshot de {os.path.getsize(snapshot) / 2**20:.1f} MB"
+        )
+        rows = [
+            ("dict de sets (banco)", dict_time, dict_bytes),
+            ("CSR (banco)", db_time, graph.nbytes),
+            ("CSR (snapshot, mmap)", mmap_time, graph.nbytes),
+            ("CSR (snapshot, leitura)", read_time, graph.nbytes),
+        ]
+        for label, elapsed, size in rows:
+            print(
+                f"{label:<24} carga {elapsed * 1000:9.1f} ms  "
+                f"{size / 2**20:7.1f} MB  {size / num_edges:6.1f} bytes/aresta"
+            )
+        print(f"{'':<24} 1ª leitura do mmap {touch_time * 1000:.1f} ms")
+
+        del mapped
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
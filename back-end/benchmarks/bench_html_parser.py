@@ -0,0 +1,73 @@
+"""
+Microbenchmark da extração de links: BeautifulSoup ("html.parser", a
+implementação anterior) vs. o scanner atual do HTMLParser, em MB/s.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_html_parser.py --repeat 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from scraper.html_parser import HTMLParser
+
+CORPUS_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "html"
+
+
+def beautifulsoup_extract_links(html: str):
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        text = a.get_text(strip=True)
+        if href.startswith("/wiki/"):
+            links.append((unquote(href.replace("/wiki/", "")), text.lower()))
+    return links
+
+
+def measure(fn, html: str, rounds: int):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn(html)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200, help="cópias do corpus")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = "\n".join(
+        p.read_text(encoding="utf-8") for p in sorted(CORPUS_DIR.glob("*.html"))
+    )
+    html = corpus * args.repeat
+    size_mb = len(html.encode("utf-8")) / 1e6
+
+    fast = HTMLParser()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fast_links, fast_secs = measure(fast.extract_links, html, args.rounds)
+    bs_links, bs_secs = measure(beautifulsoup_extract_links, html, args.rounds)
+    assert fast_links == bs_links
+
+    print(f"documento: {size_mb:.2f} MB, {len(fast_links)} links")
+    print(f"{'extrator':>14} {'secs':>8} {'MB/s':>8}")
+    print(f"{'beautifulsoup':>14} {bs_secs:>8.3f} {size_mb / bs_secs:>8.1f}")
+    print(f"{'scanner':>14} {fast_secs:>8.3f} {size_mb / fast_secs:>8.1f}")
+    print(f"speedup: {bs_secs / fast_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Planos (EXPLAIN) e tempos das consultas de leitura do PageRepository no
+esquema antigo de `links` (id surrogate, sem índices, pares repetidos, título
+sem índice) e no novo (PK (source, target), índice reverso, título único).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_link_indexes.py --pages 20000 --links-per-page 40
+    python benchmarks/bench_link_indexes.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import bindparam, create_engine, text
+
+from db.base import Base
+from db.db_models import Link, Page
+
+LEGACY_DDL = [
+    "CREATE TABLE legacy_pages (page_id INTEGER PRIMARY KEY, title VARCHAR NOT NULL,"
+    " url VARCHAR NOT NULL, pagerank_score FLOAT)",
+    "CREATE TABLE legacy_links (id INTEGER PRIMARY KEY, source_page_id INTEGER NOT NULL,"
+    " target_page_id INTEGER NOT NULL, anchor_text VARCHAR)",
+]
+
+QUERIES = {
+    "get_page_by_title": (
+        "SELECT * FROM {pages} WHERE title = :title",
+        lambda n, rng: {"title": f"Página {rng.randint(1, n)}"},
+    ),
+    "get_neighbor_ids": (
+        "SELECT target_page_id FROM {links} WHERE source_page_id = :page_id LIMIT 50",
+        lambda n, rng: {"page_id": rng.randint(1, n)},
+    ),
+    "links_in": (
+        "SELECT source_page_id FROM {links} WHERE target_page_id = :page_id",
+        lambda n, rng: {"page_id": rng.randint(1, n)},
+    ),
+    "get_subgraph (links)": (
+        "SELECT * FROM {links} WHERE source_page_id IN :page_ids"
+        " AND target_page_id IN :page_ids",
+        lambda n, rng: {"page_ids": rng.sample(range(1, n + 1), 200)},
+    ),
+}
+
+
+def links_of(page_id, num_pages, links_per_page):
+    # ~10% dos links repetem um alvo já citado pela mesma página
+    for j in range(links_per_page):
+        k = j if j % 10 else max(j - 1, 0)
+        yield ((page_id * 7 + k * 13) % num_pages) + 1, f"âncora {j}"
+
+
+def populate(engine, num_pages, links_per_page):
+    with engine.begin() as connection:
+        for ddl in LEGACY_DDL:
+            connection.execute(text(ddl))
+        pages = [
+            {"page_id": i, "title": f"Página {i}", "url": f"/wiki/P{i}"}
+            for i in range(1, num_pages + 1)
+        ]
+        for table in ("legacy_pages", "pages"):
+            connection.execute(
+                text(
+                    f"INSERT INTO {table} (page_id, title, url) "
+                    "VALUES (:page_id, :title, :url)"
+                ),
+                pages,
+            )
+
+        legacy, grouped = [], {}
+        for i in range(1, num_pages + 1):
+            for target, anchor in links_of(i, num_pages, links_per_page):
+                legacy.append({"s": i, "t": target, "a": anchor})
+                grouped[(i, target)] = grouped.get((i, target), 0) + 1
+        connection.execute(
+            text(
+                "INSERT INTO legacy_links (source_page_id, target_page_id, anchor_text)"
+                " VALUES (:s, :t, :a)"
+            ),
+            legacy,
+        )
+        connection.execute(
+            text(
+                "INSERT INTO links (source_page_id, target_page_id, multiplicity)"
+                " VALUES (:s, :t, :m)"
+            ),
+            [{"s": s, "t": t, "m": m} for (s, t), m in grouped.items()],
+        )
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("ANALYZE"))
+    return len(legacy), len(grouped)
+
+
+def explain(connection, statement, params):
+    if connection.dialect.name == "postgresql":
+        prefix = "EXPLAIN ANALYZE "
+    else:
+        prefix = "EXPLAIN QUERY PLAN "
+    query = text(prefix + statement)
+    if "page_ids" in params:
+        query = query.bindparams(bindparam("page_ids", expanding=True))
+    rows = connection.execute(query, params).fetchall()
+    return [str(row[-1]) for row in rows]
+
+
+def timed(connection, statement, params_for, num_pages, repeat):
+    query = text(statement)
+    if "page_ids" in statement:
+        query = query.bindparams(bindparam("page_ids", expanding=True))
+    rng = random.Random(42)
+    params = [params_for(num_pages, rng) for _ in range(repeat)]
+    start = time.perf_counter()
+    for p in params:
+        connection.execute(query, p).fetchall()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20_000)
+    parser.add_argument("--links-per-page", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--database-url", help="Banco de destino vazio (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine, tables=[Page.__table__, Link.__table__])
+        legacy_rows, rows = populate(engine, args.pages, args.links_per_page)
+        print(
+            f"{engine.dialect.name}: {args.pages} páginas, "
+            f"links antigos={legacy_rows}, links novos={rows}\n"
+        )
+
+        schemas = {
+            "antigo": {"pages": "legacy_pages", "links": "legacy_links"},
+            "novo": {"pages": "pages", "links": "links"},
+        }
+        with engine.connect() as connection:
+            for name, (statement, params_for) in QUERIES.items():
+                print(f"== {name}")
+                for schema, tables in schemas.items():
+                    sql = statement.format(**tables)
+                    params = params_for(args.pages, random.Random(0))
+                    ms = timed(connection, sql, params_for, args.pages, args.repeat)
+                    print(f"  [{schema}] {ms:8.3f} ms/consulta")
+                    for line in explain(connection, sql, params):
+                        print(f"      {line}")
+                print()
+
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE legacy_links"))
+            connection.execute(text("DROP TABLE legacy_pages"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
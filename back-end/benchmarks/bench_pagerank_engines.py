@@ -0,0 +1,132 @@
+"""
+PageRank em grafos sintéticos de 10³ a 10⁶ nós: a implementação antiga com
+dicts (uma passada em Python por aresta a cada iteração) vs. pagerank_csr
+(scipy.sparse) em float64 e float32. Mostra o tempo total, o tempo por
+iteração e a maior diferença de score em relação ao float64.
+
+O grafo tem grau de saída médio --degree, alvos com distribuição de cauda
+longa (poucas páginas muito citadas) e ~10% de nós sem saída.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_pagerank_engines.py
+    python benchmarks/bench_pagerank_engines.py --sizes 1000 10000 --dict-max 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from services.graph_store import CSRGraph
+from services.pagerank import pagerank_csr
+
+
+def dict_pagerank(nodes, edges, d=0.85, max_iter=100, tol=1e-6):
+    """services.pagerank.pagerank antes da versão vetorizada."""
+    node_ids = [node.page_id for node in nodes]
+    node_set = set(node_ids)
+    out_neighbors = defaultdict(set)
+    for edge in edges:
+        if edge.source_page_id in node_set and edge.target_page_id in node_set:
+            out_neighbors[edge.source_page_id].add(edge.target_page_id)
+    out_degree = {u: len(out_neighbors[u]) for u in node_ids}
+    N = len(node_ids)
+
+    rank = {pid: 1.0 / N for pid in node_ids}
+    for iterations in range(1, max_iter + 1):
+        new_rank = {pid: (1.0 - d) / N for pid in node_ids}
+        dangling_sum = sum(rank[pid] for pid in node_ids if out_degree[pid] == 0)
+        for pid in node_ids:
+            new_rank[pid] += d * dangling_sum / N
+        for u in node_ids:
+            if out_degree[u] == 0:
+                continue
+            contrib = d * rank[u] / out_degree[u]
+            for v in out_neighbors[u]:
+                new_rank[v] += contrib
+        diff = sum(abs(new_rank[pid] - rank[pid]) for pid in node_ids)
+        rank = new_rank
+        if diff < tol:
+            break
+    return rank, iterations
+
+
+def make_graph(num_nodes, degree, rng):
+    num_edges = num_nodes * degree
+    sources = rng.integers(0, num_nodes, num_edges)
+    # Cauda longa: alvos concentrados nos menores ids
+    targets = (num_nodes * rng.random(num_edges) ** 3).astype(np.int64)
+    # ~10% dos nós sem links de saída
+    keep = sources % 10 != 0
+    return sources[keep] + 1, targets[keep] + 1
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--degree", type=int, default=10)
+    parser.add_argument("--tol", type=float, default=1e-6)
+    parser.add_argument(
+        "--dict-max",
+        type=int,
+        default=100_000,
+        help="Maior grafo em que a versão com dicts roda (é lenta)",
+    )
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'nós':>9} {'arestas':>10} {'motor':<10} {'total':>10} "
+        f"{'por iter.':>10} {'iter.':>5} {'Δ máx.':>9}"
+    )
+    for num_nodes in args.sizes:
+        sources, targets = make_graph(num_nodes, args.degree, rng)
+        graph = CSRGraph.from_edges(sources, targets, np.arange(1, num_nodes + 1))
+
+        results = {}
+        for label, dtype in (("float64", np.float64), ("float32", np.float32)):
+            residuals = []
+            elapsed, ranks = timed(
+                lambda: pagerank_csr(
+                    graph, tol=args.tol, dtype=dtype, residuals=residuals
+                )
+            )
+            results[label] = (elapsed, len(residuals), ranks.astype(np.float64))
+
+        if num_nodes <= args.dict_max:
+            nodes = [SimpleNamespace(page_id=int(pid)) for pid in graph.page_ids]
+            edges = [
+                SimpleNamespace(source_page_id=int(s), target_page_id=int(t))
+                for s, t in zip(sources, targets)
+            ]
+            elapsed, (ranks, dict_iterations) = timed(
+                lambda: dict_pagerank(nodes, edges, tol=args.tol)
+            )
+            ranks = np.array([ranks[int(pid)] for pid in graph.page_ids])
+            results = {"dicts": (elapsed, dict_iterations, ranks), **results}
+
+        reference = results["float64"][2]
+        for label, (elapsed, iters, ranks) in results.items():
+            print(
+                f"{num_nodes:>9} {graph.num_edges:>10} {label:<10} "
+                f"{elapsed * 1000:8.1f}ms {elapsed / iters * 1000:8.2f}ms "
+                f"{iters:>5} {np.abs(ranks - reference).max():9.1e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+PageRank multiprocesso (services.pagerank_parallel.ParallelPageRank) com 1,
+2, 4 e 8 processos vs. o motor serial (pagerank_csr), no mesmo grafo
+sintético do bench_pagerank_engines. Mostra o custo de preparar os blocos
+em shared_memory e subir o pool, o tempo por iteração, o speedup sobre o
+serial por iteração e de ponta a ponta (com o preparo) e a maior
+diferença de score.
+
+O speedup depende dos núcleos livres (os.cpu_count()) e da banda de
+memória: com menos núcleos que processos, eles só disputam a mesma CPU.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_pagerank_parallel.py
+    python benchmarks/bench_pagerank_parallel.py --nodes 10000000 --workers 1 4 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from services.graph_store import CSRGraph
+from services.pagerank import pagerank_csr
+from services.pagerank_parallel import ParallelPageRank
+from benchmarks.bench_pagerank_engines import make_graph
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--degree", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tol", type=float, default=1e-6)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    sources, targets = make_graph(args.nodes, args.degree, rng)
+    graph = CSRGraph.from_edges(sources, targets, np.arange(1, args.nodes + 1))
+    print(
+        f"{graph.num_nodes} nós, {graph.num_edges} arestas, "
+        f"{os.cpu_count()} CPUs, tol={args.tol:.0e}"
+    )
+
+    residuals = []
+    serial_time, expected = timed(
+        lambda: pagerank_csr(graph, tol=args.tol, residuals=residuals)
+    )
+    # Por iteração sem a montagem da matriz, que pagerank_csr faz a cada chamada
+    first_time, _ = timed(lambda: pagerank_csr(graph, max_iter=1))
+    serial_step = (serial_time - first_time) / (len(residuals) - 1)
+    print(
+        f"{'motor':<12} {'preparo':>10} {'total':>10} {'por iter.':>10} "
+        f"{'iter.':>5} {'speedup':>8} {'c/ preparo':>10} {'Δ máx.':>9}"
+    )
+    print(
+        f"{'serial':<12} {'':>10} {serial_time * 1000:8.1f}ms "
+        f"{serial_step * 1000:8.2f}ms {len(residuals):>5} {1.0:7.2f}x {1.0:9.2f}x"
+    )
+
+    for workers in args.workers:
+        setup_time, engine = timed(lambda: ParallelPageRank(graph, workers))
+        with engine:
+            # Primeira execução monta as matrizes dos blocos em cada processo
+            engine.run(max_iter=1)
+            residuals = []
+            elapsed, ranks = timed(
+                lambda: engine.run(tol=args.tol, residuals=residuals)
+            )
+        step = elapsed / len(residuals)
+        print(
+            f"{f'{workers} processos':<12} {setup_time * 1000:8.1f}ms "
+            f"{elapsed * 1000:8.1f}ms {step * 1000:8.2f}ms {len(residuals):>5} "
+            f"{serial_step / step:7.2f}x {serial_time / (setup_time + elapsed):9.2f}x "
+            f"{np.abs(ranks - expected).max():9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Consulta dos títulos e gravação dos scores do PageRank: uma consulta e um
+UPDATE por nó (implementação antiga de calculate_pagerank) vs.
+get_pages_by_titles + update_pagerank_scores (UPDATE ... FROM unnest no
+PostgreSQL).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_pagerank_persist.py --nodes 5000
+    python benchmarks/bench_pagerank_persist.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.repositories.page import PageRepository
+from benchmarks.bench_write_path import make_pairs
+
+
+def per_node(repository, titles, scores):
+    title_to_id = {}
+    for title in titles:
+        page = repository.get_page_by_title(title)
+        if page:
+            title_to_id[title] = page["page_id"]
+    lookup_done = time.perf_counter()
+    for page_id, score in scores.items():
+        repository.db_session.execute(
+            text("UPDATE pages SET pagerank_score = :score WHERE page_id = :page_id"),
+            {"score": score, "page_id": page_id},
+        )
+    repository.db_session.commit()
+    return title_to_id, lookup_done
+
+
+def set_based(repository, titles, scores):
+    title_to_id = repository.get_pages_by_titles(titles)
+    lookup_done = time.perf_counter()
+    repository.update_pagerank_scores(scores)
+    return title_to_id, lookup_done
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.nodes, 0)
+    titles = [page.title for page, _ in pairs]
+    scores = {page.page_id: 1.0 / page.page_id for page, _ in pairs}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        repository = PageRepository(session)
+        repository.save_pages_with_links(pairs)
+        print(f"{engine.dialect.name}: {args.nodes} nós")
+
+        for label, run in (("por nó", per_node), ("em conjunto", set_based)):
+            start = time.perf_counter()
+            title_to_id, lookup_done = run(repository, titles, scores)
+            end = time.perf_counter()
+            assert len(title_to_id) == args.nodes
+            print(
+                f"{label:<12} consulta {(lookup_done - start) * 1000:8.1f} ms  "
+                f"gravação {(end - lookup_done) * 1000:8.1f} ms"
+            )
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
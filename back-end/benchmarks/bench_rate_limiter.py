@@ -0,0 +1,71 @@
+"""
+Crawl concorrente contra um servidor falso que limita a taxa (429 +
+Retry-After): mostra o RateLimiter convergindo para a taxa sustentável.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_rate_limiter.py --server-rate 30 --client-rate 100
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_mediawiki import FakeWiki, serve
+from benchmarks.memory_repository import InMemoryPageRepository
+from scraper.api_client import APIClient
+from scraper.rate_limiter import RateLimiter
+from scraper.wiki_scraper import WikiScraper
+from services.crawler import AsyncBFSCrawler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server-rate", type=float, default=30)
+    parser.add_argument("--client-rate", type=float, default=100)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--max-neighbors", type=int, default=12)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    limiter = RateLimiter(max_rate=args.client_rate, burst=5, window=5.0)
+    done = threading.Event()
+
+    def report():
+        while not done.wait(1.0):
+            s = limiter.stats()
+            sys.__stdout__.write(
+                f"rate={s['current_rate']:6.1f}/s sustained={s['sustained_rate']:6.1f}/s "
+                f"throttled={s['throttled']} retries={s['retries']}\n"
+            )
+
+    wiki = FakeWiki(1000, 20)
+    with serve(wiki, latency=0.01, max_rate=args.server_rate) as url:
+        reporter = threading.Thread(target=report, daemon=True)
+        reporter.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            api = APIClient(api_url=url, rate_limiter=limiter)
+            crawler = AsyncBFSCrawler(
+                InMemoryPageRepository(),
+                WikiScraper(api),
+                max_concurrency=args.concurrency,
+            )
+            start = time.perf_counter()
+            visited = crawler.run("Página 1", args.depth, args.max_neighbors)
+            elapsed = time.perf_counter() - start
+        done.set()
+
+    print(
+        f"{len(visited)} páginas, {api.stats['requests']} requisições em "
+        f"{elapsed:.1f}s ({api.stats['requests'] / elapsed:.1f} req/s); "
+        f"final: {limiter.stats()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compara os modos do WikiScraper (HTML vs links-only) contra o servidor
+MediaWiki falso: requisições e bytes transferidos por página.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_scraper_modes.py --pages 200 --links 100
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_mediawiki import FakeWiki, serve, unthrottled_limiter
+from scraper.api_client import APIClient
+from scraper.wiki_scraper import WikiScraper, MODE_HTML, MODE_LINKS
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--links", type=int, default=100)
+    parser.add_argument("--filler-blocks", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    wiki = FakeWiki(args.pages, args.links, filler_blocks=args.filler_blocks)
+    page_ids = list(wiki.titles)
+
+    with serve(wiki, latency=args.latency) as url:
+        print(
+            f"{'mode':>6} {'pages':>6} {'edges':>7} {'requests':>9} "
+            f"{'req/page':>9} {'KB/page':>9} {'secs':>7}"
+        )
+        edges_by_mode = {}
+        for mode in (MODE_HTML, MODE_LINKS):
+            with contextlib.redirect_stdout(io.StringIO()):
+                api = APIClient(api_url=url, rate_limiter=unthrottled_limiter())
+                scraper = WikiScraper(api, mode=mode)
+                start = time.perf_counter()
+                results = scraper.scrape_pages(page_ids)
+                elapsed = time.perf_counter() - start
+
+            edges_by_mode[mode] = {
+                (e.source_page_id, e.target_page_id)
+                for _, edges in results
+                for e in edges
+            }
+            n = len(results)
+            print(
+                f"{mode:>6} {n:>6} {len(edges_by_mode[mode]):>7} "
+                f"{api.stats['requests']:>9} {api.stats['requests'] / n:>9.2f} "
+                f"{api.stats['bytes'] / n / 1024:>9.1f} {elapsed:>7.2f}"
+            )
+
+        assert edges_by_mode[MODE_HTML] == edges_by_mode[MODE_LINKS]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Pico de memória (RSS) ao montar o GraphResponse de um subgrafo com
+~100k arestas: get_subgraph, que materializa páginas e links como dicts com
+todas as colunas (implementação antiga de generate_graph), vs. read_subgraph,
+que lê só (page_id, title) e (source, target) em streaming (yield_per) e
+monta a resposta direto dos iteradores.
+
+Cada leitura roda em um processo novo, para que o pico de uma não mascare
+o da outra. Como o RSS já parte de ~60 MB dos imports, também é mostrado
+o pico de alocações Python da leitura (tracemalloc), que isola o custo dela.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_subgraph_memory.py --nodes 5000 --links-per-page 20
+    python benchmarks/bench_subgraph_memory.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BACK_END = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACK_END)
+
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.engine import make_engine
+from db.repositories.page import PageRepository
+from models.graph_objects import GraphLink, GraphResponse
+from services.graph_builder import assemble_graph
+
+
+def materialized(repository, page_ids):
+    pages, links = repository.get_subgraph(page_ids)
+    id_to_title = {p["page_id"]: p["title"] for p in pages}
+    nodes = [p["title"] for p in pages]
+    graph_links = [
+        GraphLink(
+            source=id_to_title.get(link["source_page_id"], ""),
+            target=id_to_title.get(link["target_page_id"], ""),
+        )
+        for link in links
+        if link["source_page_id"] in id_to_title
+        and link["target_page_id"] in id_to_title
+    ]
+    return GraphResponse(nodes=nodes, links=graph_links)
+
+
+def streaming(repository, page_ids):
+    return repository.read_subgraph(page_ids, assemble_graph)
+
+
+def max_rss_mb():
+    # VmHWM (Linux): ao contrário do ru_maxrss, não herda o pico do processo
+    # pai que semeou o banco
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def read(args):
+    """Executado no processo filho: uma leitura e o pico de memória."""
+    engine = make_engine(args.database_url)
+    session = sessionmaker(bind=engine)()
+    repository = PageRepository(session)
+    page_ids = list(range(1, args.nodes + 1))
+
+    before = max_rss_mb()
+    run = {"dicts": materialized, "streaming": streaming}[args.read]
+    start = time.perf_counter()
+    graph = run(repository, page_ids)
+    elapsed = time.perf_counter() - start
+    peak = max_rss_mb()
+    del graph
+
+    tracemalloc.start()
+    graph = run(repository, page_ids)
+    _, traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{args.read:<10} {len(graph.nodes):>6} nós {len(graph.links):>7} arestas  "
+        f"{elapsed * 1000:8.1f} ms  RSS máx. {peak:6.1f} MB (+{peak - before:5.1f})  "
+        f"alocado na leitura {traced / 2**20:6.1f} MB"
+    )
+    session.close()
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--links-per-page", type=int, default=20)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    parser.add_argument(
+        "--read", choices=["dicts", "streaming"], help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.read:
+        read(args)
+        return
+
+    from benchmarks.bench_write_path import make_pairs
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = make_engine(url)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        PageRepository(session).save_pages_with_links(
+            make_pairs(args.nodes, args.links_per_page)
+        )
+        session.close()
+        print(
+            f"{engine.dialect.name}: subgrafo de {args.nodes} nós e "
+            f"{args.nodes * args.links_per_page} links"
+        )
+        engine.dispose()
+
+        for mode in ("dicts", "streaming"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--read",
+                    mode,
+                    "--nodes",
+                    str(args.nodes),
+                    "--database-url",
+                    url,
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Quantas resoluções de título chegam à API durante um crawl, com e sem o
+LRU do TitleResolver (o nível do banco não entra: não há Postgres aqui).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_title_resolver.py --depth 2
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_mediawiki import FakeWiki, serve, unthrottled_limiter
+from benchmarks.memory_repository import InMemoryPageRepository
+from scraper.api_client import APIClient
+from scraper.title_resolver import TitleLRU, TitleResolver
+from scraper.wiki_scraper import WikiScraper
+from services.crawler import AsyncBFSCrawler
+
+
+class CountingAPIClient(APIClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.resolve_requests = 0
+        self.resolved_titles = 0
+
+    def resolve_titles_batch(self, titles, missing=None):
+        self.resolve_requests += (len(set(titles)) + 49) // 50
+        self.resolved_titles += len(set(titles))
+        return super().resolve_titles_batch(titles, missing=missing)
+
+
+def crawl(url, lru_size, depth, max_neighbors):
+    with contextlib.redirect_stdout(io.StringIO()):
+        api = CountingAPIClient(api_url=url, rate_limiter=unthrottled_limiter())
+        resolver = TitleResolver(api, cache=TitleLRU(max_size=lru_size))
+        scraper = WikiScraper(api, resolver=resolver)
+        repository = InMemoryPageRepository()
+        start = time.perf_counter()
+        AsyncBFSCrawler(repository, scraper).run("Página 1", depth, max_neighbors)
+        elapsed = time.perf_counter() - start
+    return len(repository.pages), api, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--links", type=int, default=60)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--max-neighbors", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    wiki = FakeWiki(args.pages, args.links)
+    with serve(wiki, args.latency) as url:
+        print(
+            f"{'lru':>8} {'pages':>6} {'titles→API':>11} {'resolve req':>12} {'secs':>7}"
+        )
+        for lru_size in (0, 100_000):
+            pages, api, elapsed = crawl(url, lru_size, args.depth, args.max_neighbors)
+            print(
+                f"{lru_size:>8} {pages:>6} {api.resolved_titles:>11} "
+                f"{api.resolve_requests:>12} {elapsed:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
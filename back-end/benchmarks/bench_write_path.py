@@ -0,0 +1,113 @@
+"""
+Escrita de páginas + links: save_page_with_links (uma transação por página,
+ORM) vs. save_pages_with_links (upsert em lote, COPY no PostgreSQL).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_write_path.py --pages 2000 --links-per-page 50
+    python benchmarks/bench_write_path.py --database-url postgresql+psycopg2://...
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.repositories.page import PageRepository
+from models.graph_objects import LinkBase, PageBase
+
+
+def make_pairs(num_pages, links_per_page, revision=0):
+    return [
+        (
+            PageBase(
+                page_id=i,
+                title=f"Página {i}",
+                url=f"https://pt.wikipedia.org/wiki/P%C3%A1gina_{i}",
+                length_chars=1000 + i,
+                num_editors=3,
+                num_revisions=1,
+                links_out_count=links_per_page,
+                lastrevid=10_000 + i + revision,
+            ),
+            [
+                LinkBase(
+                    source_page_id=i,
+                    target_page_id=((i * 7 + j * 13) % num_pages) + 1,
+                    anchor_text=f"link {j}",
+                )
+                for j in range(links_per_page)
+            ],
+        )
+        for i in range(1, num_pages + 1)
+    ]
+
+
+def per_page(repository, pairs):
+    for page, links in pairs:
+        repository.save_page_with_links(page, links)
+
+
+def batched(repository, pairs, batch_size):
+    repository.save_pages_with_links(pairs, batch_size=batch_size)
+
+
+def measure(engine, label, write, pairs):
+    """Mede a carga inicial (inserts) e a regravação das mesmas páginas (upserts)."""
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM links"))
+        connection.execute(text("DELETE FROM pages"))
+
+    rows = len(pairs) + sum(len(links) for _, links in pairs)
+    session = sessionmaker(bind=engine)()
+    try:
+        for phase in ("insert", "rewrite"):
+            repository = PageRepository(session)
+            start = time.perf_counter()
+            write(repository, pairs)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<28} {phase:<8} {elapsed:7.2f}s  {rows / elapsed:>10,.0f} linhas/s"
+            )
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--links-per-page", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--database-url", help="Banco de destino (padrão: SQLite temporário)"
+    )
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.pages, args.links_per_page)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        Base.metadata.create_all(engine)
+        print(
+            f"{engine.dialect.name}: {args.pages} páginas x "
+            f"{args.links_per_page} links"
+        )
+        measure(engine, "save_page_with_links", per_page, pairs)
+        measure(
+            engine,
+            f"save_pages_with_links({args.batch_size})",
+            lambda repository, pairs: batched(repository, pairs, args.batch_size),
+            pairs,
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
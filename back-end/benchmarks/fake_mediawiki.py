@@ -0,0 +1,231 @@
+"""
+Servidor MediaWiki falso, local, para benchmarks do scraper/crawler.
+
+Gera uma wiki sintética determinística (páginas "Página 1".."Página N", cada
+uma com `links_per_page` links) e responde ao subconjunto da API que o
+APIClient usa, com latência artificial por requisição.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from scraper.rate_limiter import RateLimiter
+
+FILLER = (
+    "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20 + "</p>"
+)
+# Limite de itens por resposta de listas (equivale a "max" para bots comuns)
+MAX_LIMIT = 500
+
+
+class FakeWiki:
+    def __init__(
+        self, num_pages: int = 500, links_per_page: int = 20, filler_blocks: int = 1
+    ):
+        self.num_pages = num_pages
+        self.filler_blocks = filler_blocks
+        self.titles = {i: f"Página {i}" for i in range(1, num_pages + 1)}
+        self.ids = {title: page_id for page_id, title in self.titles.items()}
+        self.links = {
+            i: [((i * 7 + j * 13) % num_pages) + 1 for j in range(links_per_page)]
+            for i in self.titles
+        }
+
+    def normalize(self, title: str) -> str:
+        title = title.replace("_", " ").strip()
+        return title[:1].upper() + title[1:]
+
+    def page_info(self, page_id: int) -> dict:
+        title = self.titles[page_id]
+        return {
+            "pageid": page_id,
+            "ns": 0,
+            "title": title,
+            "length": 1000 + page_id,
+            "lastrevid": 10_000 + page_id,
+            "touched": "2025-01-01T00:00:00Z",
+            "fullurl": f"https://pt.wikipedia.org/wiki/{quote(title.replace(' ', '_'))}",
+            "contributors": [{"userid": u, "name": f"U{u}"} for u in range(3)],
+            "revisions": [{"revid": 10_000 + page_id, "parentid": 0}],
+        }
+
+    def html(self, page_id: int) -> str:
+        parts = [FILLER] * self.filler_blocks
+        for target in self.links[page_id]:
+            title = self.titles[target]
+            href = quote(title.replace(" ", "_"))
+            parts.append(
+                f'<p>Ver <a href="/wiki/{href}" title="{title}">{title.lower()}</a>.</p>'
+            )
+        return "\n".join(parts)
+
+    def _page_ids(self, params: dict) -> list[int]:
+        return [int(raw) for raw in params["pageids"].split("|")]
+
+    def _limit(self, value: str | None) -> int:
+        return MAX_LIMIT if value in (None, "max") else int(value)
+
+    def links_query(self, params: dict) -> dict:
+        """prop=links: pares (fonte, alvo) paginados por plcontinue."""
+        pairs = [
+            (source, target)
+            for source in self._page_ids(params)
+            if source in self.titles
+            for target in self.links[source]
+        ]
+        offset = int(params.get("plcontinue", 0))
+        limit = self._limit(params.get("pllimit"))
+        pages = {}
+        for source, target in pairs[offset : offset + limit]:
+            page = pages.setdefault(
+                str(source),
+                {"pageid": source, "ns": 0, "title": self.titles[source]},
+            )
+            page.setdefault("links", []).append({"ns": 0, "title": self.titles[target]})
+        data = {"query": {"pages": pages}}
+        if offset + limit < len(pairs):
+            data["continue"] = {"plcontinue": str(offset + limit), "continue": "||"}
+        else:
+            data["batchcomplete"] = ""
+        return data
+
+    def generator_links_query(self, params: dict) -> dict:
+        """generator=links: páginas alvo (distintas) paginadas por gplcontinue."""
+        targets = list(
+            dict.fromkeys(
+                target
+                for source in self._page_ids(params)
+                if source in self.titles
+                for target in self.links[source]
+            )
+        )
+        offset = int(params.get("gplcontinue", 0))
+        limit = self._limit(params.get("gpllimit"))
+        pages = {
+            str(target): {"pageid": target, "ns": 0, "title": self.titles[target]}
+            for target in targets[offset : offset + limit]
+        }
+        data = {"query": {"pages": pages}}
+        if offset + limit < len(targets):
+            data["continue"] = {
+                "gplcontinue": str(offset + limit),
+                "continue": "gplcontinue||",
+            }
+        else:
+            data["batchcomplete"] = ""
+        return data
+
+    def query(self, params: dict) -> dict:
+        if params.get("generator") == "links":
+            return self.generator_links_query(params)
+        if params.get("prop") == "links":
+            return self.links_query(params)
+
+        query = {}
+        pages = {}
+        if "pageids" in params:
+            for raw in params["pageids"].split("|"):
+                page_id = int(raw)
+                if page_id in self.titles:
+                    pages[str(page_id)] = self.page_info(page_id)
+                else:
+                    pages[str(page_id)] = {"pageid": page_id, "missing": ""}
+        elif "titles" in params:
+            normalized = []
+            missing_key = -1
+            for raw in params["titles"].split("|"):
+                title = self.normalize(raw)
+                if title != raw:
+                    normalized.append({"from": raw, "to": title})
+                if title in self.ids:
+                    page_id = self.ids[title]
+                    pages[str(page_id)] = self.page_info(page_id)
+                else:
+                    pages[str(missing_key)] = {"ns": 0, "title": title, "missing": ""}
+                    missing_key -= 1
+            if normalized:
+                query["normalized"] = normalized
+        query["pages"] = pages
+        return {"batchcomplete": "", "query": query}
+
+    def parse(self, params: dict) -> dict:
+        if "oldid" in params:
+            page_id = int(params["oldid"]) - 10_000
+        else:
+            page_id = int(params["pageid"])
+        return {
+            "parse": {
+                "title": self.titles[page_id],
+                "pageid": page_id,
+                "text": {"*": self.html(page_id)},
+            }
+        }
+
+    def handle(self, params: dict) -> dict:
+        if params.get("action") == "parse":
+            return self.parse(params)
+        return self.query(params)
+
+
+def unthrottled_limiter() -> RateLimiter:
+    """Limitador sem teto, para medir o servidor falso sem o limite de produção."""
+    return RateLimiter(max_rate=1e9, burst=1e9)
+
+
+@contextmanager
+def serve(wiki: FakeWiki, latency: float = 0.05, max_rate: float | None = None):
+    """
+    Sobe o servidor em uma thread e devolve a URL do api.php. Com `max_rate`,
+    requisições acima dessa taxa (req/s) recebem 429 com Retry-After.
+    """
+    throttle = {"tokens": max_rate or 0.0, "last": time.monotonic()}
+    throttle_lock = threading.Lock()
+
+    def allowed() -> bool:
+        if max_rate is None:
+            return True
+        with throttle_lock:
+            now = time.monotonic()
+            throttle["tokens"] = min(
+                max_rate, throttle["tokens"] + (now - throttle["last"]) * max_rate
+            )
+            throttle["last"] = now
+            if throttle["tokens"] >= 1:
+                throttle["tokens"] -= 1
+                return True
+            return False
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            time.sleep(latency)
+            if allowed():
+                status, body = 200, json.dumps(wiki.handle(params)).encode()
+            else:
+                status, body = 429, b'{"error": {"code": "ratelimited"}}'
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/w/api.php"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,41 @@
+from models.graph_objects import PageBase, LinkBase
+
+
+class InMemoryPageRepository:
+    """Repositório em memória com a mesma interface usada pelo crawler."""
+
+    def __init__(self):
+        self.pages: dict[int, dict] = {}
+        self.links: dict[int, list[int]] = {}
+
+    async def get_page_by_id(self, page_id: int) -> dict | None:
+        return self.pages.get(page_id)
+
+    async def get_page_by_title(self, title: str) -> dict | None:
+        return next((p for p in self.pages.values() if p["title"] == title), None)
+
+    async def get_pages_by_titles(self, titles: list[str]) -> dict[str, int]:
+        by_title = {p["title"]: p["page_id"] for p in self.pages.values()}
+        return {title: by_title[title] for title in titles if title in by_title}
+
+    async def get_neighbors_with_titles(
+        self, page_ids: list[int], limit: int
+    ) -> list[tuple[int, str | None]]:
+        neighbors = {}
+        for page_id in page_ids:
+            for target_id in self.links.get(page_id, [])[:limit]:
+                page = self.pages.get(target_id)
+                neighbors.setdefault(target_id, page["title"] if page else None)
+        return list(neighbors.items())
+
+    async def save_page_with_links(
+        self, page_data: PageBase, links: list[LinkBase]
+    ) -> None:
+        self.pages[page_data.page_id] = page_data.model_dump()
+        self.links[page_data.page_id] = [link.target_page_id for link in links]
+
+    async def save_pages_with_links(
+        self, pairs: list[tuple[PageBase, list[LinkBase]]]
+    ) -> None:
+        for page_data, links in pairs:
+            await self.save_page_with_links(page_data, links)
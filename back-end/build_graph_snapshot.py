@@ -0,0 +1,50 @@
+import argparse
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from db.session import SessionLocal
+from db.repositories.page import PageRepository
+from services.graph_store import get_graph_store
+
+
+def main():
+    """
+    Grava o snapshot do grafo em CSR (GRAPH_SNAPSHOT_PATH) a partir do
+    banco, ou o atualiza só com as páginas alteradas (--refresh). Os
+    workers da API mapeiam o arquivo em vez de ler `links` inteira.
+    """
+    parser = argparse.ArgumentParser(description="Snapshot do grafo em CSR")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Atualiza o snapshot existente em vez de reconstruí-lo",
+    )
+    args = parser.parse_args()
+
+    store = get_graph_store()
+    if not args.refresh and os.path.exists(store.snapshot_path):
+        os.remove(store.snapshot_path)
+
+    session = SessionLocal()
+    try:
+        repository = PageRepository(session)
+        start = time.perf_counter()
+        graph = store.get(repository)
+        if args.refresh:
+            changed = store.refresh(repository)
+            graph = store.graph
+            print(f"{changed} pages changed since the last snapshot")
+        print(
+            f"Graph snapshot written to {store.snapshot_path} in "
+            f"{time.perf_counter() - start:.1f}s: {graph.num_nodes} nodes, "
+            f"{graph.num_edges} edges, {graph.nbytes / 2**20:.1f} MB"
+        )
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,62 @@ WIKI_API = "https://pt.wikipedia.org/w/api.php"
 WIKI_BASE_URL = "https://pt.wikipedia.org/wiki/"
 USER_AGENT = "WikiGraphBot/1.0 (email@example.com)"
 DATABASE_URL = "sqlite:///./wiki_graph.db"
+
+# Crawler
+CRAWLER_MAX_CONCURRENCY = 8  # requisições simultâneas por nível do BFS
+
+# Scraper: "html" (action=parse, preserva anchor text) ou "links" (prop=links, sem HTML)
+SCRAPER_MODE = "html"
+
+# Cache em disco das respostas da API (scraper/cache.py)
+API_CACHE_ENABLED = True
+API_CACHE_PATH = "./.cache/api_cache.sqlite3"
+API_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# TTL em segundos por action; parse com oldid (revisão fixa) nunca expira
+API_CACHE_TTLS = {"query": 60 * 60, "parse": 24 * 60 * 60}
+
+# Resolução de títulos: entradas do LRU em memória (scraper/title_resolver.py)
+TITLE_CACHE_SIZE = 100_000
+# Segundos até um título inexistente (link vermelho) voltar a ser consultado
+TITLE_MISSING_TTL = 60 * 60
+
+# Textos âncora internados: entradas do LRU em memória (db/repositories/anchor_text.py)
+ANCHOR_CACHE_SIZE = 200_000
+
+# Limitador de taxa compartilhado (scraper/rate_limiter.py)
+API_MAX_RATE = 20.0  # requisições/s no melhor caso
+API_MIN_RATE = 0.5  # piso após sucessivos 429/503
+API_BURST = 10
+API_MAXLAG = 5  # segundos de lag de replicação tolerados (parâmetro maxlag)
+API_MAX_RETRIES = 5
+API_BACKOFF_BASE = 0.5
+API_BACKOFF_CAP = 30.0
+
+# Fronteira persistente do run_scraper.py (services/frontier.py)
+CRAWL_CHECKPOINT_EVERY = 50  # páginas processadas entre checkpoints
+
+# Páginas por transação no caminho de escrita em lote (PageRepository)
+DB_WRITE_BATCH_SIZE = 500
+
+# Pool de conexões do PostgreSQL, por engine (db/engine.py)
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 10
+DB_POOL_TIMEOUT = 10  # segundos esperando uma conexão livre
+DB_POOL_RECYCLE = 30 * 60
+
+# Linhas por lote nas leituras em streaming (cursor no servidor, yield_per)
+DB_YIELD_PER = 5_000
+
+# Snapshot do grafo em CSR, mapeado em memória (services/graph_store.py)
+GRAPH_SNAPSHOT_PATH = "./.cache/graph.csr"
+# Segundos entre verificações de links alterados no banco (GraphStore.refresh_interval)
+GRAPH_REFRESH_INTERVAL = 5.0
+
+# PageRank personalizado por push local (services/ppr.py)
+PPR_ALPHA = 0.15  # probabilidade de voltar à semente a cada passo
+PPR_EPSILON = 1e-4  # limiar de resíduo por unidade de grau
+PPR_MAX_PUSHES = 1_000_000
+PPR_MAX_SCRAPE = 100  # vizinhos ausentes baixados no modo scrape
+
+# Processos do PageRank paralelo (services/pagerank_parallel.py)
+PAGERANK_WORKERS = 4
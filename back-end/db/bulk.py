@@ -0,0 +1,71 @@
+import io
+import json
+from itertools import islice
+from typing import Iterable
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
+
+# Linhas enviadas por COPY / executemany
+BATCH_SIZE = 10_000
+
+
+def _copy_value(value) -> str:
+    """Formata um valor no formato texto do COPY do PostgreSQL."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _batches(rows: Iterable[tuple], batch_size: int):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def bulk_insert(
+    connection: Connection,
+    table: Table,
+    columns: list[str],
+    rows: Iterable[tuple],
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Insere `rows` (tuplas na ordem de `columns`) em lotes, sem carregar tudo
+    em memória. No PostgreSQL (psycopg2) usa COPY FROM STDIN; nos outros
+    bancos, um INSERT com executemany por lote. Retorna o número de linhas.
+    """
+    total = 0
+    if connection.dialect.driver == "psycopg2":
+        raw = connection.connection.driver_connection
+        statement = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+        with raw.cursor() as cursor:
+            for batch in _batches(rows, batch_size):
+                buffer = io.StringIO()
+                for row in batch:
+                    buffer.write("\t".join(_copy_value(v) for v in row))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+                total += len(batch)
+        return total
+
+    insert = table.insert()
+    for batch in _batches(rows, batch_size):
+        connection.execute(insert, [dict(zip(columns, row)) for row in batch])
+        total += len(batch)
+    return total
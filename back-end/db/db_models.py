@@ -1,18 +1,50 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    ForeignKey,
+    Float,
+    DateTime,
+    Index,
+    JSON,
+)
 from db.base import Base
 
 
 class Link(Base):
+    """Aresta única (fonte, alvo); links repetidos viram `multiplicity`."""
+
     __tablename__ = "links"
+    # A PK cobre as buscas por fonte; este índice cobre os links de entrada
+    __table_args__ = (
+        Index("ix_links_target_source", "target_page_id", "source_page_id"),
+    )
+
+    source_page_id = Column(Integer, primary_key=True)
+    target_page_id = Column(Integer, primary_key=True)
+    # Ids (anchor_texts.id) dos textos âncora distintos, em ordem de
+    # ocorrência (NULL quando não conhecidos: modo links, dumps)
+    anchor_ids = Column(JSON(none_as_null=True), nullable=True)
+    multiplicity = Column(Integer, nullable=False, default=1)
+
+
+class AnchorText(Base):
+    """Texto âncora internado: cada texto distinto aparece uma vez."""
+
+    __tablename__ = "anchor_texts"
+    __table_args__ = (Index("ix_anchor_texts_text", "text", unique=True),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    source_page_id = Column(Integer, nullable=False)
-    target_page_id = Column(Integer, nullable=False)
-    anchor_text = Column(String, nullable=True)
+    text = Column(String, nullable=False)
 
 
 class Page(Base):
     __tablename__ = "pages"
+    __table_args__ = (
+        Index("ix_pages_title", "title", unique=True),
+        Index("ix_pages_links_in_count", "links_in_count"),
+    )
 
     page_id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
@@ -21,5 +53,64 @@ class Page(Base):
     num_editors = Column(Integer)
     num_revisions = Column(Integer)
     links_out_count = Column(Integer)
+    # Mantido pelo PageRepository a cada gravação de links (ver
+    # rebuild_links_in_count.py para recalcular do zero)
     links_in_count = Column(Integer)
     pagerank_score = Column(Float, default=0.0)
+    # Revisão e "touched" da Wikipedia no último scraping (re-crawl incremental)
+    lastrevid = Column(BigInteger, nullable=True)
+    touched = Column(DateTime(timezone=True), nullable=True)
+    # Valor aleatório trocado a cada regravação dos links da página; o
+    # services.graph_store compara com o do snapshot para achar as alteradas
+    links_version = Column(BigInteger, nullable=True)
+
+
+class TitleAlias(Base):
+    """Título de link já resolvido pela API (normalização/redirect → page_id)."""
+
+    __tablename__ = "title_aliases"
+
+    title = Column(String, primary_key=True)
+    # NULL quando a API informou que a página não existe (redlink)
+    page_id = Column(Integer, nullable=True)
+    resolved_title = Column(String, nullable=True)
+
+
+class CrawlRun(Base):
+    """Execução do BFS do run_scraper.py, com o último checkpoint salvo."""
+
+    __tablename__ = "crawl_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    seed_title = Column(String, nullable=False)
+    max_depth = Column(Integer, nullable=False)
+    max_neighbors = Column(Integer, nullable=False)
+    status = Column(String, nullable=False, default="running")
+    # crawl_frontier.id da última entrada já processada
+    last_frontier_id = Column(BigInteger, nullable=False, default=0)
+    enqueued = Column(Integer, nullable=False, default=0)
+    dequeued = Column(Integer, nullable=False, default=0)
+    pages_done = Column(Integer, nullable=False, default=0)
+    # Tempo efetivo de crawl (sem as pausas entre execuções)
+    elapsed_seconds = Column(Float, nullable=False, default=0.0)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class CrawlFrontierEntry(Base):
+    """Fila do BFS: só recebe inserts, o consumo avança last_frontier_id."""
+
+    __tablename__ = "crawl_frontier"
+    __table_args__ = (Index("ix_crawl_frontier_run_id_id", "run_id", "id"),)
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    run_id = Column(Integer, ForeignKey("crawl_runs.id"), nullable=False)
+    title = Column(String, nullable=False)
+    depth = Column(Integer, nullable=False)
+
+
+class CrawlVisited(Base):
+    __tablename__ = "crawl_visited"
+
+    run_id = Column(Integer, ForeignKey("crawl_runs.id"), primary_key=True)
+    title = Column(String, primary_key=True)
@@ -1,8 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
 from urllib.parse import quote
 from dotenv import load_dotenv
 import os
 
+from config import settings
+
 load_dotenv()
 
 USER = os.getenv("POSTGRES_USER", "")
@@ -14,13 +17,76 @@ import logging
 
 logging.info(f"USER: {USER}")
 
-if not all([USER, PASSWORD, HOST, PORT, DATABASE]):
-    raise ValueError(
-        "Database environment variables are missing. "
-        "Please set: POSTGRES_USER, POSTGRES_KEY, POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DATABASE"
-    )
 
-DATABASE_URL = (
-    f"postgresql+psycopg2://{USER}:{quote(PASSWORD)}@{HOST}:{PORT}/{DATABASE}"
-)
-engine = create_engine(DATABASE_URL, future=True, echo=False)
+def get_database_url() -> str:
+    """
+    URL do banco, em ordem de prioridade: DATABASE_URL do ambiente, as
+    variáveis POSTGRES_* ou, sem nenhuma delas, o SQLite local de
+    config/settings.py (modo embarcado, sem servidor).
+    """
+    if os.getenv("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if all([USER, PASSWORD, HOST, PORT, DATABASE]):
+        return (
+            f"postgresql+psycopg2://{USER}:{quote(PASSWORD)}@{HOST}:{PORT}/{DATABASE}"
+        )
+    return settings.DATABASE_URL
+
+
+def get_async_database_url(url: str) -> str:
+    """Mesma URL com o driver assíncrono (asyncpg / aiosqlite)."""
+    driver, rest = url.split("://", 1)
+    if driver.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    if driver.startswith("postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
+def _pool_options() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL: leituras não bloqueiam a escrita do crawler
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def make_engine(url: str, **kwargs):
+    """Cria o engine; no SQLite liga o WAL e libera o uso entre threads."""
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            future=True,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            **kwargs,
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+    return create_engine(url, future=True, echo=False, **{**_pool_options(), **kwargs})
+
+
+def make_async_engine(url: str, **kwargs):
+    """Versão assíncrona de make_engine, usada pela API (AsyncSession)."""
+    if url.startswith("sqlite"):
+        engine = create_async_engine(url, echo=False, **kwargs)
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return engine
+    return create_async_engine(url, echo=False, **{**_pool_options(), **kwargs})
+
+
+DATABASE_URL = get_database_url()
+if DATABASE_URL == settings.DATABASE_URL:
+    logging.info(f"Postgres não configurado; usando {DATABASE_URL}")
+engine = make_engine(DATABASE_URL)
+async_engine = make_async_engine(get_async_database_url(DATABASE_URL))
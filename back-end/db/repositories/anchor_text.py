@@ -0,0 +1,129 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Iterable
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from config.settings import ANCHOR_CACHE_SIZE
+
+# Limite de parâmetros por consulta IN
+CHUNK_SIZE = 1000
+
+
+class AnchorTextCache:
+    """LRU thread-safe em memória de texto âncora ↔ id de anchor_texts."""
+
+    def __init__(self, max_size: int = ANCHOR_CACHE_SIZE):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._texts = {}
+        self._lock = threading.Lock()
+
+    def get_ids(self, texts: Iterable[str]) -> dict[str, int]:
+        found = {}
+        with self._lock:
+            for anchor in texts:
+                if anchor in self._ids:
+                    self._ids.move_to_end(anchor)
+                    found[anchor] = self._ids[anchor]
+        return found
+
+    def get_texts(self, anchor_ids: Iterable[int]) -> dict[int, str]:
+        with self._lock:
+            return {i: self._texts[i] for i in anchor_ids if i in self._texts}
+
+    def put_many(self, ids: dict[str, int]) -> None:
+        with self._lock:
+            for anchor, anchor_id in ids.items():
+                self._ids[anchor] = anchor_id
+                self._ids.move_to_end(anchor)
+                self._texts[anchor_id] = anchor
+            while len(self._ids) > self.max_size:
+                _, anchor_id = self._ids.popitem(last=False)
+                self._texts.pop(anchor_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._texts.clear()
+
+    def __len__(self):
+        return len(self._ids)
+
+
+_shared_caches = weakref.WeakKeyDictionary()
+_shared_lock = threading.Lock()
+
+
+def get_shared_anchor_cache(bind) -> AnchorTextCache:
+    """
+    LRU compartilhado pelos repositórios do processo que usam o mesmo banco
+    (Engine): ids de um banco não valem em outro.
+    """
+    with _shared_lock:
+        cache = _shared_caches.get(bind)
+        if cache is None:
+            cache = _shared_caches[bind] = AnchorTextCache()
+        return cache
+
+
+class AnchorTextRepository:
+    """
+    Dicionário de textos âncora (tabela anchor_texts): cada texto distinto
+    é gravado uma vez e os links guardam só os ids.
+
+    Usa a Session do chamador, para que os textos novos entrem na mesma
+    transação dos links. Por isso get_ids não coloca ids recém-criados no
+    cache: quem grava chama remember() depois do commit, e um rollback não
+    deixa no cache um id que pode ser reaproveitado por outro texto.
+    """
+
+    def __init__(self, db_session: Session, cache: AnchorTextCache | None = None):
+        self.db_session = db_session
+        if cache is None:
+            cache = get_shared_anchor_cache(db_session.get_bind())
+        self.cache = cache
+
+    def get_ids(self, texts: Iterable[str]) -> dict[str, int]:
+        """Retorna {texto: id}, inserindo os textos que ainda não existem."""
+        texts = set(texts)
+        found = self.cache.get_ids(texts)
+        missing = [anchor for anchor in texts if anchor not in found]
+        if not missing:
+            return found
+
+        insert = text(
+            "INSERT INTO anchor_texts (text) VALUES (:text) "
+            "ON CONFLICT (text) DO NOTHING"
+        )
+        select = text(
+            "SELECT text, id FROM anchor_texts WHERE text IN :texts"
+        ).bindparams(bindparam("texts", expanding=True))
+        for i in range(0, len(missing), CHUNK_SIZE):
+            chunk = missing[i : i + CHUNK_SIZE]
+            self.db_session.execute(insert, [{"text": anchor} for anchor in chunk])
+            found.update(self.db_session.execute(select, {"texts": chunk}).all())
+        return found
+
+    def get_texts(self, anchor_ids: Iterable[int]) -> dict[int, str]:
+        """Retorna {id: texto} dos ids informados."""
+        anchor_ids = set(anchor_ids)
+        found = self.cache.get_texts(anchor_ids)
+        missing = [anchor_id for anchor_id in anchor_ids if anchor_id not in found]
+
+        query = text("SELECT text, id FROM anchor_texts WHERE id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        loaded = {}
+        for i in range(0, len(missing), CHUNK_SIZE):
+            chunk = missing[i : i + CHUNK_SIZE]
+            loaded.update(self.db_session.execute(query, {"ids": chunk}).all())
+        self.cache.put_many(loaded)
+        found.update((anchor_id, anchor) for anchor, anchor_id in loaded.items())
+        return found
+
+    def remember(self, ids: dict[str, int]) -> None:
+        """Guarda no cache ids já confirmados no banco."""
+        self.cache.put_many(ids)
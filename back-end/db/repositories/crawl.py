@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, text
+
+from db.db_models import CrawlFrontierEntry, CrawlRun, CrawlVisited
+
+
+class CrawlRepository:
+    """
+    Estado persistente do BFS do run_scraper.py: execuções (crawl_runs),
+    fila (crawl_frontier) e títulos visitados (crawl_visited).
+
+    Recebe uma fábrica de sessões: os checkpoints abrem a própria sessão e
+    transação, independentes da Session usada para gravar as páginas.
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def create_run(self, seed_title: str, max_depth: int, max_neighbors: int) -> int:
+        now = datetime.now(timezone.utc)
+        with self.session_factory() as session:
+            run = CrawlRun(
+                seed_title=seed_title,
+                max_depth=max_depth,
+                max_neighbors=max_neighbors,
+                status="running",
+                last_frontier_id=0,
+                enqueued=0,
+                dequeued=0,
+                pages_done=0,
+                elapsed_seconds=0.0,
+                started_at=now,
+                updated_at=now,
+            )
+            session.add(run)
+            session.commit()
+            return run.id
+
+    def get_run(self, run_id: int) -> dict | None:
+        with self.session_factory() as session:
+            row = session.execute(
+                text("SELECT * FROM crawl_runs WHERE id = :run_id"),
+                {"run_id": run_id},
+            )
+            found = row.mappings().first()
+            return dict(found) if found else None
+
+    def get_latest_run(self, status: str | None = None) -> dict | None:
+        query = "SELECT * FROM crawl_runs"
+        if status is not None:
+            query += " WHERE status = :status"
+        query += " ORDER BY id DESC LIMIT 1"
+        with self.session_factory() as session:
+            found = session.execute(text(query), {"status": status}).mappings().first()
+            return dict(found) if found else None
+
+    def list_runs(self, limit: int = 10) -> list[dict]:
+        with self.session_factory() as session:
+            rows = session.execute(
+                text("SELECT * FROM crawl_runs ORDER BY id DESC LIMIT :limit"),
+                {"limit": limit},
+            )
+            return [dict(row) for row in rows.mappings()]
+
+    def load_visited(self, run_id: int) -> set[str]:
+        with self.session_factory() as session:
+            rows = session.execute(
+                text("SELECT title FROM crawl_visited WHERE run_id = :run_id"),
+                {"run_id": run_id},
+            )
+            return {row[0] for row in rows}
+
+    def read_frontier(
+        self, run_id: int, after_id: int, limit: int
+    ) -> list[tuple[int, str, int]]:
+        """Próximas entradas da fila (id, title, depth) depois de `after_id`."""
+        query = text(
+            "SELECT id, title, depth FROM crawl_frontier "
+            "WHERE run_id = :run_id AND id > :after_id ORDER BY id LIMIT :limit"
+        )
+        with self.session_factory() as session:
+            rows = session.execute(
+                query, {"run_id": run_id, "after_id": after_id, "limit": limit}
+            )
+            return [tuple(row) for row in rows]
+
+    def checkpoint(
+        self,
+        run_id: int,
+        last_frontier_id: int,
+        pending: list[tuple[str, int]],
+        visited: list[str],
+        dequeued: int,
+        pages_done: int,
+        elapsed_seconds: float,
+    ) -> None:
+        """
+        Grava, em uma única transação, as entradas novas da fila, os títulos
+        visitados desde o último checkpoint e a posição de consumo da fila.
+        """
+        with self.session_factory() as session:
+            if pending:
+                session.execute(
+                    insert(CrawlFrontierEntry),
+                    [
+                        {"run_id": run_id, "title": title, "depth": depth}
+                        for title, depth in pending
+                    ],
+                )
+            if visited:
+                session.execute(
+                    insert(CrawlVisited),
+                    [{"run_id": run_id, "title": title} for title in visited],
+                )
+            session.execute(
+                text(
+                    "UPDATE crawl_runs SET last_frontier_id = :last_frontier_id, "
+                    "enqueued = enqueued + :pending, dequeued = :dequeued, "
+                    "pages_done = :pages_done, elapsed_seconds = :elapsed_seconds, "
+                    "updated_at = :updated_at WHERE id = :run_id"
+                ),
+                {
+                    "run_id": run_id,
+                    "last_frontier_id": last_frontier_id,
+                    "pending": len(pending),
+                    "dequeued": dequeued,
+                    "pages_done": pages_done,
+                    "elapsed_seconds": elapsed_seconds,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
+            session.commit()
+
+    def finish_run(self, run_id: int, status: str = "done") -> None:
+        with self.session_factory() as session:
+            session.execute(
+                text(
+                    "UPDATE crawl_runs SET status = :status, updated_at = :updated_at "
+                    "WHERE id = :run_id"
+                ),
+                {
+                    "run_id": run_id,
+                    "status": status,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
+            session.commit()
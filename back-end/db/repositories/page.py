@@ -1,14 +1,92 @@
+import asyncio
+import random
+from collections import Counter
+from typing import Callable, Iterator
+
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import JSON, bindparam, text
 from fastapi import Depends
-from db.session import get_db
-from db.db_models import Page, Link
+from config.settings import DB_WRITE_BATCH_SIZE, DB_YIELD_PER
+from db.bulk import bulk_insert
+from db.repositories.anchor_text import AnchorTextRepository
+from db.session import SessionLocal, get_db, get_async_db
+from db.db_models import Link
 from models.graph_objects import PageBase, LinkBase
 
+PAGE_FIELDS = [
+    "page_id",
+    "title",
+    "url",
+    "length_chars",
+    "num_editors",
+    "num_revisions",
+    "links_out_count",
+    "lastrevid",
+    "touched",
+]
+LINK_COLUMNS = ["source_page_id", "target_page_id", "anchor_ids", "multiplicity"]
+# Limite de parâmetros por consulta IN
+CHUNK_SIZE = 1000
+
+
+def new_links_version() -> int:
+    """
+    Novo valor de pages.links_version (nunca 0, que marca versão
+    desconhecida). Aleatório, e não um contador, para que escritores em
+    processos diferentes não precisem se coordenar.
+    """
+    return random.randrange(1, 2**63)
+
+
+def aggregate_links(links: list[LinkBase]) -> list[tuple]:
+    """
+    Agrupa os links por (fonte, alvo) no formato da tabela `links`:
+    (source, target, textos âncora distintos ou None, multiplicidade).
+    """
+    grouped = {}
+    for link in links:
+        key = (link.source_page_id, link.target_page_id)
+        anchors, count = grouped.get(key, ([], 0))
+        if link.anchor_text is not None and link.anchor_text not in anchors:
+            anchors.append(link.anchor_text)
+        grouped[key] = (anchors, count + 1)
+    return [
+        (source, target, anchors or None, count)
+        for (source, target), (anchors, count) in grouped.items()
+    ]
+
 
 class PageRepository:
     def __init__(self, db_session: Session):
         self.db_session = db_session
+        self.anchors = AnchorTextRepository(db_session)
+
+    def _intern_anchors(self, rows: list[tuple]) -> tuple[list[tuple], dict[str, int]]:
+        """
+        Troca os textos âncora das linhas de aggregate_links pelos ids da
+        tabela anchor_texts. Retorna as linhas e o mapa {texto: id}, que vai
+        para o cache depois do commit (AnchorTextRepository.remember).
+        """
+        ids = self.anchors.get_ids(
+            anchor for _, _, anchors, _ in rows for anchor in anchors or ()
+        )
+        rows = [
+            (source, target, [ids[a] for a in anchors] if anchors else None, count)
+            for source, target, anchors, count in rows
+        ]
+        return rows, ids
+
+    def _resolve_anchors(self, links: list[dict]) -> None:
+        """Troca anchor_ids por anchor_texts nos dicts de links."""
+        texts = self.anchors.get_texts(
+            anchor_id for link in links for anchor_id in link["anchor_ids"] or ()
+        )
+        for link in links:
+            anchor_ids = link.pop("anchor_ids")
+            link["anchor_texts"] = (
+                [texts[i] for i in anchor_ids if i in texts] if anchor_ids else None
+            )
 
     def get_page_by_id(self, page_id: int) -> dict | None:
         query = text("SELECT * FROM pages WHERE page_id = :page_id")
@@ -20,73 +98,642 @@ class PageRepository:
         result = self.db_session.execute(query, {"title": title})
         return result.mappings().first()
 
+    def get_pages_by_titles(self, titles: list[str]) -> dict[str, int]:
+        """Retorna {title: page_id} dos títulos que já estão em `pages`."""
+        query = text(
+            "SELECT title, page_id FROM pages WHERE title IN :titles"
+        ).bindparams(bindparam("titles", expanding=True))
+        found = {}
+        for i in range(0, len(titles), CHUNK_SIZE):
+            chunk = titles[i : i + CHUNK_SIZE]
+            for row in self.db_session.execute(query, {"titles": chunk}):
+                found[row.title] = row.page_id
+        return found
+
+    def get_titles_by_ids(self, page_ids: list[int]) -> dict[int, str]:
+        """Retorna {page_id: title} dos page_ids que já estão em `pages`."""
+        query = text(
+            "SELECT page_id, title FROM pages WHERE page_id IN :page_ids"
+        ).bindparams(bindparam("page_ids", expanding=True))
+        found = {}
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            for row in self.db_session.execute(query, {"page_ids": chunk}):
+                found[row.page_id] = row.title
+        return found
+
+    def get_pagerank_scores(self, page_ids: list[int]) -> dict[int, float]:
+        """Retorna {page_id: pagerank_score} das páginas com score salvo."""
+        query = text(
+            "SELECT page_id, pagerank_score FROM pages "
+            "WHERE page_id IN :page_ids AND pagerank_score IS NOT NULL"
+        ).bindparams(bindparam("page_ids", expanding=True))
+        found = {}
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            found.update(self.db_session.execute(query, {"page_ids": chunk}).all())
+        return found
+
+    def get_neighbors_with_titles(
+        self, page_ids: list[int], limit: int
+    ) -> list[tuple[int, str | None]]:
+        """
+        Expande uma fronteira inteira de uma vez: até `limit` alvos por página
+        fonte (links JOIN pages), sem repetição, na ordem das fontes. O título
+        vem None para alvos que ainda não estão em `pages`.
+        """
+        query = text(
+            "SELECT l.source_page_id, l.target_page_id, p.title FROM ("
+            " SELECT source_page_id, target_page_id, ROW_NUMBER() OVER ("
+            "  PARTITION BY source_page_id ORDER BY target_page_id) AS rn"
+            " FROM links WHERE source_page_id IN :page_ids) l "
+            "LEFT JOIN pages p ON p.page_id = l.target_page_id "
+            "WHERE l.rn <= :limit ORDER BY l.source_page_id, l.rn"
+        ).bindparams(bindparam("page_ids", expanding=True))
+
+        by_source = {}
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            rows = self.db_session.execute(query, {"page_ids": chunk, "limit": limit})
+            for source, target, title in rows:
+                by_source.setdefault(source, []).append((target, title))
+
+        neighbors = {}
+        for page_id in page_ids:
+            for target, title in by_source.get(page_id, []):
+                neighbors.setdefault(target, title)
+        return list(neighbors.items())
+
+    def get_neighborhood(
+        self, seed_title: str, max_depth: int, max_neighbors: int
+    ) -> tuple[list[dict], list[tuple[int, int]]]:
+        """
+        Vizinhança de até `max_depth` saltos da semente e os links entre os
+        nós, em uma consulta (WITH RECURSIVE). Segue a semântica do BFS do
+        AsyncBFSCrawler: até `max_neighbors` alvos por página (por
+        target_page_id) e páginas de ano ignoradas.
+
+        Retorna ([{page_id, depth, title}], [(source, target)]). Alvos que
+        ainda não estão em `pages` vêm com title None (fronteira a baixar).
+        A lista de nós vem vazia se a semente não está no banco.
+        """
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            # LATERAL ... LIMIT usa a chave (source_page_id, target_page_id)
+            neighbors = (
+                "CROSS JOIN LATERAL (SELECT target_page_id FROM links"
+                " WHERE source_page_id = r.page_id"
+                " ORDER BY target_page_id LIMIT :max_neighbors) l"
+            )
+            is_year = "{0} ~ '^\\s*[0-9]{{4}}\\s*$'"
+        else:
+            neighbors = (
+                "JOIN links l ON l.source_page_id = r.page_id"
+                " AND l.target_page_id IN (SELECT target_page_id FROM links"
+                " WHERE source_page_id = r.page_id"
+                " ORDER BY target_page_id LIMIT :max_neighbors)"
+            )
+            is_year = "TRIM({0}) GLOB '[0-9][0-9][0-9][0-9]'"
+
+        query = text(
+            "WITH RECURSIVE reach(page_id, depth) AS ("
+            " SELECT page_id, 0 FROM pages"
+            f" WHERE title = :seed_title AND NOT {is_year.format('title')}"
+            " UNION"
+            f" SELECT l.target_page_id, r.depth + 1 FROM reach r {neighbors}"
+            " LEFT JOIN pages p ON p.page_id = l.target_page_id"
+            " WHERE r.depth < :max_depth"
+            f" AND (p.title IS NULL OR NOT {is_year.format('p.title')})"
+            "), nodes AS ("
+            " SELECT page_id, MIN(depth) AS depth FROM reach GROUP BY page_id) "
+            "SELECT n.page_id, n.depth, p.title, NULL AS target_page_id"
+            " FROM nodes n LEFT JOIN pages p ON p.page_id = n.page_id "
+            "UNION ALL "
+            "SELECT l.source_page_id, NULL, NULL, l.target_page_id FROM links l"
+            " JOIN nodes s ON s.page_id = l.source_page_id"
+            " JOIN nodes t ON t.page_id = l.target_page_id"
+        ).execution_options(yield_per=DB_YIELD_PER)
+        result = self.db_session.execute(
+            query,
+            {
+                "seed_title": seed_title,
+                "max_depth": max_depth,
+                "max_neighbors": max_neighbors,
+            },
+        )
+
+        pages, links = [], []
+        for page_id, depth, title, target_page_id in result:
+            if target_page_id is None:
+                pages.append({"page_id": page_id, "depth": depth, "title": title})
+            else:
+                links.append((page_id, target_page_id))
+        pages.sort(key=lambda page: (page["depth"], page["page_id"]))
+        return pages, links
+
     def get_subgraph(self, page_ids: list[int]) -> tuple[list[dict], list[dict]]:
         """Retorna todas as páginas e links de um conjunto de page_ids."""
         if not page_ids:
             return [], []
-        
-        # Buscar páginas
-        pages_query = text("SELECT * FROM pages WHERE page_id = ANY(:page_ids)")
-        pages_result = self.db_session.execute(pages_query, {"page_ids": page_ids})
-        pages = [dict(row) for row in pages_result.mappings()]
-        
-        # Buscar links entre essas páginas
-        links_query = text(
-            "SELECT * FROM links WHERE source_page_id = ANY(:page_ids) AND target_page_id = ANY(:page_ids)"
-        )
-        links_result = self.db_session.execute(links_query, {"page_ids": page_ids})
-        links = [dict(row) for row in links_result.mappings()]
-        
+
+        # IN em blocos (portável; ANY(:array) só existe no PostgreSQL)
+        pages_query = text("SELECT * FROM pages WHERE page_id IN :page_ids").bindparams(
+            bindparam("page_ids", expanding=True)
+        )
+        links_query = (
+            text("SELECT * FROM links WHERE source_page_id IN :page_ids")
+            .bindparams(bindparam("page_ids", expanding=True))
+            .columns(anchor_ids=JSON)
+        )
+
+        id_set = set(page_ids)
+        pages, links = [], []
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            pages_result = self.db_session.execute(pages_query, {"page_ids": chunk})
+            pages.extend(dict(row) for row in pages_result.mappings())
+
+            # Buscar links entre essas páginas
+            links_result = self.db_session.execute(links_query, {"page_ids": chunk})
+            links.extend(
+                dict(row)
+                for row in links_result.mappings()
+                if row["target_page_id"] in id_set
+            )
+
+        self._resolve_anchors(links)
         return pages, links
 
-    def save_page(self, page_data: PageBase) -> None:
-        """Salva ou atualiza uma página no banco de dados."""
-        existing_page = (
-            self.db_session.query(Page).filter_by(page_id=page_data.page_id).first()
+    def iter_subgraph_pages(
+        self, page_ids: list[int], yield_per: int = DB_YIELD_PER
+    ) -> Iterator[tuple[int, str]]:
+        """
+        (page_id, title) das páginas do conjunto, lidas em streaming: cursor
+        no servidor (PostgreSQL), `yield_per` linhas por vez.
+        """
+        query = (
+            text("SELECT page_id, title FROM pages WHERE page_id IN :page_ids")
+            .bindparams(bindparam("page_ids", expanding=True))
+            .execution_options(yield_per=yield_per)
         )
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            yield from self.db_session.execute(query, {"page_ids": chunk})
 
-        if existing_page:
-            existing_page.title = page_data.title
-            existing_page.url = page_data.url
-            existing_page.length_chars = page_data.length_chars
-            existing_page.num_editors = page_data.num_editors
-            existing_page.num_revisions = page_data.num_revisions
-            existing_page.links_out_count = page_data.links_out_count
-        else:
-            new_page = Page(
-                page_id=page_data.page_id,
-                title=page_data.title,
-                url=page_data.url,
-                length_chars=page_data.length_chars,
-                num_editors=page_data.num_editors,
-                num_revisions=page_data.num_revisions,
-                links_out_count=page_data.links_out_count,
-                links_in_count=0,
-                pagerank_score=0.0,
+    def iter_subgraph_links(
+        self, page_ids: list[int], yield_per: int = DB_YIELD_PER
+    ) -> Iterator[tuple[int, int]]:
+        """(source, target) dos links entre as páginas do conjunto, em streaming."""
+        query = (
+            text(
+                "SELECT source_page_id, target_page_id FROM links "
+                "WHERE source_page_id IN :page_ids"
             )
-            self.db_session.add(new_page)
+            .bindparams(bindparam("page_ids", expanding=True))
+            .execution_options(yield_per=yield_per)
+        )
+        id_set = set(page_ids)
+        for i in range(0, len(page_ids), CHUNK_SIZE):
+            chunk = page_ids[i : i + CHUNK_SIZE]
+            for source, target in self.db_session.execute(query, {"page_ids": chunk}):
+                if target in id_set:
+                    yield source, target
 
-    def delete_links_by_source(self, source_page_id: int) -> None:
-        """Remove todos os links de uma página fonte."""
-        self.db_session.query(Link).filter_by(source_page_id=source_page_id).delete()
+    def iter_links(
+        self, source_page_ids: list[int] | None = None, yield_per: int = DB_YIELD_PER
+    ) -> Iterator[tuple[int, int]]:
+        """
+        (source, target) de todos os links, ou só dos de `source_page_ids`,
+        em streaming. Usado pelo services.graph_store para montar o CSR.
+        """
+        if source_page_ids is None:
+            query = text(
+                "SELECT source_page_id, target_page_id FROM links"
+            ).execution_options(yield_per=yield_per)
+            yield from self.db_session.execute(query)
+            return
 
-    def save_links(self, links: list[LinkBase]) -> None:
-        """Salva múltiplos links no banco de dados."""
-        for link in links:
-            new_link = Link(
-                source_page_id=link.source_page_id,
-                target_page_id=link.target_page_id,
-                anchor_text=link.anchor_text,
+        query = (
+            text(
+                "SELECT source_page_id, target_page_id FROM links "
+                "WHERE source_page_id IN :page_ids"
             )
-            self.db_session.add(new_link)
+            .bindparams(bindparam("page_ids", expanding=True))
+            .execution_options(yield_per=yield_per)
+        )
+        for i in range(0, len(source_page_ids), CHUNK_SIZE):
+            chunk = source_page_ids[i : i + CHUNK_SIZE]
+            yield from self.db_session.execute(query, {"page_ids": chunk})
+
+    def get_out_links(self, page_ids: list[int]) -> dict[int, list[int]]:
+        """
+        {page_id: alvos dos links} das páginas dadas (lista vazia para as
+        que não têm links).
+        """
+        out_links = {page_id: [] for page_id in page_ids}
+        for source, target in self.iter_links(page_ids):
+            out_links[source].append(target)
+        return out_links
+
+    def iter_link_versions(
+        self, yield_per: int = DB_YIELD_PER
+    ) -> Iterator[tuple[int, int]]:
+        """
+        (page_id, links_version) de todas as páginas, 0 para versão
+        desconhecida: os links de uma página mudaram desde uma leitura se e
+        só se a versão mudou, sem transferir os links.
+        """
+        query = text(
+            "SELECT page_id, COALESCE(links_version, 0) FROM pages"
+        ).execution_options(yield_per=yield_per)
+        yield from self.db_session.execute(query)
+
+    def iter_page_ids(self, yield_per: int = DB_YIELD_PER) -> Iterator[int]:
+        query = text("SELECT page_id FROM pages").execution_options(yield_per=yield_per)
+        yield from self.db_session.execute(query).scalars()
+
+    def read_subgraph(self, page_ids: list[int], consume: Callable):
+        """
+        Passa os iteradores de páginas e de links do subgrafo para `consume`
+        (p.ex. services.graph_builder.assemble_graph) e retorna o resultado,
+        sem materializar as linhas. No AsyncPageRepository os iteradores só
+        existem dentro do run_sync, daí o consumidor em vez de um retorno.
+        """
+        return consume(
+            self.iter_subgraph_pages(page_ids), self.iter_subgraph_links(page_ids)
+        )
+
+    def iter_page_revisions(self, batch_size: int = 50):
+        """
+        Percorre `pages` em lotes (paginação por page_id), retornando
+        listas de dicts com page_id, title, lastrevid e touched.
+        """
+        query = text(
+            "SELECT page_id, title, lastrevid, touched FROM pages "
+            "WHERE page_id > :after ORDER BY page_id LIMIT :limit"
+        )
+        after = -1
+        while True:
+            rows = self.db_session.execute(
+                query, {"after": after, "limit": batch_size}
+            ).mappings()
+            batch = [dict(row) for row in rows]
+            if not batch:
+                return
+            yield batch
+            after = batch[-1]["page_id"]
+
+    def release_titles(self, pages: list[PageBase]) -> None:
+        """
+        `pages.title` é único: outra página salva com o título de uma destas
+        (movida ou apagada desde o seu scraping) é removida junto com os seus
+        links. Se ela ainda existir, volta com o título atual quando for
+        alcançada de novo.
+        """
+        stale_query = text(
+            "SELECT page_id FROM pages "
+            "WHERE title IN :titles AND page_id NOT IN :page_ids"
+        ).bindparams(
+            bindparam("titles", expanding=True), bindparam("page_ids", expanding=True)
+        )
+        stale = [
+            row[0]
+            for row in self.db_session.execute(
+                stale_query,
+                {
+                    "titles": [page.title for page in pages],
+                    "page_ids": [page.page_id for page in pages],
+                },
+            )
+        ]
+        if not stale:
+            return
+        self.delete_links_by_sources(stale)
+        self.db_session.execute(
+            text("DELETE FROM pages WHERE page_id IN :stale").bindparams(
+                bindparam("stale", expanding=True)
+            ),
+            {"stale": stale},
+        )
+
+    def _existing_page_ids(self, page_ids: list[int]) -> set[int]:
+        query = text("SELECT page_id FROM pages WHERE page_id IN :page_ids").bindparams(
+            bindparam("page_ids", expanding=True)
+        )
+        result = self.db_session.execute(query, {"page_ids": page_ids})
+        return {row[0] for row in result}
+
+    def _apply_links_in_deltas(self, deltas: dict[int, int]) -> None:
+        """Soma a variação de links de entrada de cada alvo (um UPDATE em lote)."""
+        rows = [
+            {"page_id": page_id, "delta": delta}
+            for page_id, delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+        self.db_session.execute(
+            text(
+                "UPDATE pages SET links_in_count = COALESCE(links_in_count, 0) + :delta "
+                "WHERE page_id = :page_id"
+            ),
+            rows,
+        )
+
+    def _recount_links_in(self, page_ids: list[int]) -> None:
+        """Conta do zero os links de entrada de algumas páginas (páginas novas)."""
+        self.db_session.execute(
+            text(
+                "UPDATE pages SET links_in_count = ("
+                " SELECT COUNT(*) FROM links WHERE links.target_page_id = pages.page_id) "
+                "WHERE page_id IN :page_ids"
+            ).bindparams(bindparam("page_ids", expanding=True)),
+            {"page_ids": page_ids},
+        )
+
+    def _bump_links_version(self, page_ids: list[int]) -> None:
+        """Marca os links das páginas como alterados (nova links_version)."""
+        self.db_session.execute(
+            text(
+                "UPDATE pages SET links_version = :version WHERE page_id IN :page_ids"
+            ).bindparams(bindparam("page_ids", expanding=True)),
+            {"version": new_links_version(), "page_ids": page_ids},
+        )
+
+    def delete_links_by_sources(self, source_page_ids: list[int]) -> None:
+        """Remove os links de várias páginas fonte, descontando dos alvos."""
+        params = {"page_ids": source_page_ids}
+        counts = self.db_session.execute(
+            text(
+                "SELECT target_page_id, COUNT(*) FROM links "
+                "WHERE source_page_id IN :page_ids GROUP BY target_page_id"
+            ).bindparams(bindparam("page_ids", expanding=True)),
+            params,
+        )
+        self._apply_links_in_deltas({target: -count for target, count in counts})
+        self.db_session.execute(
+            text("DELETE FROM links WHERE source_page_id IN :page_ids").bindparams(
+                bindparam("page_ids", expanding=True)
+            ),
+            params,
+        )
+        self._bump_links_version(source_page_ids)
+
+    def update_pagerank_scores(self, scores: dict[int, float]) -> None:
+        """
+        Grava {page_id: score} em pages.pagerank_score com um único UPDATE:
+        no PostgreSQL, um UPDATE ... FROM unnest(ids, scores); nos outros
+        bancos, um UPDATE com executemany.
+        """
+        if not scores:
+            return
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            self.db_session.execute(
+                text(
+                    "UPDATE pages SET pagerank_score = s.score "
+                    "FROM unnest(CAST(:page_ids AS integer[]), "
+                    "CAST(:scores AS double precision[])) AS s(page_id, score) "
+                    "WHERE pages.page_id = s.page_id"
+                ),
+                {"page_ids": list(scores), "scores": list(scores.values())},
+            )
+        else:
+            self.db_session.execute(
+                text(
+                    "UPDATE pages SET pagerank_score = :score WHERE page_id = :page_id"
+                ),
+                [
+                    {"page_id": page_id, "score": score}
+                    for page_id, score in scores.items()
+                ],
+            )
+        self.db_session.commit()
+
+    def rebuild_links_in_count(self) -> int:
+        """
+        Recalcula links_in_count de todas as páginas com um único UPDATE
+        baseado em conjunto. Retorna o número de páginas corrigidas.
+        """
+        result = self.db_session.execute(
+            text(
+                "UPDATE pages SET links_in_count = c.n FROM ("
+                " SELECT p.page_id, COUNT(l.source_page_id) AS n FROM pages p"
+                " LEFT JOIN links l ON l.target_page_id = p.page_id"
+                " GROUP BY p.page_id) AS c "
+                "WHERE pages.page_id = c.page_id "
+                "AND (pages.links_in_count IS NULL OR pages.links_in_count <> c.n)"
+            )
+        )
+        self.db_session.commit()
+        return result.rowcount
+
+    def get_pages_by_links_in(
+        self,
+        min_links_in: int = 0,
+        max_links_in: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict]:
+        """Páginas ordenadas por links de entrada (desc), com filtro por faixa."""
+        query = "SELECT * FROM pages WHERE links_in_count >= :min_links_in"
+        if max_links_in is not None:
+            query += " AND links_in_count <= :max_links_in"
+        query += " ORDER BY links_in_count DESC, page_id LIMIT :limit OFFSET :offset"
+        result = self.db_session.execute(
+            text(query),
+            {
+                "min_links_in": min_links_in,
+                "max_links_in": max_links_in,
+                "limit": limit,
+                "offset": offset,
+            },
+        )
+        return [dict(row) for row in result.mappings()]
 
     def save_page_with_links(self, page_data: PageBase, links: list[LinkBase]) -> None:
         """Salva uma página e seus links no banco de dados."""
-        self.save_page(page_data)
-        self.delete_links_by_source(page_data.page_id)
-        self.save_links(links)
-        self.db_session.commit()
+        self.save_pages_with_links([(page_data, links)])
+
+    def save_pages_with_links(
+        self,
+        pairs: list[tuple[PageBase, list[LinkBase]]],
+        batch_size: int = DB_WRITE_BATCH_SIZE,
+    ) -> None:
+        """
+        Versão em lote de save_page_with_links. Para cada lote de páginas,
+        em uma transação: upsert das páginas (INSERT ... ON CONFLICT), DELETE
+        dos links antigos de todas as fontes do lote e inserção dos links
+        novos (COPY no PostgreSQL, executemany nos outros bancos), com os
+        textos âncora trocados por ids de anchor_texts (via cache em memória).
+
+        links_in_count é mantido por agregação de deltas: links removidos e
+        inseridos são contados por alvo e aplicados em um UPDATE em lote;
+        páginas novas do lote têm a contagem recalculada.
+        """
+        columns = ", ".join(PAGE_FIELDS)
+        values = ", ".join(f":{field}" for field in PAGE_FIELDS)
+        updates = ", ".join(f"{field} = excluded.{field}" for field in PAGE_FIELDS[1:])
+        # links_in_count e pagerank_score só são zerados em páginas novas
+        upsert = text(
+            f"INSERT INTO pages ({columns}, links_in_count, pagerank_score) "
+            f"VALUES ({values}, 0, 0.0) "
+            f"ON CONFLICT (page_id) DO UPDATE SET {updates}"
+        )
+
+        for i in range(0, len(pairs), batch_size):
+            # A última ocorrência de uma página (ou de um título) no lote prevalece
+            batch = {
+                page.page_id: (page, links) for page, links in pairs[i : i + batch_size]
+            }
+            by_title = {page.title: page.page_id for page, _ in batch.values()}
+            batch = {page_id: batch[page_id] for page_id in by_title.values()}
+            pages = [page for page, _ in batch.values()]
+
+            page_ids = list(batch)
+            new_ids = set(page_ids) - self._existing_page_ids(page_ids)
+
+            self.release_titles(pages)
+            self.db_session.execute(
+                upsert, [page.model_dump(include=set(PAGE_FIELDS)) for page in pages]
+            )
+            self.delete_links_by_sources(page_ids)
+            rows, anchor_ids = self._intern_anchors(
+                aggregate_links([link for _, links in batch.values() for link in links])
+            )
+            bulk_insert(
+                self.db_session.connection(), Link.__table__, LINK_COLUMNS, rows
+            )
+
+            self._apply_links_in_deltas(
+                Counter(row[1] for row in rows if row[1] not in new_ids)
+            )
+            if new_ids:
+                self._recount_links_in(list(new_ids))
+            self.db_session.commit()
+            self.anchors.remember(anchor_ids)
+
+
+class AsyncPageRepository:
+    """
+    PageRepository sobre uma AsyncSession (asyncpg / aiosqlite), usado pela
+    API. As consultas são as do PageRepository, executadas com
+    AsyncSession.run_sync: o código síncrono roda em um greenlet no loop de
+    eventos e cede o controle a cada ida ao banco, sem prender uma thread.
+
+    Cada chamada encerra a sua transação, devolvendo a conexão ao pool
+    enquanto a requisição espera por outra coisa (p.ex. o scraping).
+
+    Leituras que montam estruturas grandes a partir das linhas (grafo em
+    CSR, resposta Pydantic) rodam em asyncio.to_thread com uma Session
+    síncrona de `session_factory`: no greenlet, essa montagem ocuparia o
+    loop de eventos.
+    """
+
+    def __init__(self, db_session: AsyncSession, session_factory=SessionLocal):
+        self.db_session = db_session
+        self.session_factory = session_factory
+
+    async def _run(self, method, *args, **kwargs):
+        result = await self.db_session.run_sync(
+            lambda session: method(PageRepository(session), *args, **kwargs)
+        )
+        await self.db_session.commit()
+        return result
+
+    async def _run_in_thread(self, method, *args, **kwargs):
+        """Como _run, mas em uma thread, com uma Session de session_factory."""
+
+        def run():
+            with self.session_factory() as session:
+                return method(PageRepository(session), *args, **kwargs)
+
+        return await asyncio.to_thread(run)
+
+    async def get_page_by_id(self, page_id: int) -> dict | None:
+        return await self._run(PageRepository.get_page_by_id, page_id)
+
+    async def get_page_by_title(self, title: str) -> dict | None:
+        return await self._run(PageRepository.get_page_by_title, title)
+
+    async def get_pages_by_titles(self, titles: list[str]) -> dict[str, int]:
+        return await self._run(PageRepository.get_pages_by_titles, titles)
+
+    async def get_titles_by_ids(self, page_ids: list[int]) -> dict[int, str]:
+        return await self._run(PageRepository.get_titles_by_ids, page_ids)
+
+    async def get_pagerank_scores(self, page_ids: list[int]) -> dict[int, float]:
+        return await self._run(PageRepository.get_pagerank_scores, page_ids)
+
+    async def get_neighbors_with_titles(
+        self, page_ids: list[int], limit: int
+    ) -> list[tuple[int, str | None]]:
+        return await self._run(
+            PageRepository.get_neighbors_with_titles, page_ids, limit
+        )
+
+    async def get_neighborhood(
+        self, seed_title: str, max_depth: int, max_neighbors: int
+    ) -> tuple[list[dict], list[tuple[int, int]]]:
+        return await self._run(
+            PageRepository.get_neighborhood, seed_title, max_depth, max_neighbors
+        )
+
+    async def get_subgraph(self, page_ids: list[int]) -> tuple[list[dict], list[dict]]:
+        return await self._run(PageRepository.get_subgraph, page_ids)
+
+    async def read_subgraph(self, page_ids: list[int], consume: Callable):
+        """`consume` (montagem do grafo) roda na thread, junto com a leitura."""
+        return await self._run_in_thread(
+            PageRepository.read_subgraph, page_ids, consume
+        )
+
+    async def get_out_links(self, page_ids: list[int]) -> dict[int, list[int]]:
+        return await self._run(PageRepository.get_out_links, page_ids)
+
+    async def load_graph(self, loader: Callable):
+        """
+        Executa `loader(PageRepository)` em uma thread, p.ex. GraphStore.get,
+        que só lê o banco na primeira carga. No loop, o lock do GraphStore
+        ficaria preso durante as idas ao banco e uma segunda requisição
+        travaria o loop esperando por ele.
+        """
+        return await self._run_in_thread(loader)
+
+    async def get_pages_by_links_in(
+        self,
+        min_links_in: int = 0,
+        max_links_in: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[dict]:
+        return await self._run(
+            PageRepository.get_pages_by_links_in,
+            min_links_in,
+            max_links_in,
+            limit,
+            offset,
+        )
+
+    async def save_page_with_links(
+        self, page_data: PageBase, links: list[LinkBase]
+    ) -> None:
+        await self._run(PageRepository.save_page_with_links, page_data, links)
+
+    async def save_pages_with_links(
+        self,
+        pairs: list[tuple[PageBase, list[LinkBase]]],
+        batch_size: int = DB_WRITE_BATCH_SIZE,
+    ) -> None:
+        await self._run(PageRepository.save_pages_with_links, pairs, batch_size)
+
+    async def update_pagerank_scores(self, scores: dict[int, float]) -> None:
+        await self._run(PageRepository.update_pagerank_scores, scores)
 
 
 def get_page_repository(db: Session = Depends(get_db)) -> PageRepository:
     return PageRepository(db)
+
+
+async def get_async_page_repository(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncPageRepository:
+    return AsyncPageRepository(db)
@@ -0,0 +1,68 @@
+from sqlalchemy import bindparam, text
+
+# Limite de parâmetros por consulta IN
+CHUNK_SIZE = 1000
+
+
+class TitleAliasRepository:
+    """
+    Tabela title_aliases (título de link → page_id) e títulos já presentes
+    em `pages`.
+
+    Recebe uma fábrica de sessões, não uma Session: o resolvedor de títulos
+    é chamado pelas threads do crawler, então cada operação abre a sua.
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get_many(self, titles: list[str]) -> dict[str, tuple[int | None, str | None]]:
+        """
+        Retorna {title: (page_id, resolved_title)} dos títulos resolvidos.
+        Linhas sem page_id (títulos inexistentes gravados por versões
+        anteriores) são ignoradas: o link vermelho pode ter virado página.
+        """
+        aliases_query = text(
+            "SELECT title, page_id, resolved_title FROM title_aliases "
+            "WHERE title IN :titles AND page_id IS NOT NULL"
+        ).bindparams(bindparam("titles", expanding=True))
+
+        found = {}
+        with self.session_factory() as session:
+            for i in range(0, len(titles), CHUNK_SIZE):
+                chunk = titles[i : i + CHUNK_SIZE]
+                for row in session.execute(aliases_query, {"titles": chunk}):
+                    found[row.title] = (row.page_id, row.resolved_title)
+        return found
+
+    def get_pages_by_titles(self, titles: list[str]) -> dict[str, int]:
+        """Retorna {title: page_id} dos títulos canônicos que já estão em `pages`."""
+        pages_query = text(
+            "SELECT title, page_id FROM pages WHERE title IN :titles"
+        ).bindparams(bindparam("titles", expanding=True))
+
+        found = {}
+        with self.session_factory() as session:
+            for i in range(0, len(titles), CHUNK_SIZE):
+                chunk = titles[i : i + CHUNK_SIZE]
+                for row in session.execute(pages_query, {"titles": chunk}):
+                    found[row.title] = row.page_id
+        return found
+
+    def save_many(self, aliases: dict[str, tuple[int | None, str | None]]) -> None:
+        """Insere/atualiza vários aliases em uma única transação."""
+        if not aliases:
+            return
+        query = text(
+            "INSERT INTO title_aliases (title, page_id, resolved_title) "
+            "VALUES (:title, :page_id, :resolved_title) "
+            "ON CONFLICT (title) DO UPDATE SET "
+            "page_id = excluded.page_id, resolved_title = excluded.resolved_title"
+        )
+        rows = [
+            {"title": title, "page_id": page_id, "resolved_title": resolved_title}
+            for title, (page_id, resolved_title) in aliases.items()
+        ]
+        with self.session_factory() as session:
+            session.execute(query, rows)
+            session.commit()
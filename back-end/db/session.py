@@ -1,7 +1,11 @@
 from sqlalchemy.orm import sessionmaker
-from db.engine import engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from db.engine import engine, async_engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def get_db():
@@ -10,3 +14,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,269 @@
+import random
+from array import array
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from sqlalchemy import text
+
+from config.settings import WIKI_BASE_URL
+from db.bulk import BATCH_SIZE, bulk_insert
+from db.db_models import Link, Page
+from dumps.sql_reader import SQLDump
+
+# Redirects duplos (A → B → C) são seguidos até este limite
+MAX_REDIRECT_HOPS = 5
+
+PAGE_COLUMNS = [
+    "page_id",
+    "title",
+    "url",
+    "length_chars",
+    "num_editors",
+    "num_revisions",
+    "links_out_count",
+    "links_in_count",
+    "pagerank_score",
+    "lastrevid",
+    "touched",
+    "links_version",
+]
+LINK_COLUMNS = ["source_page_id", "target_page_id", "anchor_ids", "multiplicity"]
+# Caracteres que o MediaWiki não codifica no fullurl (wfUrlencode)
+URL_SAFE = ";@$!*(),/~:"
+
+
+def _title(raw) -> str:
+    # Os dumps guardam títulos com "_" no lugar de espaços
+    return str(raw).replace("_", " ")
+
+
+def _touched(raw) -> datetime | None:
+    if not raw:
+        return None
+    return datetime.strptime(str(raw), "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+
+
+class DumpImporter:
+    """
+    Carga inicial de `pages` e `links` a partir dos dumps SQL da Wikipedia
+    (page, redirect, pagelinks e, no esquema novo do pagelinks, linktarget),
+    sem nenhuma chamada à API.
+
+    Só artigos (namespace 0) entram. Os redirects são resolvidos em memória
+    (título → page_id), então links para um redirect apontam para o artigo
+    final, como no scraper. Os arquivos são lidos em streaming e gravados
+    em lotes por `db.bulk.bulk_insert` (COPY no PostgreSQL):
+
+      1. page: títulos → page_id e ids de redirects
+      2. redirect: título do redirect → page_id do alvo
+      3. pagelinks: grava os links e conta links de saída/entrada por página
+      4. page de novo: grava as páginas já com as contagens
+    """
+
+    def __init__(self, engine, batch_size: int = BATCH_SIZE):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.title_to_id: dict[str, int] = {}
+        self.redirect_titles: dict[int, str] = {}
+        self.is_article = bytearray()
+        self.links_out = array("I")
+        self.links_in = array("I")
+        self.stats = {
+            "pages": 0,
+            "redirects": 0,
+            "links": 0,
+            "unresolved_links": 0,
+        }
+
+    def clear_tables(self) -> None:
+        """Apaga `links` e `pages` antes de uma carga completa."""
+        with self.engine.begin() as connection:
+            connection.execute(text("DELETE FROM links"))
+            connection.execute(text("DELETE FROM pages"))
+
+    def check_empty(self) -> None:
+        """
+        A carga é só INSERT/COPY, sem tratamento de conflito: com páginas ou
+        links já salvos ela falharia por chave duplicada, e só depois de ler
+        o dump de pagelinks inteiro. Falha antes, com ValueError.
+        """
+        with self.engine.connect() as connection:
+            for table in ("pages", "links"):
+                if connection.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).first():
+                    raise ValueError(
+                        f"A tabela {table} não está vazia: apague pages e links "
+                        "antes da carga (clear_tables, --truncate no "
+                        "run_dump_import.py)"
+                    )
+
+    def run(
+        self,
+        page_path: str,
+        redirect_path: str | None = None,
+        pagelinks_path: str | None = None,
+        linktarget_path: str | None = None,
+    ) -> dict:
+        self.check_empty()
+        self._scan_pages(page_path)
+        if redirect_path:
+            self._scan_redirects(redirect_path)
+        if pagelinks_path:
+            self._load_links(pagelinks_path, linktarget_path)
+        self._load_pages(page_path)
+        print(f"[DumpImporter] Done: {self.stats}")
+        return self.stats
+
+    def _scan_pages(self, path: str) -> None:
+        print(f"[DumpImporter] Scanning pages: {path}")
+        max_id = 0
+        article_ids = []
+        rows = SQLDump(path).rows(
+            "page_id", "page_namespace", "page_title", "page_is_redirect"
+        )
+        for page_id, namespace, title, is_redirect in rows:
+            if namespace != 0:
+                continue
+            if is_redirect:
+                self.redirect_titles[page_id] = _title(title)
+            else:
+                self.title_to_id[_title(title)] = page_id
+                article_ids.append(page_id)
+            max_id = max(max_id, page_id)
+
+        # Vetores indexados por page_id: bem menores que dicts/sets de int
+        self.is_article = bytearray(max_id + 1)
+        for page_id in article_ids:
+            self.is_article[page_id] = 1
+        self.links_out = array("I", bytes(4 * (max_id + 1)))
+        self.links_in = array("I", bytes(4 * (max_id + 1)))
+        print(
+            f"[DumpImporter] {len(article_ids)} articles, "
+            f"{len(self.redirect_titles)} redirects"
+        )
+
+    def _scan_redirects(self, path: str) -> None:
+        print(f"[DumpImporter] Resolving redirects: {path}")
+        targets = {}
+        rows = SQLDump(path).rows("rd_from", "rd_namespace", "rd_title", "rd_interwiki")
+        for source_id, namespace, title, interwiki in rows:
+            source_title = self.redirect_titles.get(source_id)
+            if source_title is None or namespace != 0 or interwiki:
+                continue
+            targets[source_title] = _title(title)
+
+        for source_title, target in targets.items():
+            for _ in range(MAX_REDIRECT_HOPS):
+                if target in self.title_to_id or target not in targets:
+                    break
+                target = targets[target]
+            if target in self.title_to_id:
+                self.title_to_id[source_title] = self.title_to_id[target]
+                self.stats["redirects"] += 1
+
+    def _load_links(self, path: str, linktarget_path: str | None) -> None:
+        print(f"[DumpImporter] Loading links: {path}")
+        dump = SQLDump(path)
+        if "pl_target_id" in dump.read_columns():
+            # Esquema novo: pl_target_id → linktarget (lt_namespace, lt_title)
+            if not linktarget_path:
+                raise ValueError(
+                    "Este dump de pagelinks usa pl_target_id: informe o dump linktarget"
+                )
+            resolved = self._scan_linktargets(linktarget_path)
+            rows = (
+                (source_id, resolved.get(target_id))
+                for source_id, target_id in dump.rows("pl_from", "pl_target_id")
+            )
+        else:
+            rows = (
+                (
+                    source_id,
+                    self.title_to_id.get(_title(title)) if namespace == 0 else None,
+                )
+                for source_id, namespace, title in dump.rows(
+                    "pl_from", "pl_namespace", "pl_title"
+                )
+            )
+
+        with self.engine.begin() as connection:
+            self.stats["links"] = bulk_insert(
+                connection,
+                Link.__table__,
+                LINK_COLUMNS,
+                self._link_rows(rows),
+                self.batch_size,
+            )
+
+    def _scan_linktargets(self, path: str) -> dict[int, int]:
+        resolved = {}
+        rows = SQLDump(path).rows("lt_id", "lt_namespace", "lt_title")
+        for target_id, namespace, title in rows:
+            if namespace != 0:
+                continue
+            page_id = self.title_to_id.get(_title(title))
+            if page_id is not None:
+                resolved[target_id] = page_id
+        return resolved
+
+    def _link_rows(self, rows):
+        """
+        Filtra (fonte, alvo) para artigos, conta e remove duplicatas. O dump
+        vem ordenado por pl_from, então basta lembrar dos alvos da fonte atual.
+        """
+        current_source = None
+        seen = set()
+        for source_id, target_id in rows:
+            if source_id >= len(self.is_article) or not self.is_article[source_id]:
+                continue
+            if target_id is None:
+                self.stats["unresolved_links"] += 1
+                continue
+            if source_id != current_source:
+                current_source = source_id
+                seen = set()
+            if target_id in seen:
+                continue
+            seen.add(target_id)
+            self.links_out[source_id] += 1
+            self.links_in[target_id] += 1
+            yield source_id, target_id, None, 1
+
+    def _load_pages(self, path: str) -> None:
+        print(f"[DumpImporter] Loading pages: {path}")
+        rows = SQLDump(path).rows(
+            "page_id",
+            "page_namespace",
+            "page_title",
+            "page_is_redirect",
+            "page_len",
+            "page_latest",
+            "page_touched",
+        )
+
+        # Uma links_version por carga (ver db.repositories.page.new_links_version):
+        # o snapshot do grafo anterior à carga vê todas as páginas alteradas
+        links_version = random.randrange(1, 2**63)
+
+        def page_rows():
+            for page_id, namespace, title, is_redirect, length, latest, touched in rows:
+                if namespace != 0 or is_redirect:
+                    continue
+                yield (
+                    page_id,
+                    _title(title),
+                    WIKI_BASE_URL + quote(str(title), safe=URL_SAFE),
+                    length,
+                    None,
+                    None,
+                    self.links_out[page_id],
+                    self.links_in[page_id],
+                    0.0,
+                    latest,
+                    _touched(touched),
+                    links_version,
+                )
+
+        with self.engine.begin() as connection:
+            self.stats["pages"] = bulk_insert(
+                connection, Page.__table__, PAGE_COLUMNS, page_rows(), self.batch_size
+            )
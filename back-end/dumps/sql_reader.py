@@ -0,0 +1,110 @@
+import gzip
+import re
+
+# `coluna` tipo ... dentro do CREATE TABLE
+_COLUMN = re.compile(r"^\s*`([^`]+)`\s")
+# Um valor de uma tupla do INSERT: string, NULL, número, ou os parênteses
+_TOKEN = re.compile(
+    r"""'([^'\\]*(?:\\.[^'\\]*)*)'|(NULL)|([^,()'\s;]+)|(\()|(\))""", re.S
+)
+_ESCAPE = re.compile(r"\\(.)", re.S)
+_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def _number(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class SQLDump:
+    """
+    Leitor em streaming de um dump SQL do MediaWiki (`ptwiki-*-page.sql.gz`,
+    `redirect`, `pagelinks`, `linktarget`).
+
+    O arquivo (gzip ou texto) é lido linha a linha: a ordem das colunas vem
+    do CREATE TABLE e cada linha `INSERT INTO ... VALUES (...),(...);` é
+    convertida em tuplas. Nunca há mais de uma linha do dump em memória.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.table = None
+        self.columns = []
+
+    def _open(self):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, "rt", encoding="utf-8", errors="replace")
+        return open(self.path, "rt", encoding="utf-8", errors="replace")
+
+    def read_columns(self) -> list[str]:
+        """Lê só o cabeçalho (CREATE TABLE) e retorna os nomes das colunas."""
+        for _ in self._rows():
+            break
+        return self.columns
+
+    def rows(self, *names: str):
+        """
+        Itera as linhas do dump como tuplas. Com `names`, cada tupla traz só
+        essas colunas, nessa ordem.
+        """
+        indexes = None
+        for row in self._rows():
+            if indexes is None and names:
+                missing = [n for n in names if n not in self.columns]
+                if missing:
+                    raise ValueError(
+                        f"Colunas {missing} não existem na tabela '{self.table}' "
+                        f"({self.path})"
+                    )
+                indexes = [self.columns.index(n) for n in names]
+            yield tuple(row[i] for i in indexes) if indexes else row
+
+    def _rows(self):
+        columns = []
+        in_create = False
+        with self._open() as f:
+            for line in f:
+                if in_create:
+                    m = _COLUMN.match(line)
+                    if m:
+                        columns.append(m.group(1))
+                    elif line.startswith(")"):
+                        in_create = False
+                        self.columns = columns
+                    continue
+
+                if line.startswith("CREATE TABLE"):
+                    self.table = line.split("`")[1]
+                    columns = []
+                    in_create = True
+                elif line.startswith("INSERT INTO"):
+                    if not self.columns:
+                        raise ValueError(f"INSERT sem CREATE TABLE em {self.path}")
+                    yield from self._parse_values(line, line.index(" VALUES ") + 8)
+                # Comentários, LOCK TABLES, SET ...: ignorados
+
+    def _parse_values(self, line: str, start: int):
+        row = None
+        for m in _TOKEN.finditer(line, start):
+            quoted, null, bare, opening, closing = m.groups()
+            if opening:
+                row = []
+            elif closing:
+                yield tuple(row)
+                row = None
+            elif row is None:
+                continue
+            elif quoted is not None:
+                row.append(_unescape(quoted))
+            elif null:
+                row.append(None)
+            else:
+                row.append(_number(bare))
@@ -0,0 +1,35 @@
+"""index and backfill pages.links_in_count
+
+Revision ID: 4e8b1c6d2f90
+Revises: 7a4d2f8c9e13
+Create Date: 2026-10-17 15:21:07.402117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8b1c6d2f90"
+down_revision: Union[str, Sequence[str], None] = "7a4d2f8c9e13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Contagem inicial; daqui em diante o PageRepository mantém os valores
+    op.execute(
+        "UPDATE pages SET links_in_count = c.n FROM ("
+        " SELECT p.page_id, COUNT(l.source_page_id) AS n FROM pages p"
+        " LEFT JOIN links l ON l.target_page_id = p.page_id"
+        " GROUP BY p.page_id) AS c "
+        "WHERE pages.page_id = c.page_id"
+    )
+    op.create_index("ix_pages_links_in_count", "pages", ["links_in_count"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_pages_links_in_count", table_name="pages")
@@ -0,0 +1,35 @@
+"""add title_aliases
+
+Revision ID: 5c2d8e1f4a37
+Revises: e09200e715e5
+Create Date: 2026-10-17 09:12:41.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2d8e1f4a37"
+down_revision: Union[str, Sequence[str], None] = "e09200e715e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "title_aliases",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("page_id", sa.Integer(), nullable=True),
+        sa.Column("resolved_title", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("title"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("title_aliases")
@@ -0,0 +1,38 @@
+"""add links_version to pages
+
+Revision ID: 6f3b9d2e8a41
+Revises: 9c2e5a7b1d34
+Create Date: 2026-10-17 21:24:51.318402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f3b9d2e8a41"
+down_revision: Union[str, Sequence[str], None] = "9c2e5a7b1d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("pages", sa.Column("links_version", sa.BigInteger(), nullable=True))
+    # Versões aleatórias: snapshots do grafo anteriores não têm versões e
+    # são remontados no primeiro refresh
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "UPDATE pages SET links_version = "
+            "1 + floor(random() * 4611686018427387904)::bigint"
+        )
+    else:
+        op.execute("UPDATE pages SET links_version = 1 + abs(random() / 2)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("pages", "links_version")
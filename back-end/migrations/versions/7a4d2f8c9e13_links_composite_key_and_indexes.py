@@ -0,0 +1,95 @@
+"""links composite key, anchor_texts/multiplicity and indexes
+
+Revision ID: 7a4d2f8c9e13
+Revises: c3f1a9d27e64
+Create Date: 2026-10-17 13:02:44.918365
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4d2f8c9e13"
+down_revision: Union[str, Sequence[str], None] = "c3f1a9d27e64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # Títulos duplicados: fica a página de maior page_id (a mais recente a
+    # ocupar o título, p.ex. depois de uma movimentação)
+    op.execute(
+        "DELETE FROM links WHERE source_page_id IN ("
+        " SELECT page_id FROM pages WHERE page_id NOT IN ("
+        "  SELECT MAX(page_id) FROM pages GROUP BY title))"
+    )
+    op.execute(
+        "DELETE FROM pages WHERE page_id NOT IN ("
+        " SELECT MAX(page_id) FROM pages GROUP BY title)"
+    )
+    op.create_index("ix_pages_title", "pages", ["title"], unique=True)
+
+    op.create_table(
+        "links_dedup",
+        sa.Column("source_page_id", sa.Integer(), nullable=False),
+        sa.Column("target_page_id", sa.Integer(), nullable=False),
+        sa.Column("anchor_texts", sa.JSON(), nullable=True),
+        sa.Column("multiplicity", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("source_page_id", "target_page_id"),
+    )
+    if bind.dialect.name == "postgresql":
+        anchors = (
+            "json_agg(DISTINCT anchor_text) FILTER (WHERE anchor_text IS NOT NULL)"
+        )
+    else:
+        anchors = (
+            "CASE WHEN COUNT(anchor_text) > 0 "
+            "THEN json_group_array(DISTINCT anchor_text) "
+            "FILTER (WHERE anchor_text IS NOT NULL) END"
+        )
+    op.execute(
+        "INSERT INTO links_dedup "
+        "(source_page_id, target_page_id, anchor_texts, multiplicity) "
+        f"SELECT source_page_id, target_page_id, {anchors}, COUNT(*) "
+        "FROM links GROUP BY source_page_id, target_page_id"
+    )
+    op.drop_table("links")
+    op.rename_table("links_dedup", "links")
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER INDEX links_dedup_pkey RENAME TO links_pkey")
+    op.create_index(
+        "ix_links_target_source", "links", ["target_page_id", "source_page_id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Volta a uma linha por par (fonte, alvo), com o primeiro texto âncora
+    op.drop_index("ix_links_target_source", table_name="links")
+    op.create_table(
+        "links_legacy",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source_page_id", sa.Integer(), nullable=False),
+        sa.Column("target_page_id", sa.Integer(), nullable=False),
+        sa.Column("anchor_text", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        first_anchor = "anchor_texts ->> 0"
+    else:
+        first_anchor = "json_extract(anchor_texts, '$[0]')"
+    op.execute(
+        "INSERT INTO links_legacy (source_page_id, target_page_id, anchor_text) "
+        f"SELECT source_page_id, target_page_id, {first_anchor} FROM links"
+    )
+    op.drop_table("links")
+    op.rename_table("links_legacy", "links")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER INDEX links_legacy_pkey RENAME TO links_pkey")
+    op.drop_index("ix_pages_title", table_name="pages")
@@ -0,0 +1,34 @@
+"""add lastrevid and touched to pages
+
+Revision ID: 9b4e7a2c1d58
+Revises: 5c2d8e1f4a37
+Create Date: 2026-10-17 10:03:27.540917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e7a2c1d58"
+down_revision: Union[str, Sequence[str], None] = "5c2d8e1f4a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Páginas já salvas ficam com NULL e são tratadas como desatualizadas
+    op.add_column("pages", sa.Column("lastrevid", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "pages", sa.Column("touched", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("pages", "touched")
+    op.drop_column("pages", "lastrevid")
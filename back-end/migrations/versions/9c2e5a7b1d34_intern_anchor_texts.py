@@ -0,0 +1,88 @@
+"""intern anchor texts into anchor_texts, links.anchor_ids
+
+Revision ID: 9c2e5a7b1d34
+Revises: 4e8b1c6d2f90
+Create Date: 2026-10-17 18:40:12.631904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2e5a7b1d34"
+down_revision: Union[str, Sequence[str], None] = "4e8b1c6d2f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "anchor_texts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("text", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_anchor_texts_text", "anchor_texts", ["text"], unique=True)
+    op.add_column("links", sa.Column("anchor_ids", sa.JSON(), nullable=True))
+
+    # Textos distintos → anchor_texts; cada link recebe os ids na mesma ordem
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "INSERT INTO anchor_texts (text) "
+            "SELECT DISTINCT a.text FROM links, "
+            "json_array_elements_text(links.anchor_texts) AS a(text)"
+        )
+        op.execute(
+            "UPDATE links SET anchor_ids = ("
+            " SELECT json_agg(t.id ORDER BY a.ord)"
+            " FROM json_array_elements_text(links.anchor_texts)"
+            "  WITH ORDINALITY AS a(text, ord)"
+            " JOIN anchor_texts t ON t.text = a.text) "
+            "WHERE anchor_texts IS NOT NULL"
+        )
+    else:
+        op.execute(
+            "INSERT INTO anchor_texts (text) "
+            "SELECT DISTINCT a.value FROM links, json_each(links.anchor_texts) AS a"
+        )
+        op.execute(
+            "UPDATE links SET anchor_ids = ("
+            " SELECT json_group_array(id) FROM ("
+            "  SELECT t.id FROM json_each(links.anchor_texts) AS a"
+            "  JOIN anchor_texts t ON t.text = a.value ORDER BY a.key)) "
+            "WHERE anchor_texts IS NOT NULL"
+        )
+
+    with op.batch_alter_table("links") as batch_op:
+        batch_op.drop_column("anchor_texts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("links", sa.Column("anchor_texts", sa.JSON(), nullable=True))
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "UPDATE links SET anchor_texts = ("
+            " SELECT json_agg(t.text ORDER BY a.ord)"
+            " FROM json_array_elements_text(links.anchor_ids)"
+            "  WITH ORDINALITY AS a(id, ord)"
+            " JOIN anchor_texts t ON t.id = a.id::integer) "
+            "WHERE anchor_ids IS NOT NULL"
+        )
+    else:
+        op.execute(
+            "UPDATE links SET anchor_texts = ("
+            " SELECT json_group_array(text) FROM ("
+            "  SELECT t.text FROM json_each(links.anchor_ids) AS a"
+            "  JOIN anchor_texts t ON t.id = a.value ORDER BY a.key)) "
+            "WHERE anchor_ids IS NOT NULL"
+        )
+
+    with op.batch_alter_table("links") as batch_op:
+        batch_op.drop_column("anchor_ids")
+    op.drop_index("ix_anchor_texts_text", table_name="anchor_texts")
+    op.drop_table("anchor_texts")
@@ -0,0 +1,63 @@
+"""add crawl_runs, crawl_frontier and crawl_visited
+
+Revision ID: c3f1a9d27e64
+Revises: 9b4e7a2c1d58
+Create Date: 2026-10-17 11:20:05.371846
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a9d27e64"
+down_revision: Union[str, Sequence[str], None] = "9b4e7a2c1d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "crawl_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("seed_title", sa.String(), nullable=False),
+        sa.Column("max_depth", sa.Integer(), nullable=False),
+        sa.Column("max_neighbors", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("last_frontier_id", sa.BigInteger(), nullable=False),
+        sa.Column("enqueued", sa.Integer(), nullable=False),
+        sa.Column("dequeued", sa.Integer(), nullable=False),
+        sa.Column("pages_done", sa.Integer(), nullable=False),
+        sa.Column("elapsed_seconds", sa.Float(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "crawl_frontier",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["crawl_runs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_crawl_frontier_run_id_id", "crawl_frontier", ["run_id", "id"])
+    op.create_table(
+        "crawl_visited",
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["crawl_runs.id"]),
+        sa.PrimaryKeyConstraint("run_id", "title"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("crawl_visited")
+    op.drop_index("ix_crawl_frontier_run_id_id", table_name="crawl_frontier")
+    op.drop_table("crawl_frontier")
+    op.drop_table("crawl_runs")
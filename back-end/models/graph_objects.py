@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from datetime import datetime
 from typing import Optional, List
 
 """
@@ -22,6 +23,8 @@ class PageBase(BaseModel):
     links_out_count: Optional[int] = None
     links_in_count: Optional[int] = None
     pagerank_score: Optional[float] = 0.0
+    lastrevid: Optional[int] = None
+    touched: Optional[datetime] = None
 
 
 class PageCreate(PageBase):
@@ -48,8 +51,13 @@ class LinkCreate(LinkBase):
     pass
 
 
-class LinkResponse(LinkBase):
-    id: int
+class LinkResponse(BaseModel):
+    """Linha da tabela links: um par (fonte, alvo) com os links agregados."""
+
+    source_page_id: int
+    target_page_id: int
+    anchor_texts: Optional[List[str]] = None
+    multiplicity: int = 1
 
     class Config:
         from_attributes = True
@@ -76,6 +84,42 @@ class GraphResponse(BaseModel):
 
 
 class PageRankResponse(BaseModel):
-    """Resposta do cálculo de PageRank"""
+    """
+    Resposta do cálculo de PageRank, com as iterações feitas e a diferença
+    L1 entre iterações consecutivas (uma por iteração)
+    """
 
     pagerank: dict[str, float]
+    warm_start: bool = False
+    iterations: Optional[int] = None
+    residuals: Optional[List[float]] = None
+
+
+class PPRScore(BaseModel):
+    """Score de PPR de uma página: o valor exato está em [score, upper_bound]"""
+
+    page_id: int
+    title: Optional[str] = None
+    score: float
+    upper_bound: float
+
+
+class PPRResponse(BaseModel):
+    """
+    Resposta do PageRank personalizado (push local). `residual` é o erro L1
+    total da aproximação e o quanto cada score pode estar abaixo do exato.
+    """
+
+    seed: str
+    alpha: float
+    epsilon: float
+    residual: float
+    pushes: int
+    scores: List[PPRScore]
+
+
+class ScraperStatsResponse(BaseModel):
+    """Estado do limitador de taxa e do cache de respostas da API"""
+
+    rate_limiter: dict[str, float]
+    api_cache: Optional[dict[str, float]] = None
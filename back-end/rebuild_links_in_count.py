@@ -0,0 +1,29 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from db.session import SessionLocal
+from db.repositories.page import PageRepository
+
+
+def main():
+    """
+    Recalcula pages.links_in_count a partir da tabela links. Use depois de
+    cargas feitas fora do PageRepository ou para conferir a contagem mantida.
+    """
+    session = SessionLocal()
+    try:
+        start = time.perf_counter()
+        fixed = PageRepository(session).rebuild_links_in_count()
+        print(
+            f"links_in_count rebuilt in {time.perf_counter() - start:.1f}s: "
+            f"{fixed} pages corrected"
+        )
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
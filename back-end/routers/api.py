@@ -1,18 +1,44 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 
+from config.settings import PPR_ALPHA, PPR_EPSILON
 from services.page import PageService, get_page_service
-from models.graph_objects import GraphResponse, PageResponse, PageRankResponse
+from models.graph_objects import (
+    GraphResponse,
+    PageResponse,
+    PageRankResponse,
+    PPRResponse,
+    ScraperStatsResponse,
+)
 from settings.logging_setup import logger
 
 
 router = APIRouter(tags=["api"])
 
 
+@router.get("/pages", response_model=list[PageResponse])
+async def list_pages_by_links_in_route(
+    min_links_in: int = Query(0, ge=0, description="Mínimo de links de entrada"),
+    max_links_in: int | None = Query(
+        None, ge=0, description="Máximo de links de entrada"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    service: PageService = Depends(get_page_service),
+):
+    """
+    Lista páginas ordenadas por links de entrada (links_in_count), do maior
+    para o menor.
+    """
+    return await service.get_pages_by_links_in(
+        min_links_in, max_links_in, limit, offset
+    )
+
+
 @router.get("/pages/{page_id}", response_model=PageResponse)
-def get_page_by_id_route(
+async def get_page_by_id_route(
     page_id: int, service: PageService = Depends(get_page_service)
 ):
-    page = service.get_page_by_id(page_id)
+    page = await service.get_page_by_id(page_id)
     logger.info("Getting page by id " + str(page))
     if not page:
         raise HTTPException(404, "Page not found")
@@ -20,13 +46,13 @@ def get_page_by_id_route(
 
 
 @router.get("/pages/title/{title}", response_model=PageResponse)
-def get_page_by_title_route(
+async def get_page_by_title_route(
     title: str, service: PageService = Depends(get_page_service)
 ):
     """
     Busca página por título. Se não existir no banco, faz scraping da Wikipedia.
     """
-    page = service.get_or_scrape_page_by_title(title)
+    page = await service.get_or_scrape_page_by_title(title)
     logger.info(f"Getting page by title '{title}': {page}")
     if not page:
         raise HTTPException(404, f"Page '{title}' not found and could not be scraped")
@@ -34,7 +60,7 @@ def get_page_by_title_route(
 
 
 @router.get("/graph/build", response_model=GraphResponse)
-def build_graph_route(
+async def build_graph_route(
     seed: str = Query(..., description="Título da página semente"),
     depth: int = Query(1, ge=1, le=3, description="Profundidade do BFS (1-3)"),
     service: PageService = Depends(get_page_service),
@@ -44,26 +70,65 @@ def build_graph_route(
     Faz scraping das páginas necessárias se não existirem no banco.
     """
     logger.info(f"Building graph: seed='{seed}', depth={depth}")
-    graph = service.generate_graph(seed, depth)
+    graph = await service.generate_graph(seed, depth)
     if not graph:
         raise HTTPException(404, f"Graph for seed '{seed}' could not be generated")
     return graph
 
 
 @router.post("/graph/pagerank", response_model=PageRankResponse)
-def calculate_pagerank_route(
+async def calculate_pagerank_route(
     nodes: list[str] = Body(..., description="Lista de títulos dos nós do grafo"),
+    warm_start: bool = Query(
+        False, description="Partir dos scores salvos, com extrapolação"
+    ),
     service: PageService = Depends(get_page_service),
 ):
     """
     Calcula o PageRank para os nós fornecidos.
-    Atualiza o banco de dados e retorna os scores.
+    Atualiza o banco de dados e retorna os scores, as iterações e o
+    histórico de resíduos.
     """
     logger.info(f"Calculating PageRank for {len(nodes)} nodes")
-    pagerank_scores = service.calculate_pagerank(nodes)
-    if not pagerank_scores:
+    result = await service.calculate_pagerank(nodes, warm_start)
+    if not result:
         raise HTTPException(400, "Could not calculate PageRank")
-    return PageRankResponse(pagerank=pagerank_scores)
+    return result
+
+
+@router.get("/graph/ppr", response_model=PPRResponse)
+async def personalized_pagerank_route(
+    seed: str = Query(..., description="Título da página semente"),
+    alpha: float = Query(
+        PPR_ALPHA, gt=0, lt=1, description="Probabilidade de voltar à semente"
+    ),
+    epsilon: float = Query(
+        PPR_EPSILON, ge=1e-8, le=1e-1, description="Limiar de resíduo do push"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    scrape: bool = Query(
+        False, description="Baixar a semente e seus vizinhos se faltarem no banco"
+    ),
+    service: PageService = Depends(get_page_service),
+):
+    """
+    PageRank personalizado: páginas mais relevantes a partir da semente,
+    com o erro máximo de cada score (push local, custo proporcional à
+    vizinhança alcançada).
+    """
+    logger.info(f"Personalized PageRank: seed='{seed}', epsilon={epsilon}")
+    result = await service.personalized_pagerank(seed, alpha, epsilon, limit, scrape)
+    if not result:
+        raise HTTPException(404, f"Seed page '{seed}' not found")
+    return result
+
+
+@router.get("/scraper/stats", response_model=ScraperStatsResponse)
+async def scraper_stats_route(service: PageService = Depends(get_page_service)):
+    """
+    Taxa de requisições à Wikipedia (atual e sustentada) e uso do cache.
+    """
+    return service.get_scraper_stats()
 
 
 @router.get("/test_router")
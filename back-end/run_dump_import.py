@@ -0,0 +1,57 @@
+import argparse
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from db.engine import engine
+from db.base import Base
+from dumps.importer import DumpImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Carga de pages/links a partir dos dumps SQL da Wikipedia "
+        "(https://dumps.wikimedia.org/ptwiki/)"
+    )
+    parser.add_argument("--page", required=True, help="ptwiki-*-page.sql.gz")
+    parser.add_argument("--redirect", help="ptwiki-*-redirect.sql.gz")
+    parser.add_argument("--pagelinks", help="ptwiki-*-pagelinks.sql.gz")
+    parser.add_argument(
+        "--linktarget",
+        help="ptwiki-*-linktarget.sql.gz (dumps de pagelinks com pl_target_id)",
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Apaga pages e links antes da carga",
+    )
+    args = parser.parse_args()
+
+    print("Creating tables if not exist...")
+    Base.metadata.create_all(bind=engine)
+
+    importer = DumpImporter(engine, batch_size=args.batch_size)
+    if args.truncate:
+        print("Clearing pages and links...")
+        importer.clear_tables()
+
+    try:
+        importer.check_empty()
+    except ValueError as e:
+        sys.exit(f"Import aborted: {e}")
+
+    start = time.perf_counter()
+    stats = importer.run(
+        args.page,
+        redirect_path=args.redirect,
+        pagelinks_path=args.pagelinks,
+        linktarget_path=args.linktarget,
+    )
+    print(f"Import finished in {time.perf_counter() - start:.1f}s: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from db.session import SessionLocal
+from db.repositories.page import PageRepository
+from services.graph_store import get_graph_store
+from services.pagerank import pagerank_csr, warm_start_vector
+from services.pagerank_parallel import pagerank_parallel
+
+
+def main():
+    """
+    PageRank global de todas as páginas do banco sobre o GraphStore (CSR):
+    atualiza o snapshot com os links alterados, calcula com o motor
+    vetorizado e grava pages.pagerank_score. Com --warm, parte dos scores
+    salvos na execução anterior, com extrapolação. Com --workers N, o
+    produto matriz × vetor é dividido entre N processos.
+    """
+    parser = argparse.ArgumentParser(description="PageRank de todas as páginas")
+    parser.add_argument("--float32", action="store_true", help="Metade da memória")
+    parser.add_argument(
+        "--warm", action="store_true", help="Partir dos scores já salvos"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processos do motor paralelo (0: motor serial)",
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        repository = PageRepository(session)
+        store = get_graph_store()
+        start = time.perf_counter()
+        store.get(repository)
+        changed = store.refresh(repository)
+        # Só páginas do banco; alvos ainda não baixados ficam de fora
+        graph = store.graph.subgraph(np.fromiter(repository.iter_page_ids(), np.int64))
+        print(
+            f"Graph ready in {time.perf_counter() - start:.1f}s "
+            f"({changed} pages refreshed): {graph.num_nodes} nodes, "
+            f"{graph.num_edges} edges"
+        )
+
+        dtype = np.float32 if args.float32 else np.float64
+        initial = None
+        if args.warm:
+            stored = repository.get_pagerank_scores(graph.page_ids.tolist())
+            initial = warm_start_vector(graph.page_ids, stored, dtype)
+            print(f"Warm start from {len(stored)} stored scores")
+
+        start = time.perf_counter()
+        residuals = []
+        options = dict(
+            dtype=dtype, residuals=residuals, start=initial, accelerate=args.warm
+        )
+        if args.workers:
+            ranks = pagerank_parallel(graph, args.workers, **options)
+        else:
+            ranks = pagerank_csr(graph, **options)
+        print(
+            f"PageRank computed in {time.perf_counter() - start:.1f}s "
+            f"({len(residuals)} iterations, "
+            f"final residual {residuals[-1] if residuals else 0.0:.1e})"
+        )
+
+        start = time.perf_counter()
+        repository.update_pagerank_scores(
+            dict(zip(graph.page_ids.tolist(), ranks.tolist()))
+        )
+        print(f"Scores saved in {time.perf_counter() - start:.1f}s")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 
@@ -8,77 +9,143 @@ from db.session import SessionLocal
 from db.engine import engine
 from db.base import Base
 from scraper.wiki_scraper import WikiScraper
-from db.db_models import Page, Link
+from scraper.api_client import APIClient
+from scraper.cache import get_default_cache
+from scraper.title_resolver import TitleResolver
+from db.repositories.title_alias import TitleAliasRepository
 from db.repositories.page import PageRepository
+from db.repositories.crawl import CrawlRepository
+from services.refresh import PageRefresher
+from services.frontier import PersistentFrontier, run_progress
+
+
+def enqueue_neighbors(repository, scraper, neighbors, depth, frontier):
+    """
+    Enfileira os vizinhos de uma página, dados como [(page_id, title ou None)].
+    Alvos que ainda não estão no banco são baixados em lote (metadados de até
+    50 páginas por requisição).
+    """
+    titles = {target_id: title for target_id, title in neighbors if title}
+    unseen = [target_id for target_id, title in neighbors if not title]
+
+    if unseen:
+        print(f"Scraping {len(unseen)} unseen neighbors in batch...")
+        scraped = scraper.scrape_pages(unseen)
+        repository.save_pages_with_links(scraped)
+        for node, _ in scraped:
+            titles[node.page_id] = node.title
+
+    for target_id, _ in neighbors:
+        title = titles.get(target_id)
+        if title and title not in frontier.visited:
+            frontier.push(title, depth)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Scraper BFS da Wikipedia")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Em vez do BFS, atualiza apenas as páginas salvas que mudaram",
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        type=int,
+        const=0,
+        metavar="RUN_ID",
+        help="Continua a execução informada (ou a última não concluída)",
+    )
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Mostra o progresso das últimas execuções e sai",
+    )
+    args = parser.parse_args()
+
     print("Creating tables if not exist...")
     Base.metadata.create_all(bind=engine)
 
-    scraper = WikiScraper()
+    crawl_repository = CrawlRepository(SessionLocal)
+    if args.status:
+        for run in crawl_repository.list_runs():
+            print(run_progress(run))
+        return
+
+    cache = get_default_cache()
+    api = APIClient(cache=cache)
+    resolver = TitleResolver(api, store=TitleAliasRepository(SessionLocal))
+    scraper = WikiScraper(api, resolver=resolver)
     session = SessionLocal()
     repository = PageRepository(session)
 
-    start_page = "Filosofia"
-    max_depth = 3
-    max_neighbors = 1000  # Limit neighbors per page to avoid explosion
-
-    # Queue stores (title, depth)
-    queue = [(start_page, 0)]
-    visited_in_run = set()
+    if args.refresh:
+        try:
+            PageRefresher(repository, scraper).run()
+        finally:
+            session.close()
+        return
+
+    if args.resume is not None:
+        run = (
+            crawl_repository.get_run(args.resume)
+            if args.resume
+            else crawl_repository.get_latest_run(status="running")
+        )
+        if run is None:
+            print("No crawl run to resume.")
+            session.close()
+            return
+        frontier = PersistentFrontier(crawl_repository, run["id"])
+        print(f"Resuming run {run['id']}: {run_progress(run)}")
+    else:
+        start_page = "Filosofia"
+        max_depth = 3
+        max_neighbors = 1000  # Limit neighbors per page to avoid explosion
+        frontier = PersistentFrontier.start(
+            crawl_repository, start_page, max_depth, max_neighbors
+        )
 
     print(
-        f"Starting BFS scrape from: {start_page} (Max depth: {max_depth}, Max neighbors/page: {max_neighbors})"
+        f"Starting BFS scrape from: {frontier.seed_title} "
+        f"(Max depth: {frontier.max_depth}, "
+        f"Max neighbors/page: {frontier.max_neighbors}, run {frontier.run_id})"
     )
+    max_depth = frontier.max_depth
 
     try:
-        while queue:
-            print(f"Queue size: {len(queue)}")
-            current_title, current_depth = queue.pop(0)
+        while (entry := frontier.pop()) is not None:
+            print(f"Queue size: {frontier.queue_size}")
+            current_title, current_depth = entry
 
             if current_depth > max_depth:
                 continue
 
-            if current_title in visited_in_run:
+            if current_title in frontier.visited:
                 continue
-            visited_in_run.add(current_title)
+            frontier.mark_visited(current_title)
 
             # Check if already exists in DB (simple check by title)
-            existing = session.query(Page).filter(Page.title == current_title).first()
+            existing = repository.get_page_by_title(current_title)
             if existing:
                 print(
                     f"Skipping '{current_title}' (already in DB). Loading links for queue..."
                 )
                 if current_depth < max_depth:
-                    links = (
-                        session.query(Link)
-                        .filter(Link.source_page_id == existing.page_id)
-                        .all()
+                    # Vizinhos e seus títulos em uma consulta (links JOIN pages)
+                    neighbors = repository.get_neighbors_with_titles(
+                        [existing["page_id"]], frontier.max_neighbors
+                    )
+                    enqueue_neighbors(
+                        repository, scraper, neighbors, current_depth + 1, frontier
                     )
-
-                    added_count = 0
-                    for link in links:
-                        if added_count >= max_neighbors:
-                            break
-                        # Buscar a página alvo pelo ID para obter o título
-                        target_page = (
-                            session.query(Page)
-                            .filter(Page.page_id == link.target_page_id)
-                            .first()
-                        )
-                        if target_page and target_page.title not in visited_in_run:
-                            queue.append((target_page.title, current_depth + 1))
-                            added_count += 1
                 continue
 
             try:
                 print(f"\n--- Scraping [Depth {current_depth}]: {current_title} ---")
                 node, edges = scraper.scrape_page(current_title)
 
-                existing_by_id = (
-                    session.query(Page).filter(Page.page_id == node.page_id).first()
-                )
+                existing_by_id = repository.get_page_by_id(node.page_id)
                 if existing_by_id:
                     print(
                         f"Page '{node.title}' (ID: {node.page_id}) already in DB. Updating..."
@@ -86,23 +153,27 @@ def main():
 
                 repository.save_page_with_links(node, edges)
                 if current_depth < max_depth:
-                    added_count = 0
-                    for edge in edges:
-                        if added_count >= max_neighbors:
-                            break
-                        target_page = (
-                            session.query(Page)
-                            .filter(Page.page_id == edge.target_page_id)
-                            .first()
-                        )
-                        if target_page and target_page.title not in visited_in_run:
-                            queue.append((target_page.title, current_depth + 1))
-                            added_count += 1
+                    target_ids = list(dict.fromkeys(e.target_page_id for e in edges))
+                    target_ids = target_ids[: frontier.max_neighbors]
+                    titles = repository.get_titles_by_ids(target_ids)
+                    enqueue_neighbors(
+                        repository,
+                        scraper,
+                        [(target_id, titles.get(target_id)) for target_id in target_ids],
+                        current_depth + 1,
+                        frontier,
+                    )
 
             except Exception as e:
                 print(f"Error scraping '{current_title}': {e}")
+
+        frontier.finish()
+        print(f"Crawl finished: {frontier.progress()}")
     finally:
         session.close()
+        if cache is not None:
+            print(f"API cache: {cache.stats()}")
+        print(f"Title resolver: {resolver.stats}")
 
 
 if __name__ == "__main__":
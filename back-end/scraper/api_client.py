@@ -1,21 +1,97 @@
+import time
+from email.utils import parsedate_to_datetime
+
 import requests
-from config.settings import WIKI_API, USER_AGENT
+from config.settings import WIKI_API, USER_AGENT, API_MAXLAG, API_MAX_RETRIES
+from scraper.rate_limiter import get_default_rate_limiter
+
+# Read-only actions, safe to send again after a failure
+IDEMPOTENT_ACTIONS = {"query", "parse"}
+# HTTP statuses and API error codes meaning "slow down and try again"
+THROTTLE_STATUS = {429, 503}
+THROTTLE_ERRORS = {"maxlag", "ratelimited"}
 
 
 class APIClient:
 
-    def __init__(self, session=None):
+    def __init__(
+        self, session=None, api_url: str = WIKI_API, cache=None, rate_limiter=None
+    ):
         self.session = session or requests.Session()
+        self.api_url = api_url
+        self.cache = cache
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.maxlag = API_MAXLAG
+        self.max_retries = API_MAX_RETRIES
         self.session.headers.update({"User-Agent": USER_AGENT})
+        # HTTP requests sent and response bytes received by this client
+        self.stats = {"requests": 0, "bytes": 0}
         print("[APIClient] Session initialized.")
 
-    def call_api(self, params: dict):
+    def call_api(self, params: dict, use_cache: bool = True):
         print(f"[APIClient] Calling API with params: {params}")
         params["format"] = "json"
-        r = self.session.get(WIKI_API, params=params)
-        print(f"[APIClient] HTTP {r.status_code}")
-        r.raise_for_status()
-        return r.json()
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            cached = cache.get(params)
+            if cached is not None:
+                print("[APIClient] Cache hit")
+                return cached
+
+        retries = self.max_retries if params.get("action") in IDEMPOTENT_ACTIONS else 0
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                r = self.session.get(
+                    self.api_url, params={**params, "maxlag": self.maxlag}
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == retries:
+                    raise
+                print(f"[APIClient] {e}; retrying ({attempt + 1}/{retries})")
+                self.rate_limiter.backoff(attempt)
+                continue
+
+            print(f"[APIClient] HTTP {r.status_code}")
+            self.stats["requests"] += 1
+            self.stats["bytes"] += len(r.content)
+
+            if r.status_code in THROTTLE_STATUS:
+                self.rate_limiter.on_throttle(self._retry_after(r))
+                if attempt < retries:
+                    print(f"[APIClient] Throttled; retrying ({attempt + 1}/{retries})")
+                    self.rate_limiter.backoff(attempt)
+                    continue
+            r.raise_for_status()
+            data = r.json()
+
+            # MediaWiki reports errors (maxlag, badtitle, ...) with HTTP 200
+            error = data.get("error", {}).get("code")
+            if error in THROTTLE_ERRORS:
+                self.rate_limiter.on_throttle(self._retry_after(r))
+                if attempt < retries:
+                    print(f"[APIClient] {error}; retrying ({attempt + 1}/{retries})")
+                    self.rate_limiter.backoff(attempt)
+                    continue
+                raise RuntimeError(f"API request throttled: {error}")
+
+            self.rate_limiter.on_success()
+            if cache is not None and "error" not in data:
+                cache.put(params, r.content)
+            return data
+
+    @staticmethod
+    def _retry_after(response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
 
     def resolve_title(self, title):
         print(f"[APIClient] Resolving title: {title}")
@@ -30,6 +106,39 @@ class APIClient:
         )
         return page["pageid"], page["title"]
 
+    def query_all(self, params: dict, use_cache: bool = True) -> dict:
+        """
+        Runs an action=query request following `continue` until the result is
+        complete, merging the per-page lists (contributors, revisions, ...).
+        """
+        merged_pages = {}
+        merged = {"query": {"pages": merged_pages}}
+        continue_params = {}
+
+        while True:
+            data = self.call_api({**params, **continue_params}, use_cache=use_cache)
+            query = data.get("query", {})
+
+            for key, value in query.items():
+                if key == "pages":
+                    continue
+                if isinstance(value, list):
+                    merged["query"].setdefault(key, []).extend(value)
+                else:
+                    merged["query"][key] = value
+
+            for key, page in query.get("pages", {}).items():
+                target = merged_pages.setdefault(key, {})
+                for field, value in page.items():
+                    if isinstance(value, list):
+                        target.setdefault(field, []).extend(value)
+                    else:
+                        target[field] = value
+
+            if "continue" not in data:
+                return merged
+            continue_params = data["continue"]
+
     def fetch_metadata(self, page_id=None, title=None):
         print(f"[APIClient] Fetching metadata for page_id={page_id} or title={title}")
         params = {
@@ -37,6 +146,7 @@ class APIClient:
             "prop": "info|contributors|revisions",
             "inprop": "url",
             "rvprop": "ids",
+            "pclimit": "max",
         }
         if page_id:
             params["pageids"] = page_id
@@ -46,9 +156,81 @@ class APIClient:
         else:
             raise ValueError("Must provide page_id or title")
 
-        return self.call_api(params)
+        return self.query_all(params)
 
-    def resolve_titles_batch(self, titles: list[str]):
+    def fetch_metadata_batch(
+        self, page_ids: list[int], use_cache: bool = True
+    ) -> dict[int, dict]:
+        """
+        Fetches info/contributors/revisions for many pages, 50 ids per query.
+        Returns {page_id: page_data}; missing pages are left out. With
+        use_cache=False the live revision is fetched, not a cached answer.
+        """
+        results = {}
+        unique_ids = list(dict.fromkeys(page_ids))
+        chunk_size = 50
+
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i : i + chunk_size]
+            print(f"[APIClient] Fetching metadata batch of {len(chunk)} pages...")
+            data = self.query_all(
+                {
+                    "action": "query",
+                    "pageids": "|".join(str(page_id) for page_id in chunk),
+                    "prop": "info|contributors|revisions",
+                    "inprop": "url",
+                    "rvprop": "ids",
+                    "pclimit": "max",
+                },
+                use_cache=use_cache,
+            )
+            for page in data["query"]["pages"].values():
+                if "missing" in page or "pageid" not in page:
+                    continue
+                results[page["pageid"]] = page
+
+        return results
+
+    def fetch_page_info_batch(
+        self, page_ids: list[int], missing: set | None = None
+    ) -> dict[int, dict]:
+        """
+        Current revision of many pages (prop=info only: lastrevid, touched),
+        50 ids per query. Returns {page_id: page_info}; if `missing` is given,
+        ids the API reported as missing (deleted pages) are added to it.
+        """
+        results = {}
+        unique_ids = list(dict.fromkeys(page_ids))
+        chunk_size = 50
+
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i : i + chunk_size]
+            print(f"[APIClient] Fetching revision info of {len(chunk)} pages...")
+            data = self.call_api(
+                {
+                    "action": "query",
+                    "pageids": "|".join(str(page_id) for page_id in chunk),
+                    "prop": "info",
+                },
+                # The point is to see the live revision: never answer from cache
+                use_cache=False,
+            )
+            for page in data.get("query", {}).get("pages", {}).values():
+                if "missing" in page or "pageid" not in page:
+                    if missing is not None and "pageid" in page:
+                        missing.add(page["pageid"])
+                    continue
+                results[page["pageid"]] = page
+
+        return results
+
+    def resolve_titles_batch(self, titles: list[str], missing: set | None = None):
+        """
+        Resolves titles (following normalization and redirects) to
+        {input_title: (page_id, final_title)}. If `missing` is given, inputs
+        the API reported as missing, invalid or interwiki are added to it;
+        titles of chunks that failed are in neither.
+        """
         results = {}
         # Remove duplicates to save bandwidth
         unique_titles = list(set(titles))
@@ -105,6 +287,10 @@ class APIClient:
 
                 # Now name_tracker maps Final Title -> List of Original Input Titles
 
+                if missing is not None:
+                    for iw in query.get("interwiki", []):
+                        missing.update(name_tracker.get(iw["title"], []))
+
                 # Process pages
                 pages = query.get("pages", {})
                 for page in pages.values():
@@ -114,6 +300,8 @@ class APIClient:
                             print(
                                 f"[APIClient] Page '{page.get('title')}' is missing or invalid"
                             )
+                            if missing is not None:
+                                missing.update(name_tracker.get(page["title"], []))
                         continue
 
                     page_id = page["pageid"]
@@ -130,8 +318,76 @@ class APIClient:
 
         return results
 
-    def fetch_html(self, page_id):
-        print(f"[APIClient] Fetching HTML for page_id={page_id}")
-        data = self.call_api({"action": "parse", "pageid": page_id, "prop": "text"})
+    def fetch_html(self, page_id, revid=None):
+        print(f"[APIClient] Fetching HTML for page_id={page_id} revid={revid}")
+        # Pinning the revision makes the response immutable (and cacheable forever)
+        if revid:
+            params = {"action": "parse", "oldid": revid, "prop": "text"}
+        else:
+            params = {"action": "parse", "pageid": page_id, "prop": "text"}
+        data = self.call_api(params)
         print(f"[APIClient] HTML received ({len(data['parse']['text']['*'])} chars).")
         return data["parse"]["text"]["*"]
+
+    def fetch_links_batch(
+        self, page_ids: list[int], use_cache: bool = True
+    ) -> dict[int, list[int]]:
+        """
+        Outgoing article links (namespace 0) of many pages, as page ids,
+        without downloading HTML. Per chunk of 50 sources:
+          - prop=links lists the target titles of each source page;
+          - generator=links (with redirects) maps those titles to page ids.
+        Both follow `continue` (plcontinue / gplcontinue).
+        Red links are dropped. Returns {source_page_id: [target_page_id, ...]}.
+        use_cache=False skips the response cache, as in fetch_metadata_batch.
+        """
+        results = {}
+        unique_ids = list(dict.fromkeys(page_ids))
+        chunk_size = 50
+
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i : i + chunk_size]
+            pageids = "|".join(str(page_id) for page_id in chunk)
+            print(f"[APIClient] Fetching links of {len(chunk)} pages...")
+
+            sources = self.query_all(
+                {
+                    "action": "query",
+                    "pageids": pageids,
+                    "prop": "links",
+                    "plnamespace": 0,
+                    "pllimit": "max",
+                },
+                use_cache=use_cache,
+            )["query"]
+            targets = self.query_all(
+                {
+                    "action": "query",
+                    "pageids": pageids,
+                    "generator": "links",
+                    "gplnamespace": 0,
+                    "gpllimit": "max",
+                    "redirects": 1,
+                },
+                use_cache=use_cache,
+            )["query"]
+
+            title_to_id = {
+                page["title"]: page["pageid"]
+                for page in targets.get("pages", {}).values()
+                if "missing" not in page and "pageid" in page
+            }
+            for r in targets.get("redirects", []):
+                if r["to"] in title_to_id:
+                    title_to_id[r["from"]] = title_to_id[r["to"]]
+
+            for page in sources.get("pages", {}).values():
+                if "missing" in page or "pageid" not in page:
+                    continue
+                results[page["pageid"]] = [
+                    title_to_id[link["title"]]
+                    for link in page.get("links", [])
+                    if link["title"] in title_to_id
+                ]
+
+        return results
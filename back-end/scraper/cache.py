@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from config.settings import (
+    API_CACHE_ENABLED,
+    API_CACHE_MAX_BYTES,
+    API_CACHE_PATH,
+    API_CACHE_TTLS,
+)
+
+
+class ResponseCache:
+    """
+    Persistent, content-addressed cache of MediaWiki API responses.
+
+    Entries are keyed by the SHA-256 of the normalized request params and
+    stored zlib-compressed in a SQLite file. Each action has its own TTL;
+    `action=parse` requests pinned to a revision (`oldid`) never expire,
+    since the rendered text of a revision is immutable. When the stored
+    size goes over `max_bytes`, least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str = API_CACHE_PATH,
+        max_bytes: int = API_CACHE_MAX_BYTES,
+        ttls: dict | None = None,
+        clock=time.time,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else API_CACHE_TTLS
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, action TEXT, body BLOB, size INTEGER,"
+            " created REAL, accessed REAL, expires REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def key_for(params: dict) -> str:
+        normalized = json.dumps(
+            {str(k): str(v) for k, v in params.items()}, sort_keys=True
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, params: dict) -> float | None:
+        """Seconds an entry stays valid, or None for entries that never expire."""
+        action = params.get("action", "query")
+        if action == "parse" and "oldid" in params:
+            return None
+        return self.ttls.get(action, self.ttls.get("query"))
+
+    def get(self, params: dict) -> dict | None:
+        key = self.key_for(params)
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, size, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            body, size, expires = row
+            if expires is not None and expires <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total_bytes -= size
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(zlib.decompress(body))
+
+    def put(self, params: dict, content: bytes) -> None:
+        key = self.key_for(params)
+        body = zlib.compress(content)
+        now = self.clock()
+        ttl = self.ttl_for(params)
+        expires = None if ttl is None else now + ttl
+
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, action, body, size, created, accessed, expires)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, params.get("action"), body, len(body), now, now, expires),
+            )
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self._total_bytes,
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache | None:
+    """Process-wide cache shared by every APIClient, or None if disabled."""
+    global _default_cache
+    if not API_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
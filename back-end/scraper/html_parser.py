@@ -1,26 +1,101 @@
-from bs4 import BeautifulSoup
+import html
+import re
 from urllib.parse import unquote
 
+# Start tag attributes: quoted values may contain ">"
+_ATTRS = r"""((?:[^>"']|"[^"]*"|'[^']*')*)"""
+
+# Top-level scan: comments and raw-text elements are skipped, like the
+# html.parser tree builder does; <a ...> start tags are captured.
+_SCAN = re.compile(
+    r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|<a(?=[\s/>])" + _ATTRS + ">",
+    re.IGNORECASE | re.DOTALL,
+)
+# Comments and raw-text elements, whose text is not part of get_text()
+# (no capturing groups: also used inside _MARKUP, with split)
+_SKIPPED = r"<!--.*?-->|(?i:<script\b.*?</script\s*>|<style\b.*?</style\s*>)"
+# Inside an anchor: nested <a> / </a> change the depth
+_ANCHOR_BOUNDARY = re.compile(
+    _SKIPPED + r"|<(a)(?=[\s/>])" + _ATTRS + r">|</a\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Any markup between two text nodes, skipped blocks included
+_MARKUP = re.compile(
+    _SKIPPED + r"""|</?[a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>|<![^>]*>|<\?[^>]*>""",
+    re.DOTALL,
+)
+_HREF = re.compile(
+    r"""(?:^|\s)href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""",
+    re.IGNORECASE,
+)
+
 
 class HTMLParser:
+    """
+    Extracts internal links without building a DOM.
 
-    def extract_links(self, html: str):
-        print(f"[HTMLParser] Parsing HTML ({len(html)} chars)")
-        soup = BeautifulSoup(html, "html.parser")
+    A regex scanner over the raw HTML replaces the previous
+    BeautifulSoup("html.parser") tree and returns the same
+    (decoded_title, anchor_lower) tuples: href and text are entity-decoded,
+    the text is the concatenation of the stripped text nodes inside the
+    anchor (nested tags included), as `get_text(strip=True)` does.
+    """
+
+    def extract_links(self, html_text: str):
+        print(f"[HTMLParser] Parsing HTML ({len(html_text)} chars)")
         links = []
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
-            print(f"  [HTMLParser] Found <a>: href='{href}' text='{text}'")
+        for match in _SCAN.finditer(html_text):
+            attrs = match.group(2)
+            if attrs is None:
+                continue  # comment / script / style
+
+            href = self._href(attrs)
+            if href is None or not href.startswith("/wiki/"):
+                continue
 
-            if href.startswith("/wiki/"):
-                title = href.replace("/wiki/", "")
-                decoded = unquote(title)
-                links.append((decoded, text.lower()))
-                print(
-                    f"    [HTMLParser] Internal link → title='{decoded}' anchor='{text.lower()}'"
-                )
+            if attrs.rstrip().endswith("/"):
+                text = ""  # <a href="..."/>
+            else:
+                text = self._anchor_text(html_text, match.end())
+
+            title = href.replace("/wiki/", "")
+            links.append((unquote(title), text.lower()))
 
         print(f"[HTMLParser] Extracted {len(links)} links.")
         return links
+
+    def _href(self, attrs: str) -> str | None:
+        found = None
+        # The last duplicated attribute wins, as in the tree builder
+        for m in _HREF.finditer(attrs):
+            found = m.group(1) if m.group(1) is not None else m.group(2)
+            if found is None:
+                found = m.group(3)
+        return html.unescape(found) if found is not None else None
+
+    def _anchor_text(self, html_text: str, start: int) -> str:
+        depth = 1
+        end = len(html_text)
+        for m in _ANCHOR_BOUNDARY.finditer(html_text, start):
+            if m.group(1) is None and not m.group(0).startswith("</"):
+                continue  # comment / script / style
+            if m.group(1) is not None:
+                if not m.group(2).rstrip().endswith("/"):
+                    depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                end = m.start()
+                break
+
+        parts = []
+        for segment in _MARKUP.split(html_text[start:end]):
+            if not segment:
+                continue
+            if "&" in segment:
+                segment = html.unescape(segment)
+            segment = segment.strip()
+            if segment:
+                parts.append(segment)
+        return "".join(parts)
@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+from collections import deque
+
+from config.settings import (
+    API_BACKOFF_BASE,
+    API_BACKOFF_CAP,
+    API_BURST,
+    API_MAX_RATE,
+    API_MIN_RATE,
+)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread/task that talks to the API.
+
+    The refill rate adapts AIMD-style: each successful request raises it a
+    little (up to `max_rate`), each throttling answer (429/503/maxlag)
+    halves it (down to `min_rate`) and pauses all callers for the
+    Retry-After the server asked for.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = API_MAX_RATE,
+        burst: float = API_BURST,
+        min_rate: float = API_MIN_RATE,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        window: float = 60.0,
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.window = window
+        self.increase = max_rate / 50
+
+        self._rate = max_rate
+        self._tokens = burst
+        self._last = clock()
+        self._paused_until = 0.0
+        self._completed = deque()
+        self._lock = threading.Lock()
+        self.throttled = 0
+        self.retries = 0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self._rate
+            self.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            now = self.clock()
+            self._rate = min(self.max_rate, self._rate + self.increase)
+            self._completed.append(now)
+            while self._completed and self._completed[0] < now - self.window:
+                self._completed.popleft()
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = self.clock()
+            self._rate = max(self.min_rate, self._rate / 2)
+            self._tokens = 0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self.throttled += 1
+
+    def backoff(self, attempt: int) -> None:
+        """Sleeps before retry number `attempt` (exponential, full jitter)."""
+        with self._lock:
+            self.retries += 1
+        delay = min(API_BACKOFF_CAP, API_BACKOFF_BASE * 2**attempt)
+        self.sleep(random.uniform(0, delay))
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = self.clock()
+            recent = [t for t in self._completed if t >= now - self.window]
+            span = min(self.window, now - recent[0]) if recent else 0.0
+            return {
+                "current_rate": self._rate,
+                "max_rate": self.max_rate,
+                "sustained_rate": len(recent) / span if span > 0 else 0.0,
+                "paused_for": max(0.0, self._paused_until - now),
+                "throttled": self.throttled,
+                "retries": self.retries,
+            }
+
+
+_default_limiter = RateLimiter()
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    """Limiter shared by every APIClient of the process."""
+    return _default_limiter
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import TITLE_CACHE_SIZE, TITLE_MISSING_TTL
+from utils.clean import normalize_title
+
+# (page_id, resolved_title); (None, None) marks a title the API reported missing
+MISSING = (None, None)
+
+
+class TitleLRU:
+    """
+    Thread-safe in-process LRU of link title → (page_id, resolved_title).
+
+    MISSING entries expire after `missing_ttl` seconds: a red link may be
+    created later, so the title has to be asked again.
+    """
+
+    def __init__(
+        self, max_size: int = TITLE_CACHE_SIZE, missing_ttl: float = TITLE_MISSING_TTL
+    ):
+        self.max_size = max_size
+        self.missing_ttl = missing_ttl
+        # title → (value, expiry on time.monotonic(), None for found titles)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, titles: list[str]) -> dict:
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for title in titles:
+                if title in self._entries:
+                    value, expires = self._entries[title]
+                    if expires is not None and expires <= now:
+                        del self._entries[title]
+                        continue
+                    self._entries.move_to_end(title)
+                    found[title] = value
+        return found
+
+    def put_many(self, entries: dict) -> None:
+        expires = time.monotonic() + self.missing_ttl
+        with self._lock:
+            for title, value in entries.items():
+                self._entries[title] = (value, expires if value == MISSING else None)
+                self._entries.move_to_end(title)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TitleResolver:
+    """
+    Resolves link titles to page ids in three levels: the in-memory LRU,
+    then the database (title_aliases and the titles already in `pages`),
+    and only then the API. API answers are written back to the LRU and, in
+    bulk, to title_aliases; missing titles only go to the LRU, with a TTL.
+    """
+
+    def __init__(self, api, store=None, cache: TitleLRU | None = None):
+        self.api = api
+        self.store = store
+        self.cache = cache if cache is not None else TitleLRU()
+        self.stats = {"lru_hits": 0, "db_hits": 0, "api_resolved": 0}
+
+    def resolve(self, titles: list[str]) -> dict[str, tuple[int, str]]:
+        """Same contract as APIClient.resolve_titles_batch: only found titles."""
+        unique = list(dict.fromkeys(titles))
+
+        known = self.cache.get_many(unique)
+        self.stats["lru_hits"] += len(known)
+        pending = [t for t in unique if t not in known]
+
+        if pending and self.store is not None:
+            from_db = self._lookup_store(pending)
+            self.stats["db_hits"] += len(from_db)
+            self.cache.put_many(from_db)
+            known.update(from_db)
+            pending = [t for t in pending if t not in known]
+
+        if pending:
+            print(f"[TitleResolver] {len(pending)}/{len(unique)} titles sent to API")
+            missing = set()
+            found = self.api.resolve_titles_batch(pending, missing=missing)
+            resolved = {**{t: MISSING for t in missing}, **found}
+            self.stats["api_resolved"] += len(resolved)
+            self.cache.put_many(resolved)
+            known.update(resolved)
+            if self.store is not None:
+                try:
+                    self.store.save_many(found)
+                except Exception as e:
+                    print(f"[TitleResolver] Error saving aliases: {e}")
+
+        return {t: v for t, v in known.items() if v[0] is not None}
+
+    def _lookup_store(self, titles: list[str]) -> dict:
+        try:
+            found = self.store.get_many(titles)
+
+            # Canonical titles of crawled pages need no alias row
+            candidates = {}
+            for title in titles:
+                if title not in found:
+                    canonical = normalize_title(title)
+                    canonical = canonical[:1].upper() + canonical[1:]
+                    candidates.setdefault(canonical, []).append(title)
+            if candidates:
+                pages = self.store.get_pages_by_titles(list(candidates))
+                for canonical, page_id in pages.items():
+                    for title in candidates[canonical]:
+                        found[title] = (page_id, canonical)
+            return found
+        except Exception as e:
+            print(f"[TitleResolver] Error reading aliases: {e}")
+            return {}
+
+
+_shared_cache = TitleLRU()
+
+
+def get_shared_title_cache() -> TitleLRU:
+    """LRU shared by every resolver of the process."""
+    return _shared_cache
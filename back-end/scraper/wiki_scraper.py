@@ -1,45 +1,45 @@
 from scraper.api_client import APIClient
 from scraper.html_parser import HTMLParser
+from scraper.title_resolver import TitleResolver
 from models.graph_objects import PageBase, LinkBase
+from config.settings import SCRAPER_MODE
+
+# Full rendered HTML per page: slower, keeps the anchor text of every link
+MODE_HTML = "html"
+# prop=links batched across pages: no HTML download, no anchor text
+MODE_LINKS = "links"
 
 
 class WikiScraper:
 
-    def __init__(self, api_client=None):
+    def __init__(self, api_client=None, mode: str = SCRAPER_MODE, resolver=None):
+        if mode not in (MODE_HTML, MODE_LINKS):
+            raise ValueError(f"Unknown scraper mode: {mode}")
         self.api = api_client or APIClient()
+        self.resolver = resolver or TitleResolver(self.api)
         self.parser = HTMLParser()
-        print("[WikiScraper] Initialized.")
+        self.mode = mode
+        print(f"[WikiScraper] Initialized ({mode} mode).")
 
-    def scrape_page(self, title: str = None, page_id: int = None):
-        print(f"[WikiScraper] Scraping page: '{title}'")
-
-        # 1 metadata (and resolve title or page_id)
-        metadata = self.api.fetch_metadata(title=title, page_id=page_id)
-
-        # Extract page data
-        pages_dict = metadata["query"]["pages"]
-        page_data = next(iter(pages_dict.values()))
-
-        if "missing" in page_data:
-            raise ValueError(f"Página '{title}' não encontrada")
-
-        page_id = page_data["pageid"]
-        resolved_title = page_data["title"]
-
-        node = PageBase(
-            page_id=page_id,
-            title=resolved_title,
+    def _build_node(self, page_data: dict) -> PageBase:
+        return PageBase(
+            page_id=page_data["pageid"],
+            title=page_data["title"],
             url=page_data["fullurl"],
             length_chars=page_data.get("length", 0),
             num_editors=len(page_data.get("contributors", [])),
             num_revisions=len(page_data.get("revisions", [])),
             links_out_count=0,
+            lastrevid=page_data.get("lastrevid"),
+            touched=page_data.get("touched"),
         )
 
-        print(f"[WikiScraper] Node created: {node}")
+    def scrape_links(self, page_id: int, revid: int = None) -> list[LinkBase]:
+        if self.mode == MODE_LINKS:
+            return self.scrape_links_batch([page_id]).get(page_id, [])
 
         # 3 HTML
-        html = self.api.fetch_html(page_id)
+        html = self.api.fetch_html(page_id, revid=revid)
 
         # 4 parse links
         extracted = self.parser.extract_links(html)
@@ -47,7 +47,7 @@ class WikiScraper:
 
         # Batch resolve all target titles
         target_titles = [t for t, _ in extracted]
-        resolved_map = self.api.resolve_titles_batch(target_titles)
+        resolved_map = self.resolver.resolve(target_titles)
 
         edges = []
         for target_title, anchor in extracted:
@@ -61,8 +61,83 @@ class WikiScraper:
                 edges.append(edge)
             # else: page missing or error, skip
 
+        return edges
+
+    def scrape_links_batch(
+        self, page_ids: list[int], use_cache: bool = True
+    ) -> dict[int, list[LinkBase]]:
+        """Links of many pages from the API link tables (links-only mode)."""
+        links = self.api.fetch_links_batch(page_ids, use_cache=use_cache)
+        return {
+            source_id: [
+                LinkBase(source_page_id=source_id, target_page_id=target_id)
+                for target_id in target_ids
+            ]
+            for source_id, target_ids in links.items()
+        }
+
+    def scrape_page(self, title: str = None, page_id: int = None):
+        print(f"[WikiScraper] Scraping page: '{title}'")
+
+        # 1 metadata (and resolve title or page_id)
+        metadata = self.api.fetch_metadata(title=title, page_id=page_id)
+
+        # Extract page data
+        pages_dict = metadata["query"]["pages"]
+        page_data = next(iter(pages_dict.values()))
+
+        if "missing" in page_data:
+            raise ValueError(f"Página '{title}' não encontrada")
+
+        node = self._build_node(page_data)
+
+        print(f"[WikiScraper] Node created: {node}")
+
+        edges = self.scrape_links(node.page_id, revid=node.lastrevid)
         node.links_out_count = len(edges)
 
         print(f"[WikiScraper] Final: {len(edges)} edges")
 
         return node, edges
+
+    def scrape_nodes(
+        self, page_ids: list[int], use_cache: bool = True
+    ) -> list[PageBase]:
+        """Builds the nodes of many pages from batched metadata queries (no links)."""
+        metadata = self.api.fetch_metadata_batch(page_ids, use_cache=use_cache)
+        nodes = [
+            self._build_node(metadata[pid])
+            for pid in dict.fromkeys(page_ids)
+            if pid in metadata
+        ]
+        print(f"[WikiScraper] {len(nodes)}/{len(page_ids)} nodes created from batch")
+        return nodes
+
+    def scrape_pages(
+        self, page_ids: list[int], use_cache: bool = True
+    ) -> list[tuple[PageBase, list[LinkBase]]]:
+        """
+        Batch version of scrape_page: metadata in chunks of 50, then links
+        per page (HTML mode) or in chunks of 50 as well (links mode).
+
+        use_cache=False reads metadata and link tables live (refresh of
+        pages known to have changed). The HTML parse needs no bypass: it is
+        pinned to the lastrevid of the fresh metadata.
+        """
+        nodes = self.scrape_nodes(page_ids, use_cache=use_cache)
+        if self.mode == MODE_LINKS:
+            links = self.scrape_links_batch(
+                [node.page_id for node in nodes], use_cache=use_cache
+            )
+        else:
+            links = {}
+
+        results = []
+        for node in nodes:
+            if self.mode == MODE_LINKS:
+                edges = links.get(node.page_id, [])
+            else:
+                edges = self.scrape_links(node.page_id, revid=node.lastrevid)
+            node.links_out_count = len(edges)
+            results.append((node, edges))
+        return results
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from typing import Callable
+
+from config.settings import CRAWLER_MAX_CONCURRENCY
+from scraper.wiki_scraper import MODE_HTML, MODE_LINKS
+
+# Limite de page_ids por consulta da API do MediaWiki
+BATCH_SIZE = 50
+
+
+class AsyncBFSCrawler:
+    """
+    BFS sincronizado por nível: todas as páginas de um nível da fronteira são
+    baixadas concorrentemente (até `max_concurrency` requisições em voo).
+
+    O scraper continua síncrono (requests), então cada chamada roda em uma
+    thread via `asyncio.to_thread`. O repositório é assíncrono
+    (AsyncPageRepository) e é usado em sequência, no loop de eventos, porque
+    a sessão não aceita operações concorrentes.
+    """
+
+    def __init__(
+        self,
+        repository,
+        scraper,
+        max_concurrency: int = CRAWLER_MAX_CONCURRENCY,
+        skip_title: Callable[[str], bool] | None = None,
+    ):
+        self.repository = repository
+        self.scraper = scraper
+        self.max_concurrency = max(1, max_concurrency)
+        self.skip_title = skip_title or (lambda title: False)
+
+    def run(self, seed_title: str, max_depth: int, max_neighbors: int = 50) -> set[int]:
+        """Executa o BFS em um loop de eventos próprio e retorna os page_ids visitados."""
+        return asyncio.run(self.crawl(seed_title, max_depth, max_neighbors))
+
+    async def crawl(
+        self, seed_title: str, max_depth: int, max_neighbors: int = 50
+    ) -> set[int]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        visited_titles = set()
+        visited_ids = set()
+        frontier = [seed_title]
+
+        for depth in range(max_depth + 1):
+            level_titles = []
+            for title in frontier:
+                if title in visited_titles:
+                    continue
+                # Pular páginas de ano
+                if self.skip_title(title):
+                    logging.warning(f"[BFS] Ignorando página de ano: '{title}'")
+                    continue
+                visited_titles.add(title)
+                level_titles.append(title)
+
+            if not level_titles:
+                break
+
+            logging.info(f"[BFS] Nível {depth}: {len(level_titles)} páginas")
+            level_ids = await self._resolve_titles(semaphore, level_titles, depth)
+            visited_ids.update(level_ids)
+
+            if depth == max_depth:
+                break
+
+            frontier = await self._expand(
+                semaphore, level_ids, max_neighbors, visited_titles
+            )
+
+        return visited_ids
+
+    async def scrape_missing(self, page_ids: list[int]) -> list[int]:
+        """
+        Baixa e salva páginas que ainda não estão no banco (a fronteira de uma
+        vizinhança já quase toda em cache). Retorna os page_ids salvos.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        scraped = await self._scrape_ids(semaphore, page_ids)
+        await self.repository.save_pages_with_links(scraped)
+        return [node.page_id for node, _ in scraped]
+
+    async def _fetch(self, semaphore: asyncio.Semaphore, fn, *args, **kwargs):
+        async with semaphore:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _scrape_ids(
+        self, semaphore: asyncio.Semaphore, page_ids: list[int]
+    ) -> list[tuple]:
+        """
+        Faz scraping de vários page_ids: metadados em lotes de 50
+        (`scrape_nodes`) e links de cada página em paralelo. No modo
+        links-only os links também vêm em lote (`scrape_pages`).
+        """
+        chunks = [
+            page_ids[i : i + BATCH_SIZE] for i in range(0, len(page_ids), BATCH_SIZE)
+        ]
+        if getattr(self.scraper, "mode", MODE_HTML) == MODE_LINKS:
+            return await self._scrape_chunks(semaphore, chunks)
+
+        batches = await asyncio.gather(
+            *(
+                self._fetch(semaphore, self.scraper.scrape_nodes, chunk)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        nodes = []
+        for chunk, batch in zip(chunks, batches):
+            if isinstance(batch, Exception):
+                logging.error(f"[BFS] Erro ao buscar metadados de {chunk}: {batch}")
+                continue
+            nodes.extend(batch)
+
+        results = await asyncio.gather(
+            *(
+                self._fetch(
+                    semaphore, self.scraper.scrape_links, n.page_id, revid=n.lastrevid
+                )
+                for n in nodes
+            ),
+            return_exceptions=True,
+        )
+        scraped = []
+        for node, edges in zip(nodes, results):
+            if isinstance(edges, Exception):
+                logging.error(
+                    f"[BFS] Erro ao extrair links de '{node.title}' ({node.page_id}): {edges}"
+                )
+                continue
+            node.links_out_count = len(edges)
+            scraped.append((node, edges))
+        return scraped
+
+    async def _scrape_chunks(
+        self, semaphore: asyncio.Semaphore, chunks: list[list[int]]
+    ) -> list[tuple]:
+        batches = await asyncio.gather(
+            *(
+                self._fetch(semaphore, self.scraper.scrape_pages, chunk)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        scraped = []
+        for chunk, batch in zip(chunks, batches):
+            if isinstance(batch, Exception):
+                logging.error(f"[BFS] Erro ao fazer scraping de {chunk}: {batch}")
+                continue
+            scraped.extend(batch)
+        return scraped
+
+    async def _resolve_titles(
+        self, semaphore: asyncio.Semaphore, titles: list[str], depth: int
+    ) -> list[int]:
+        """Converte os títulos do nível em page_ids, fazendo scraping dos ausentes."""
+        known = await self.repository.get_pages_by_titles(titles)
+        page_ids = [known[title] for title in titles if title in known]
+        missing = [title for title in titles if title not in known]
+        logging.info(f"[BFS] {len(page_ids)} páginas do nível já estão no banco")
+
+        if missing:
+            logging.info(f"[BFS] Scraping {len(missing)} páginas (depth {depth})...")
+            results = await asyncio.gather(
+                *(
+                    self._fetch(semaphore, self.scraper.scrape_page, title=title)
+                    for title in missing
+                ),
+                return_exceptions=True,
+            )
+            scraped = []
+            for title, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logging.error(
+                        f"[BFS] Erro ao fazer scraping de '{title}': {result}"
+                    )
+                    continue
+                scraped.append(result)
+
+            await self.repository.save_pages_with_links(scraped)
+            for node, _ in scraped:
+                page_ids.append(node.page_id)
+                logging.info(f"[BFS] Página salva: {node.title} (ID: {node.page_id})")
+
+        return page_ids
+
+    async def _expand(
+        self,
+        semaphore: asyncio.Semaphore,
+        page_ids: list[int],
+        max_neighbors: int,
+        visited_titles: set[str],
+    ) -> list[str]:
+        """
+        Monta a próxima fronteira com uma consulta (links JOIN pages) para o
+        nível inteiro; os vizinhos ausentes do banco são baixados em lote.
+        """
+        neighbors = await self.repository.get_neighbors_with_titles(
+            page_ids, max_neighbors
+        )
+        targets = {target_id: title for target_id, title in neighbors if title}
+        missing = [target_id for target_id, title in neighbors if not title]
+
+        if missing:
+            logging.info(f"[BFS] Scraping {len(missing)} vizinhos ausentes...")
+            scraped = await self._scrape_ids(semaphore, missing)
+            await self.repository.save_pages_with_links(scraped)
+            for node, _ in scraped:
+                targets[node.page_id] = node.title
+
+        return [
+            targets[target_id]
+            for target_id, _ in neighbors
+            if target_id in targets and targets[target_id] not in visited_titles
+        ]
@@ -0,0 +1,159 @@
+import time
+from collections import deque
+
+from config.settings import CRAWL_CHECKPOINT_EVERY
+
+# Entradas da fila lidas do banco por consulta
+READ_AHEAD = 500
+
+
+def run_progress(run: dict) -> dict:
+    """Progresso de uma execução a partir do último checkpoint (crawl_runs)."""
+    elapsed = run["elapsed_seconds"]
+    return {
+        "run_id": run["id"],
+        "status": run["status"],
+        "pages_done": run["pages_done"],
+        "queue_size": run["enqueued"] - run["dequeued"],
+        "elapsed_seconds": round(elapsed, 1),
+        "pages_per_min": (
+            round(run["pages_done"] / (elapsed / 60), 1) if elapsed else 0.0
+        ),
+    }
+
+
+class PersistentFrontier:
+    """
+    Fila FIFO do BFS gravada em crawl_frontier, com os visitados em
+    crawl_visited.
+
+    A fila só recebe inserts; desenfileirar é avançar um cursor (o id da
+    última entrada consumida), então cada `pop` é O(1), lendo do banco em
+    blocos de READ_AHEAD. Entradas novas e visitados ficam em memória até o
+    próximo checkpoint, que grava tudo junto com o cursor em uma transação,
+    a cada `checkpoint_every` páginas. O checkpoint só acontece no início de
+    um `pop`, quando a página anterior já terminou: retomar uma execução
+    (`PersistentFrontier(repository, run_id)`) recomeça exatamente do estado
+    do último checkpoint, refazendo no máximo `checkpoint_every` páginas.
+    """
+
+    def __init__(
+        self,
+        repository,
+        run_id: int,
+        checkpoint_every: int = CRAWL_CHECKPOINT_EVERY,
+        clock=time.monotonic,
+    ):
+        run = repository.get_run(run_id)
+        if run is None:
+            raise ValueError(f"Execução {run_id} não encontrada")
+
+        self.repository = repository
+        self.run_id = run_id
+        self.seed_title = run["seed_title"]
+        self.max_depth = run["max_depth"]
+        self.max_neighbors = run["max_neighbors"]
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.clock = clock
+
+        self.visited = repository.load_visited(run_id)
+        self.last_frontier_id = run["last_frontier_id"]
+        self.enqueued = run["enqueued"]
+        self.dequeued = run["dequeued"]
+        self.pages_done = run["pages_done"]
+        self.elapsed_seconds = run["elapsed_seconds"]
+
+        self._buffer = deque()
+        self._read_after = self.last_frontier_id
+        self._last_popped_id = self.last_frontier_id
+        self._pending = []
+        self._new_visited = []
+        self._since_checkpoint = 0
+        self._clock_mark = clock()
+
+    @classmethod
+    def start(
+        cls, repository, seed_title: str, max_depth: int, max_neighbors: int, **kwargs
+    ) -> "PersistentFrontier":
+        """Cria uma execução nova com a página semente na fila."""
+        run_id = repository.create_run(seed_title, max_depth, max_neighbors)
+        frontier = cls(repository, run_id, **kwargs)
+        frontier.push(seed_title, 0)
+        frontier.checkpoint()
+        return frontier
+
+    @property
+    def queue_size(self) -> int:
+        return self.enqueued + len(self._pending) - self.dequeued
+
+    def push(self, title: str, depth: int) -> None:
+        self._pending.append((title, depth))
+
+    def mark_visited(self, title: str) -> None:
+        self.visited.add(title)
+        self._new_visited.append(title)
+        self.pages_done += 1
+
+    def pop(self) -> tuple[str, int] | None:
+        """Próxima entrada (title, depth) da fila, ou None quando ela acaba."""
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+        if not self._buffer:
+            self._fill()
+            if not self._buffer and self._pending:
+                # Entradas novas só ganham id (e posição na fila) no checkpoint
+                self.checkpoint()
+                self._fill()
+        if not self._buffer:
+            return None
+
+        entry_id, title, depth = self._buffer.popleft()
+        self._last_popped_id = entry_id
+        self.dequeued += 1
+        self._since_checkpoint += 1
+        return title, depth
+
+    def _fill(self) -> None:
+        rows = self.repository.read_frontier(self.run_id, self._read_after, READ_AHEAD)
+        if rows:
+            self._buffer.extend(rows)
+            self._read_after = rows[-1][0]
+
+    def checkpoint(self) -> None:
+        now = self.clock()
+        self.elapsed_seconds += now - self._clock_mark
+        self._clock_mark = now
+
+        self.repository.checkpoint(
+            self.run_id,
+            self._last_popped_id,
+            self._pending,
+            self._new_visited,
+            self.dequeued,
+            self.pages_done,
+            self.elapsed_seconds,
+        )
+        self.enqueued += len(self._pending)
+        self.last_frontier_id = self._last_popped_id
+        self._pending = []
+        self._new_visited = []
+        self._since_checkpoint = 0
+        print(f"[Frontier] Checkpoint: {self.progress()}")
+
+    def progress(self) -> dict:
+        return run_progress(
+            {
+                "id": self.run_id,
+                "status": "running",
+                "pages_done": self.pages_done,
+                "enqueued": self.enqueued,
+                "dequeued": self.dequeued,
+                "elapsed_seconds": self.elapsed_seconds,
+            }
+        )
+
+    def finish(self) -> None:
+        """Último checkpoint; marca a execução como concluída."""
+        self.checkpoint()
+        self.repository.finish_run(self.run_id)
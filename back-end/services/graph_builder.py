@@ -1,5 +1,7 @@
+from typing import Iterable
+
 from db.repositories.page import PageRepository
-from models.graph_objects import PageBase, LinkBase
+from models.graph_objects import PageBase, LinkBase, GraphLink, GraphResponse
 
 
 def save_graph(repository: PageRepository, node: PageBase, edges: list[LinkBase]):
@@ -9,3 +11,26 @@ def save_graph(repository: PageRepository, node: PageBase, edges: list[LinkBase]
     """
     repository.save_page_with_links(node, edges)
     print("Página salva.")
+
+
+def assemble_graph(
+    pages: Iterable[tuple[int, str]], links: Iterable[tuple[int, int]]
+) -> GraphResponse:
+    """
+    Monta o GraphResponse a partir de (page_id, title) e (source, target),
+    consumindo cada iterável uma única vez: com os iteradores em streaming do
+    repositório, só o dicionário de títulos e a própria resposta ficam em
+    memória. Links com extremidade fora de `pages` são descartados.
+    """
+    id_to_title = {}
+    nodes = []
+    for page_id, title in pages:
+        id_to_title[page_id] = title
+        nodes.append(title)
+
+    graph_links = [
+        GraphLink(source=id_to_title[source], target=id_to_title[target])
+        for source, target in links
+        if source in id_to_title and target in id_to_title
+    ]
+    return GraphResponse(nodes=nodes, links=graph_links)
@@ -0,0 +1,405 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Iterable
+
+import numpy as np
+
+from config.settings import GRAPH_REFRESH_INTERVAL, GRAPH_SNAPSHOT_PATH
+
+# Cabeçalho do snapshot: magic, tamanho do JSON de metadados, JSON
+SNAPSHOT_MAGIC = b"WGCSR001"
+# Início de cada array no arquivo (np.memmap lê a partir de um offset)
+ALIGNMENT = 64
+# Tuplas do banco convertidas por vez
+FETCH_CHUNK = 1_000_000
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def _fetch(rows: Iterable[tuple], columns: int) -> np.ndarray:
+    """Tuplas de inteiros → array (n, columns) int64, em lotes."""
+    dtype = np.dtype([(f"c{i}", np.int64) for i in range(columns)])
+    parts, batch = [], []
+    for row in rows:
+        batch.append(tuple(row))
+        if len(batch) == FETCH_CHUNK:
+            parts.append(np.array(batch, dtype=dtype))
+            batch = []
+    parts.append(np.array(batch, dtype=dtype))
+    return np.concatenate(parts).view(np.int64).reshape(-1, columns)
+
+
+class CSRGraph:
+    """
+    Grafo dirigido em CSR (compressed sparse row): os vizinhos de saída do
+    nó de índice i são indices[indptr[i]:indptr[i + 1]], sem repetição e em
+    ordem crescente. `page_ids` (ordenado) é o mapa índice → page_id e o
+    inverso é uma busca binária (index_of), sem dicionário: 4 bytes por nó
+    e 4 por aresta, mais 4 por nó do indptr.
+
+    Os arrays não são alterados depois de criados; atualizações geram um
+    novo CSRGraph (replace_rows), então leitores em outras threads e
+    processos que mapeiam o snapshot nunca veem um estado intermediário.
+
+    Grafos lidos do banco guardam também `link_versions`, a
+    pages.links_version de cada nó na leitura (0 para nós sem página), que
+    refresh() compara com a do banco.
+    """
+
+    def __init__(
+        self,
+        page_ids: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        link_versions: np.ndarray | None = None,
+    ):
+        self.page_ids = page_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.link_versions = link_versions
+
+    @classmethod
+    def _from_keys(cls, page_ids: np.ndarray, keys: np.ndarray) -> "CSRGraph":
+        """Monta o CSR a partir de chaves src * n + dst ordenadas e únicas."""
+        n = len(page_ids)
+        if len(keys) > INT32_MAX or n > INT32_MAX:
+            raise ValueError("Grafo grande demais para índices int32")
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // max(n, 1), minlength=n), out=indptr[1:])
+        indices = (keys % max(n, 1)).astype(np.int32)
+        return cls(page_ids.astype(np.int32), indptr, indices)
+
+    @classmethod
+    def from_edges(
+        cls,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        page_ids: np.ndarray | None = None,
+    ) -> "CSRGraph":
+        """
+        Grafo com as arestas (sources[k] → targets[k]), dadas em page_ids.
+        Os nós são os page_ids informados mais todas as pontas das arestas.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        extra = np.asarray(page_ids if page_ids is not None else [], dtype=np.int64)
+        ids = np.unique(np.concatenate([sources, targets, extra]))
+        n = len(ids)
+        keys = np.searchsorted(ids, sources) * n + np.searchsorted(ids, targets)
+        return cls._from_keys(ids, np.unique(keys))
+
+    @classmethod
+    def from_stream(
+        cls, pages: Iterable[tuple[int, str]], links: Iterable[tuple[int, int]]
+    ) -> "CSRGraph":
+        """
+        Subgrafo induzido a partir dos iteradores de PageRepository.read_subgraph:
+        nós são as páginas, arestas só entre elas.
+        """
+        page_ids = _fetch(((page_id,) for page_id, _ in pages), 1)[:, 0]
+        edges = _fetch(links, 2)
+        return cls.from_edges(edges[:, 0], edges[:, 1], page_ids).subgraph(page_ids)
+
+    @classmethod
+    def from_repository(cls, repository) -> "CSRGraph":
+        """Lê `pages` e `links` inteiros (PageRepository) em streaming."""
+        # Versões antes dos links: uma escrita entre as duas leituras deixa
+        # a versão antiga no grafo, e a página é relida no próximo refresh
+        versions = _fetch(repository.iter_link_versions(), 2)
+        edges = _fetch(repository.iter_links(), 2)
+        graph = cls.from_edges(edges[:, 0], edges[:, 1], versions[:, 0])
+        return graph.with_versions(versions)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.page_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    @property
+    def nbytes(self) -> int:
+        total = self.page_ids.nbytes + self.indptr.nbytes + self.indices.nbytes
+        if self.link_versions is not None:
+            total += self.link_versions.nbytes
+        return total
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def index_of(self, page_ids) -> np.ndarray:
+        """Índices dos page_ids (-1 para os que não estão no grafo)."""
+        page_ids = np.asarray(page_ids, dtype=np.int64)
+        # Busca no dtype de page_ids: com tipos diferentes o numpy converteria
+        # o array inteiro a cada chamada. Ids que estouram o int32 não batem
+        # na comparação abaixo, que usa os valores originais.
+        index = np.searchsorted(self.page_ids, page_ids.astype(self.page_ids.dtype))
+        index[index == self.num_nodes] = 0
+        found = self.num_nodes > 0
+        if found:
+            found = self.page_ids[index] == page_ids
+        return np.where(found, index, -1)
+
+    def neighbors(self, page_id: int) -> np.ndarray:
+        """page_ids apontados por `page_id` (vazio se ele não está no grafo)."""
+        (index,) = self.index_of([page_id])
+        if index < 0:
+            return np.empty(0, dtype=np.int32)
+        return self.page_ids[self.indices[self.indptr[index] : self.indptr[index + 1]]]
+
+    def edge_sources(self) -> np.ndarray:
+        """Índice da fonte de cada aresta (o complemento de `indices`)."""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int32), self.out_degree())
+
+    def subgraph(self, page_ids) -> "CSRGraph":
+        """
+        Subgrafo induzido por `page_ids`. Ids fora do grafo entram como nós
+        isolados, como páginas sem links em build_graph.
+        """
+        ids = np.unique(np.asarray(page_ids, dtype=np.int64))
+        index = self.index_of(ids)
+        present = np.flatnonzero(index >= 0)
+        # Concatena as linhas dos nós presentes sem laço em Python
+        starts = self.indptr[index[present]]
+        lengths = self.indptr[index[present] + 1] - starts
+        gather = np.arange(lengths.sum()) + np.repeat(
+            starts - (np.cumsum(lengths) - lengths), lengths
+        )
+        sources = np.repeat(present, lengths)
+        targets = self.page_ids[self.indices[gather]].astype(np.int64)
+
+        # Só as arestas cujo alvo também está em `ids`
+        local = np.searchsorted(ids, targets)
+        inside = local < len(ids)
+        inside[inside] = ids[local[inside]] == targets[inside]
+        keys = sources[inside] * len(ids) + local[inside]
+        return CSRGraph._from_keys(ids, keys)
+
+    def replace_rows(
+        self, changed: np.ndarray, sources: np.ndarray, targets: np.ndarray
+    ) -> "CSRGraph":
+        """
+        Novo grafo em que os links de saída das páginas `changed` passam a
+        ser as arestas (sources → targets), todas em page_ids e com fonte em
+        `changed`. As demais linhas são copiadas, sem reordenar o grafo todo.
+        """
+        changed = np.asarray(changed, dtype=np.int64)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        ids = np.union1d(self.page_ids, np.concatenate([changed, sources, targets]))
+        n = len(ids)
+
+        # Índices antigos → novos (os ids novos deslocam os seguintes)
+        remap = np.searchsorted(ids, self.page_ids).astype(np.int64)
+        old_sources = self.edge_sources()
+        keep = ~np.isin(self.page_ids, changed)[old_sources]
+        kept = remap[old_sources[keep]] * n + remap[self.indices[keep]]
+        new = np.unique(
+            np.searchsorted(ids, sources) * n + np.searchsorted(ids, targets)
+        )
+        keys = np.insert(kept, np.searchsorted(kept, new), new)
+        return CSRGraph._from_keys(ids, keys)
+
+    def with_versions(self, versions: np.ndarray) -> "CSRGraph":
+        """
+        O mesmo grafo com as links_version de `versions` (pares page_id,
+        versão de PageRepository.iter_link_versions); nós sem par ficam com 0.
+        """
+        index = self.index_of(versions[:, 0])
+        known = index >= 0
+        link_versions = np.zeros(self.num_nodes, dtype=np.int64)
+        link_versions[index[known]] = versions[known, 1]
+        return CSRGraph(self.page_ids, self.indptr, self.indices, link_versions)
+
+    def changed_sources(self, versions: np.ndarray) -> np.ndarray:
+        """
+        page_ids cujos links podem diferir do grafo, dados os pares
+        (page_id, links_version) atuais do banco: páginas com versão
+        diferente da do grafo, páginas novas e páginas que tinham versão e
+        saíram do banco (os links delas saem junto).
+        """
+        index = self.index_of(versions[:, 0])
+        known = index >= 0
+        differs = np.ones(len(versions), dtype=bool)
+        differs[known] = self.link_versions[index[known]] != versions[known, 1]
+
+        in_db = np.zeros(self.num_nodes, dtype=bool)
+        in_db[index[known]] = True
+        removed = self.page_ids[(self.link_versions != 0) & ~in_db]
+        return np.concatenate([versions[differs, 0], removed.astype(np.int64)])
+
+    def refresh(self, repository) -> tuple["CSRGraph", int]:
+        """
+        Atualização incremental: compara as links_version do banco (uma
+        linha por página, sem ler `links`) com as do grafo e só lê os links
+        das páginas alteradas. Retorna o grafo novo e quantas páginas
+        mudaram (o próprio grafo se nenhuma). Um grafo sem versões (snapshot
+        anterior a links_version) é remontado do banco.
+        """
+        if self.link_versions is None:
+            graph = CSRGraph.from_repository(repository)
+            return graph, graph.num_nodes
+        versions = _fetch(repository.iter_link_versions(), 2)
+        changed = self.changed_sources(versions)
+        if not len(changed):
+            return self, 0
+        edges = _fetch(repository.iter_links(changed.tolist()), 2)
+        graph = self.replace_rows(changed, edges[:, 0], edges[:, 1])
+        return graph.with_versions(versions), len(changed)
+
+    def save(self, path: str, **meta) -> None:
+        """
+        Grava o snapshot: cabeçalho JSON com offset/dtype/tamanho de cada
+        array, seguido dos arrays alinhados. Escreve em um arquivo temporário
+        e troca com os.replace: processos que já mapearam o arquivo antigo
+        continuam lendo o inode antigo.
+        """
+        arrays = {
+            "page_ids": self.page_ids,
+            "indptr": self.indptr,
+            "indices": self.indices,
+        }
+        if self.link_versions is not None:
+            arrays["link_versions"] = self.link_versions
+        layout, offset = {}, 0
+        for name, array in arrays.items():
+            layout[name] = {
+                "offset": offset,
+                "dtype": array.dtype.str,
+                "length": len(array),
+            }
+            offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        header = json.dumps({"arrays": layout, "meta": meta}).encode()
+        data_start = (
+            -(-(len(SNAPSHOT_MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+        )
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> tuple["CSRGraph", dict]:
+        """
+        Abre um snapshot. Com mmap=True os arrays são np.memmap somente
+        leitura: as páginas do arquivo vêm do page cache do sistema, sob
+        demanda, e são compartilhadas entre os workers que abrem o mesmo
+        arquivo, sem cópia.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} não é um snapshot de grafo")
+            size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(size))
+        data_start = -(-(len(SNAPSHOT_MAGIC) + 8 + size) // ALIGNMENT) * ALIGNMENT
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            offset = data_start + spec["offset"]
+            if not spec["length"]:
+                arrays[name] = np.empty(0, dtype=dtype)
+            elif mmap:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=offset, shape=(spec["length"],)
+                )
+            else:
+                arrays[name] = np.fromfile(
+                    path, dtype=dtype, count=spec["length"], offset=offset
+                )
+        return cls(**arrays), header["meta"]
+
+
+class GraphStore:
+    """
+    Grafo do banco inteiro em CSR, compartilhado pelo processo: carregado do
+    snapshot em GRAPH_SNAPSHOT_PATH (mapeado em memória) ou, na falta dele,
+    montado a partir de `links` e gravado. refresh() aplica as mudanças do
+    banco incrementalmente e regrava o snapshot; get_fresh() faz o mesmo
+    no máximo a cada `refresh_interval` segundos.
+
+    Os métodos leem o banco com o lock tomado: chame-os de uma thread
+    (asyncio.to_thread), nunca do loop de eventos.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str | None = GRAPH_SNAPSHOT_PATH,
+        refresh_interval: float = GRAPH_REFRESH_INTERVAL,
+    ):
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self.graph: CSRGraph | None = None
+        # time.monotonic() da última leitura do banco (carga ou refresh)
+        self.checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _save(self, graph: CSRGraph) -> None:
+        if self.snapshot_path:
+            graph.save(self.snapshot_path, saved_at=time.time())
+
+    def get(self, repository) -> CSRGraph:
+        """Grafo atual, carregando-o na primeira chamada."""
+        with self._lock:
+            if self.graph is None:
+                start = time.perf_counter()
+                if self.snapshot_path and os.path.exists(self.snapshot_path):
+                    self.graph, _ = CSRGraph.load(self.snapshot_path)
+                    source = "snapshot"
+                else:
+                    self.graph = CSRGraph.from_repository(repository)
+                    self.checked_at = time.monotonic()
+                    self._save(self.graph)
+                    source = "banco"
+                logging.info(
+                    f"[GraphStore] Grafo carregado do {source}: "
+                    f"{self.graph.num_nodes} nós, {self.graph.num_edges} arestas "
+                    f"({(time.perf_counter() - start) * 1000:.1f} ms)"
+                )
+            return self.graph
+
+    def refresh(self, repository) -> int:
+        """Atualiza o grafo com as fontes alteradas no banco; retorna quantas."""
+        self.get(repository)
+        with self._lock:
+            return self._refresh(repository)
+
+    def get_fresh(self, repository) -> CSRGraph:
+        """
+        Grafo atual com as mudanças do banco: como get(), mais um refresh()
+        se a última leitura do banco tem mais de `refresh_interval` segundos.
+        Sem mudanças, o refresh custa uma leitura de (page_id, links_version).
+        """
+        self.get(repository)
+        with self._lock:
+            if time.monotonic() - self.checked_at >= self.refresh_interval:
+                self._refresh(repository)
+            return self.graph
+
+    def _refresh(self, repository) -> int:
+        """refresh() com o lock já tomado."""
+        graph, changed = self.graph.refresh(repository)
+        self.checked_at = time.monotonic()
+        if changed or graph is not self.graph:
+            self.graph = graph
+            self._save(graph)
+        return changed
+
+
+_default_store = GraphStore()
+
+
+def get_graph_store() -> GraphStore:
+    """GraphStore do processo."""
+    return _default_store
@@ -1,8 +1,13 @@
+import asyncio
+import heapq
 import logging
+import threading
+import time
 from fastapi import Depends
+from config.settings import PPR_ALPHA, PPR_EPSILON, PPR_MAX_SCRAPE
 from db.repositories.page import (
-    PageRepository,
-    get_page_repository,
+    AsyncPageRepository,
+    get_async_page_repository,
 )
 from models.graph_objects import (
     PageResponse,
@@ -10,19 +15,57 @@ from models.graph_objects import (
     PageBase,
     LinkBase,
     GraphResponse,
-    GraphLink,
+    PageRankResponse,
+    PPRResponse,
+    PPRScore,
 )
 from scraper.wiki_scraper import WikiScraper
-from services.graph_builder import save_graph
+from scraper.api_client import APIClient
+from scraper.cache import get_default_cache
+from scraper.rate_limiter import get_default_rate_limiter
+from scraper.title_resolver import TitleResolver, get_shared_title_cache
+from db.repositories.title_alias import TitleAliasRepository
+from db.session import SessionLocal
+from services.graph_builder import assemble_graph, save_graph
 from db.db_models import Page, Link
-from sqlalchemy import text
-from services.pagerank import pagerank
+from services.graph_store import CSRGraph, GraphStore, get_graph_store
+from services.pagerank import pagerank_csr, warm_start_vector
+from services.ppr import push_ppr
+from services.crawler import AsyncBFSCrawler
+
+
+_default_scraper = None
+_default_scraper_lock = threading.Lock()
+
+
+def get_default_scraper() -> WikiScraper:
+    """
+    WikiScraper do processo, compartilhado pelas requisições da API (uma
+    sessão HTTP e um resolvedor de títulos, em vez de um por requisição).
+    """
+    global _default_scraper
+    with _default_scraper_lock:
+        if _default_scraper is None:
+            api = APIClient(cache=get_default_cache())
+            resolver = TitleResolver(
+                api,
+                store=TitleAliasRepository(SessionLocal),
+                cache=get_shared_title_cache(),
+            )
+            _default_scraper = WikiScraper(api, resolver=resolver)
+        return _default_scraper
 
 
 class PageService:
-    def __init__(self, page_repository: PageRepository):
+    def __init__(
+        self,
+        page_repository: AsyncPageRepository,
+        scraper: WikiScraper | None = None,
+        graph_store: GraphStore | None = None,
+    ):
         self.repository = page_repository
-        self.scraper = WikiScraper()
+        self.scraper = scraper or get_default_scraper()
+        self.graph_store = graph_store or get_graph_store()
 
     def _is_year_page(self, title: str) -> bool:
         """
@@ -30,86 +73,55 @@ class PageService:
         """
         return title.strip().isdigit() and len(title.strip()) == 4
 
-    def run_bfs(
+    async def run_bfs(
         self, seed_title: str, max_depth: int, max_neighbors: int = 50
     ) -> set[int]:
         """
         Executa BFS a partir de uma página semente.
         Retorna conjunto de page_ids visitados.
+
+        Cada nível da fronteira é baixado concorrentemente pelo AsyncBFSCrawler.
         """
-        queue = [(seed_title, 0)]  # (title, depth)
-        visited_titles = set()
-        visited_ids = set()
-
-        while queue:
-            current_title, current_depth = queue.pop(0)
-
-            if current_depth > max_depth:
-                continue
-
-            if current_title in visited_titles:
-                continue
-            
-            # Pular páginas de ano
-            if self._is_year_page(current_title):
-                logging.warning(f"[BFS] Ignorando página de ano: '{current_title}'")
-                continue
-            
-            visited_titles.add(current_title)
-
-            # Verificar se já existe no DB
-            page_dict = self.repository.get_page_by_title(current_title)
-            if page_dict:
-                current_page_id = page_dict["page_id"]
-                logging.info(
-                    f"[BFS] Página '{current_title}' já existe (ID: {current_page_id})"
-                )
-            else:
-                # Não existe, fazer scraping
-                try:
-                    logging.info(
-                        f"[BFS] Scraping página '{current_title}' (depth {current_depth})..."
-                    )
-                    node, edges = self.scraper.scrape_page(title=current_title)
-                    self.repository.save_page_with_links(node, edges)
-                    current_page_id = node.page_id
-                    logging.info(f"[BFS] Página salva: {node.title} (ID: {current_page_id})")
-                except Exception as e:
-                    logging.error(f"[BFS] Erro ao fazer scraping de '{current_title}': {e}")
-                    continue
-
-            visited_ids.add(current_page_id)
-
-            # Adicionar vizinhos à fila (até o limite)
-            if current_depth < max_depth:
-                query = text(
-                    "SELECT target_page_id FROM links WHERE source_page_id = :page_id LIMIT :limit"
-                )
-                result = self.repository.db_session.execute(
-                    query, {"page_id": current_page_id, "limit": max_neighbors}
-                )
-                links = result.fetchall()
-
-                for link in links:
-                    target_page_id = link[0]
-                    # Buscar página alvo
-                    target_page_dict = self.repository.get_page_by_id(target_page_id)
-                    if not target_page_dict:
-                        node, edges = self.scraper.scrape_page(page_id=target_page_id)
-                        self.repository.save_page_with_links(node, edges)
-                        target_page_dict = self.repository.get_page_by_id(
-                            target_page_id
-                        )
-
-                    if (
-                        target_page_dict
-                        and target_page_dict["title"] not in visited_titles
-                    ):
-                        queue.append((target_page_dict["title"], current_depth + 1))
-
-        return visited_ids
-
-    def generate_graph(self, seed: str, depth: int) -> GraphResponse | None:
+        crawler = AsyncBFSCrawler(
+            self.repository, self.scraper, skip_title=self._is_year_page
+        )
+        return await crawler.crawl(seed_title, max_depth, max_neighbors)
+
+    async def cached_neighborhood(
+        self, seed_title: str, max_depth: int, max_neighbors: int = 50
+    ) -> tuple[list[dict], list[tuple[int, int]]] | None:
+        """
+        Caminho rápido do BFS quando a semente já está no banco: a vizinhança
+        e os links vêm de uma consulta recursiva, e só a fronteira ausente do
+        banco é baixada (o que pode revelar mais fronteira no nível seguinte,
+        daí o laço). Retorna None se a semente não está no banco.
+        """
+        crawler = AsyncBFSCrawler(
+            self.repository, self.scraper, skip_title=self._is_year_page
+        )
+        attempted = set()
+        while True:
+            pages, links = await self.repository.get_neighborhood(
+                seed_title, max_depth, max_neighbors
+            )
+            if not pages:
+                return None
+            missing = [
+                page["page_id"]
+                for page in pages
+                if page["title"] is None and page["page_id"] not in attempted
+            ]
+            if not missing:
+                break
+            logging.info(f"[PageService] Baixando fronteira: {len(missing)} páginas")
+            attempted.update(missing)
+            await crawler.scrape_missing(missing)
+
+        # Alvos que não puderam ser baixados ficam de fora, como no BFS
+        pages = [page for page in pages if page["title"] is not None]
+        return pages, links
+
+    async def generate_graph(self, seed: str, depth: int) -> GraphResponse | None:
         """
         Gera um grafo a partir do título semente e profundidade.
         Faz BFS, scraping quando necessário, e retorna o grafo.
@@ -117,53 +129,66 @@ class PageService:
         try:
             logging.info(f"[PageService] Gerando grafo: seed='{seed}', depth={depth}")
 
-            # Executar BFS para coletar todas as páginas
-            visited_ids = self.run_bfs(seed, depth, max_neighbors=50)
-
-            if not visited_ids:
-                logging.warning("[PageService] Nenhuma página visitada no BFS")
+            if self._is_year_page(seed):
+                logging.warning(f"[PageService] Ignorando página de ano: '{seed}'")
                 return None
 
-            # Buscar subgrafo do banco
-            pages, links = self.repository.get_subgraph(list(visited_ids))
+            # Semente já no banco: vizinhança por consulta recursiva
+            subgraph = await self.cached_neighborhood(seed, depth, max_neighbors=50)
+            if subgraph is not None:
+                pages, links = subgraph
+                # Montagem dos modelos Pydantic fora do loop de eventos
+                graph = await asyncio.to_thread(
+                    assemble_graph, [(p["page_id"], p["title"]) for p in pages], links
+                )
+            else:
+                # Executar BFS para coletar todas as páginas
+                visited_ids = await self.run_bfs(seed, depth, max_neighbors=50)
 
-            # Criar mapa de page_id -> title
-            id_to_title = {p["page_id"]: p["title"] for p in pages}
+                if not visited_ids:
+                    logging.warning("[PageService] Nenhuma página visitada no BFS")
+                    return None
 
-            # Montar resposta
-            nodes = [p["title"] for p in pages]
-            graph_links = [
-                GraphLink(
-                    source=id_to_title.get(link["source_page_id"], ""),
-                    target=id_to_title.get(link["target_page_id"], ""),
+                # Subgrafo lido do banco em streaming e montado direto na resposta
+                graph = await self.repository.read_subgraph(
+                    list(visited_ids), assemble_graph
                 )
-                for link in links
-                if link["source_page_id"] in id_to_title
-                and link["target_page_id"] in id_to_title
-            ]
 
             logging.info(
-                f"[PageService] Grafo gerado: {len(nodes)} nós, {len(graph_links)} arestas"
+                f"[PageService] Grafo gerado: {len(graph.nodes)} nós, {len(graph.links)} arestas"
             )
 
-            return GraphResponse(nodes=nodes, links=graph_links)
+            return graph
 
         except Exception as e:
             logging.error(f"[PageService] Erro ao gerar grafo: {e}")
             return None
 
-    def get_page_by_id(self, page_id: int) -> PageResponse | None:
-        page_dict = self.repository.get_page_by_id(page_id)
+    async def get_page_by_id(self, page_id: int) -> PageResponse | None:
+        page_dict = await self.repository.get_page_by_id(page_id)
         if not page_dict:
             return None
         return PageResponse(**page_dict)
 
-    def get_or_scrape_page_by_title(self, title: str) -> PageResponse | None:
+    async def get_pages_by_links_in(
+        self,
+        min_links_in: int = 0,
+        max_links_in: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[PageResponse]:
+        """Páginas ordenadas por links de entrada, filtradas pela faixa dada."""
+        pages = await self.repository.get_pages_by_links_in(
+            min_links_in, max_links_in, limit, offset
+        )
+        return [PageResponse(**page_dict) for page_dict in pages]
+
+    async def get_or_scrape_page_by_title(self, title: str) -> PageResponse | None:
         """
         Busca página por título. Se não existir, faz scraping da Wikipedia e salva.
         """
         # Primeiro tenta buscar no banco
-        page_dict = self.repository.get_page_by_title(title)
+        page_dict = await self.repository.get_page_by_title(title)
         if page_dict:
             return PageResponse(**page_dict)
 
@@ -175,13 +200,13 @@ class PageService:
         # Se não encontrou, faz scraping
         try:
             logging.info(f"[PageService] Página '{title}' não encontrada. Fazendo scraping...")
-            node, edges = self.scraper.scrape_page(title)
+            node, edges = await asyncio.to_thread(self.scraper.scrape_page, title)
 
             # Salva no banco
-            self.repository.save_page_with_links(node, edges)
+            await self.repository.save_page_with_links(node, edges)
 
             # Busca novamente para retornar com o formato correto
-            page_dict = self.repository.get_page_by_id(node.page_id)
+            page_dict = await self.repository.get_page_by_id(node.page_id)
             if page_dict:
                 return PageResponse(**page_dict)
 
@@ -190,56 +215,59 @@ class PageService:
             logging.error(f"[PageService] Erro ao fazer scraping: {e}")
             return None
 
-    def calculate_pagerank(self, nodes: list[str]) -> dict[str, float] | None:
+    async def calculate_pagerank(
+        self, nodes: list[str], warm_start: bool = False
+    ) -> PageRankResponse | None:
         """
         Calcula o PageRank para um conjunto de nós (títulos).
         Atualiza o banco de dados com os scores e retorna o resultado.
+
+        Com `warm_start`, parte dos pagerank_score já salvos (reescalados
+        para o conjunto atual) e acelera com extrapolação: depois de poucas
+        mudanças no grafo, converge em bem menos iterações.
         """
         try:
             logging.info(f"[PageService] Calculando PageRank para {len(nodes)} nós...")
+            start = time.perf_counter()
 
-            # Buscar page_ids dos títulos
-            title_to_id = {}
-            page_responses = []
-
-            for title in nodes:
-                page_dict = self.repository.get_page_by_title(title)
-                if page_dict:
-                    title_to_id[title] = page_dict["page_id"]
-                    page_responses.append(PageResponse(**page_dict))
-
-            if not page_responses:
+            # page_ids dos títulos (uma consulta) e o subgrafo em CSR, em streaming
+            title_to_id = await self.repository.get_pages_by_titles(
+                list(dict.fromkeys(nodes))
+            )
+            if not title_to_id:
                 logging.warning(
                     "[PageService] Nenhuma página encontrada para cálculo de PageRank"
                 )
                 return None
 
-            # Buscar links entre essas páginas
             page_ids = list(title_to_id.values())
-            _, links_dicts = self.repository.get_subgraph(page_ids)
+            graph = await self.repository.read_subgraph(page_ids, CSRGraph.from_stream)
+            lookup_time = time.perf_counter() - start
 
-
-            links = [
-                LinkBase(
-                    source_page_id=link["source_page_id"],
-                    target_page_id=link["target_page_id"],
-                    anchor_text=link.get("anchor_text"),
+            initial = None
+            if warm_start:
+                stored = await self.repository.get_pagerank_scores(
+                    graph.page_ids.tolist()
                 )
-                for link in links_dicts
-            ]
-
-            pagerank_scores = pagerank(page_responses, links)
+                initial = warm_start_vector(graph.page_ids, stored)
+
+            start = time.perf_counter()
+            # Cálculo em CPU: fora do loop de eventos
+            residuals = []
+            ranks = await asyncio.to_thread(
+                pagerank_csr,
+                graph,
+                residuals=residuals,
+                start=initial,
+                accelerate=warm_start,
+            )
+            pagerank_scores = dict(zip(graph.page_ids.tolist(), ranks.tolist()))
+            compute_time = time.perf_counter() - start
 
             # Atualizar banco de dados
-            for page_id, score in pagerank_scores.items():
-                query = text(
-                    "UPDATE pages SET pagerank_score = :score WHERE page_id = :page_id"
-                )
-                self.repository.db_session.execute(
-                    query, {"score": score, "page_id": page_id}
-                )
-
-            self.repository.db_session.commit()
+            start = time.perf_counter()
+            await self.repository.update_pagerank_scores(pagerank_scores)
+            persist_time = time.perf_counter() - start
 
             id_to_title = {v: k for k, v in title_to_id.items()}
             result = {
@@ -248,17 +276,127 @@ class PageService:
             }
 
             logging.info(
-                f"[PageService] PageRank calculado e salvo para {len(result)} páginas"
+                f"[PageService] PageRank calculado e salvo para {len(result)} páginas "
+                f"em {len(residuals)} iterações "
+                f"(consulta {lookup_time * 1000:.1f} ms, "
+                f"cálculo {compute_time * 1000:.1f} ms, "
+                f"gravação {persist_time * 1000:.1f} ms)"
+            )
+            return PageRankResponse(
+                pagerank=result,
+                warm_start=warm_start,
+                iterations=len(residuals),
+                residuals=residuals,
             )
-            return result
 
         except Exception as e:
             logging.error(f"[PageService] Erro ao calcular PageRank: {e}")
             return None
 
+    async def personalized_pagerank(
+        self,
+        seed: str,
+        alpha: float = PPR_ALPHA,
+        epsilon: float = PPR_EPSILON,
+        limit: int = 50,
+        scrape: bool = False,
+    ) -> PPRResponse | None:
+        """
+        PageRank personalizado a partir da página `seed`, por push local
+        (services.ppr) sobre o grafo do GraphStore: o custo depende de
+        quantas páginas recebem massa, não do tamanho do grafo. O grafo
+        recebe os links gravados no banco desde a última leitura (no máximo a
+        cada GRAPH_REFRESH_INTERVAL s), e os da semente e dos vizinhos
+        baixados nesta consulta vêm direto do banco.
+
+        Com `scrape`, uma semente ausente do banco é baixada, junto com os
+        vizinhos dela que faltam (até PPR_MAX_SCRAPE). Retorna None se a
+        semente não existe.
+        """
+        try:
+            start = time.perf_counter()
+            if scrape:
+                page = await self.get_or_scrape_page_by_title(seed)
+                page_id = page.page_id if page else None
+            else:
+                page_dict = await self.repository.get_page_by_title(seed)
+                page_id = page_dict["page_id"] if page_dict else None
+            if page_id is None:
+                logging.warning(f"[PageService] Semente '{seed}' não encontrada")
+                return None
+
+            # Links lidos do banco nesta consulta valem sobre os do GraphStore
+            overlay = await self.repository.get_out_links([page_id])
+            if scrape:
+                targets = list(dict.fromkeys(overlay[page_id]))
+                known = await self.repository.get_titles_by_ids(targets)
+                missing = [t for t in targets if t not in known][:PPR_MAX_SCRAPE]
+                if missing:
+                    logging.info(
+                        f"[PageService] Baixando vizinhos da semente: {len(missing)} páginas"
+                    )
+                    crawler = AsyncBFSCrawler(
+                        self.repository, self.scraper, skip_title=self._is_year_page
+                    )
+                    scraped = await crawler.scrape_missing(missing)
+                    overlay.update(await self.repository.get_out_links(scraped))
+
+            # Na mesma thread da carga: aplica os links gravados desde a
+            # última leitura do banco
+            graph = await self.repository.load_graph(self.graph_store.get_fresh)
+
+            def neighbors(node: int):
+                if node in overlay:
+                    return overlay[node]
+                return graph.neighbors(node)
+
+            # Cálculo em CPU: fora do loop de eventos
+            estimate, residual, pushes = await asyncio.to_thread(
+                push_ppr, neighbors, page_id, alpha, epsilon
+            )
+            top = heapq.nlargest(limit, estimate.items(), key=lambda item: item[1])
+            titles = await self.repository.get_titles_by_ids([pid for pid, _ in top])
+
+            logging.info(
+                f"[PageService] PPR de '{seed}': {len(estimate)} páginas, "
+                f"{pushes} pushes, resíduo {residual:.2e} "
+                f"({(time.perf_counter() - start) * 1000:.1f} ms)"
+            )
+            return PPRResponse(
+                seed=seed,
+                alpha=alpha,
+                epsilon=epsilon,
+                residual=residual,
+                pushes=pushes,
+                scores=[
+                    PPRScore(
+                        page_id=pid,
+                        title=titles.get(pid),
+                        score=score,
+                        upper_bound=score + residual,
+                    )
+                    for pid, score in top
+                ],
+            )
+
+        except Exception as e:
+            logging.error(f"[PageService] Erro ao calcular PPR: {e}")
+            return None
+
+    def get_scraper_stats(self) -> dict:
+        """Taxa atual/sustentada do limitador e estatísticas do cache da API."""
+        cache = get_default_cache()
+        return {
+            "rate_limiter": get_default_rate_limiter().stats(),
+            "api_cache": cache.stats() if cache is not None else None,
+        }
+
 
-def get_page_service(
-    page_repository: PageRepository = Depends(get_page_repository),
+async def get_page_service(
+    page_repository: AsyncPageRepository = Depends(get_async_page_repository),
 ) -> PageService:
-    """Dependency injection factory para PageService"""
+    """
+    Dependency injection factory para PageService (async: dependências
+    síncronas rodariam no threadpool do FastAPI)
+    """
     return PageService(page_repository)
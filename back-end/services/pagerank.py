@@ -1,6 +1,14 @@
 from typing import Dict, Iterable
 from collections import defaultdict
+
+import numpy as np
+from scipy import sparse
+
 from models.graph_objects import PageResponse, LinkBase
+from services.graph_store import CSRGraph
+
+# Iterações entre extrapolações quadráticas (precisa de ≥ 4 iterados novos)
+EXTRAPOLATION_PERIOD = 5
 
 
 def build_graph(nodes: Iterable[PageResponse], edges: Iterable[LinkBase]):
@@ -24,49 +32,148 @@ def build_graph(nodes: Iterable[PageResponse], edges: Iterable[LinkBase]):
     return node_ids, out_neighbors, out_degree
 
 
-def pagerank(
-    nodes: Iterable[PageResponse],
-    edges: Iterable[LinkBase],
+def transition_matrix(graph: CSRGraph, dtype=np.float64) -> sparse.csr_matrix:
+    """
+    Transposta da matriz de adjacência (linha v = links de entrada de v), em
+    CSR: o produto com o vetor de rank percorre as linhas em sequência.
+    """
+    n = graph.num_nodes
+    adjacency = sparse.csr_matrix(
+        (np.ones(graph.num_edges, dtype=dtype), graph.indices, graph.indptr),
+        shape=(n, n),
+    )
+    return adjacency.T.tocsr()
+
+
+def warm_start_vector(
+    page_ids: np.ndarray, scores: dict[int, float], dtype=np.float64
+) -> np.ndarray:
+    """
+    Vetor inicial para pagerank_csr a partir de scores salvos (p.ex.
+    pages.pagerank_score, calculados sobre outro conjunto de nós): os scores
+    conhecidos são reescalados para somar a fração de nós que os têm, e os
+    nós sem score (novos, ou com 0/NULL) começam com 1/N.
+    """
+    n = len(page_ids)
+    start = np.array(
+        [scores.get(page_id) or 0.0 for page_id in page_ids.tolist()],
+        dtype=np.float64,
+    )
+    known = start > 0
+    total = start[known].sum()
+    if total > 0:
+        start[known] *= known.sum() / n / total
+    start[~known] = 1.0 / n
+    return start.astype(dtype)
+
+
+def extrapolate(history: list[np.ndarray], current: np.ndarray) -> np.ndarray:
+    """
+    Extrapolação quadrática (Kamvar et al., 2003) a partir dos três iterados
+    anteriores e do atual: estima o vetor estacionário eliminando as duas
+    componentes que decaem mais devagar, por mínimos quadrados. Valores
+    negativos são zerados e o resultado é renormalizado.
+    """
+    x3, x2, x1 = history
+    y = np.column_stack([x2 - x3, x1 - x3]).astype(np.float64)
+    gamma, *_ = np.linalg.lstsq(y, x3 - current, rcond=None)
+    beta0 = gamma[0] + gamma[1] + 1.0
+    beta1 = gamma[1] + 1.0
+    estimate = np.maximum(beta0 * x2 + beta1 * x1 + current, 0.0)
+    total = estimate.sum()
+    if not np.isfinite(total) or total <= 0:
+        return current
+    return (estimate / total).astype(current.dtype, copy=False)
+
+
+def pagerank_csr(
+    graph: CSRGraph,
     d: float = 0.85,
     max_iter: int = 100,
     tol: float = 1e-6,
-) -> Dict[int, float]:
+    dtype=np.float64,
+    residuals: list | None = None,
+    start: np.ndarray | None = None,
+    accelerate: bool = False,
+) -> np.ndarray:
     """
-    Calcula o PageRank e retorna um dicionário {page_id: score}.
+    PageRank por iteração de potência sobre um CSRGraph, vetorizado: cada
+    iteração é um produto matriz esparsa × vetor (scipy.sparse) e a massa dos
+    nós sem saída é somada e redistribuída como operação de vetor.
+
+    Retorna o vetor de scores na ordem de graph.page_ids. `dtype` escolhe a
+    precisão (np.float32 usa metade da memória, com erro de arredondamento
+    da ordem de 1e-7 por score). Se `residuals` for informada, recebe a
+    diferença L1 entre iterações consecutivas, uma por iteração.
+
+    `start` é o vetor inicial (p.ex. warm_start_vector com os scores da
+    execução anterior; o padrão é 1/N) e `accelerate` aplica a extrapolação
+    quadrática a cada EXTRAPOLATION_PERIOD iterações. Partindo de uma
+    solução próxima, os dois juntos cortam as iterações até `tol` para
+    cerca de um terço depois de mudanças pequenas no grafo.
     """
-    node_ids, out_neighbors, out_degree = build_graph(nodes, edges)
-    N = len(node_ids)
-
-    if N == 0:
-        return {}
-
-    # rank inicial uniforme
-    rank = {pid: 1.0 / N for pid in node_ids}
-
-    for _ in range(max_iter):
-        # parte do teleporte
-        new_rank = {pid: (1.0 - d) / N for pid in node_ids}
-
-        # soma da massa nos dangling nodes (sem saída)
-        dangling_sum = sum(rank[pid] for pid in node_ids if out_degree[pid] == 0)
-        dangling_contrib = d * dangling_sum / N
-
-        for pid in node_ids:
-            new_rank[pid] += dangling_contrib
-
-        # contribuições normais
-        for u in node_ids:
-            if out_degree[u] == 0:
-                continue
-            contrib = d * rank[u] / out_degree[u]
-            for v in out_neighbors[u]:
-                new_rank[v] += contrib
+    n = graph.num_nodes
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+
+    matrix = transition_matrix(graph, dtype)
+    out_degree = graph.out_degree()
+    dangling = out_degree == 0
+    # Peso de cada nó nas suas arestas de saída (0 nos dangling)
+    weight = np.zeros(n, dtype=dtype)
+    weight[~dangling] = 1.0 / out_degree[~dangling]
+
+    if start is None:
+        rank = np.full(n, 1.0 / n, dtype=dtype)
+    else:
+        if start.shape != (n,):
+            raise ValueError("Vetor inicial com tamanho diferente do grafo")
+        rank = (start / start.sum()).astype(dtype)
+
+    history = []
+    for iteration in range(1, max_iter + 1):
+        # teleporte + massa dos dangling nodes, igual para todos os nós
+        base = ((1.0 - d) + d * rank[dangling].sum()) / n
+        new_rank = d * (matrix @ (rank * weight)) + base
+        new_rank = new_rank.astype(dtype, copy=False)
+        if accelerate:
+            if iteration % EXTRAPOLATION_PERIOD == 0 and len(history) == 3:
+                new_rank = extrapolate(history, new_rank)
+            history = (history + [new_rank])[-3:]
 
         # checa convergência
-        diff = sum(abs(new_rank[pid] - rank[pid]) for pid in node_ids)
+        diff = np.abs(new_rank - rank).sum()
         rank = new_rank
+        if residuals is not None:
+            residuals.append(float(diff))
 
         if diff < tol:
             break
 
     return rank
+
+
+def pagerank(
+    nodes: Iterable[PageResponse],
+    edges: Iterable[LinkBase],
+    d: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    dtype=np.float64,
+) -> Dict[int, float]:
+    """
+    Calcula o PageRank e retorna um dicionário {page_id: score}.
+    Arestas com ponta fora de `nodes` são ignoradas, como em build_graph.
+    """
+    node_ids = [node.page_id for node in nodes]
+    if not node_ids:
+        return {}
+
+    pairs = np.array(
+        [(edge.source_page_id, edge.target_page_id) for edge in edges],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    graph = CSRGraph.from_edges(pairs[:, 0], pairs[:, 1], node_ids).subgraph(node_ids)
+
+    rank = pagerank_csr(graph, d=d, max_iter=max_iter, tol=tol, dtype=dtype)
+    return dict(zip(graph.page_ids.tolist(), rank.tolist()))
@@ -0,0 +1,239 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+from scipy import sparse
+
+from config.settings import PAGERANK_WORKERS
+from services.graph_store import CSRGraph
+from services.pagerank import EXTRAPOLATION_PERIOD, extrapolate, transition_matrix
+
+# Estado de cada processo do pool: arrays mapeados e matrizes dos blocos
+_worker = {}
+
+
+class SharedArrays:
+    """
+    Arrays numpy copiados para segmentos de multiprocessing.shared_memory,
+    um por array. `spec` (nome do segmento, dtype e shape de cada um) é o
+    que os processos filhos recebem para mapeá-los sem cópia (attach).
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        self.segments = []
+        self.spec = {}
+        self.arrays = {}
+        for key, array in arrays.items():
+            segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            self.segments.append(segment)
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+            view[...] = array
+            self.arrays[key] = view
+            self.spec[key] = (segment.name, array.dtype.str, array.shape)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    @staticmethod
+    def attach(spec: dict) -> tuple[list, dict[str, np.ndarray]]:
+        """Mapeia os segmentos de `spec` (no processo filho)."""
+        segments, arrays = [], {}
+        for key, (name, dtype, shape) in spec.items():
+            segment = shared_memory.SharedMemory(name=name)
+            segments.append(segment)
+            arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        return segments, arrays
+
+    def close(self) -> None:
+        """Libera os segmentos (o SO só os apaga quando o último mapeamento sai)."""
+        self.arrays.clear()
+        for segment in self.segments:
+            try:
+                segment.close()
+            except BufferError:
+                # Ainda há views vivas (p.ex. no traceback de uma exceção)
+                pass
+            segment.unlink()
+        self.segments = []
+
+
+def row_blocks(indptr: np.ndarray, blocks: int) -> list[tuple[int, int]]:
+    """
+    Divide as linhas de uma matriz CSR em até `blocks` faixas contíguas
+    [início, fim) com número parecido de elementos não nulos.
+    """
+    n = len(indptr) - 1
+    cuts = np.searchsorted(indptr, np.linspace(0, indptr[-1], blocks + 1))
+    cuts = np.unique(np.clip(np.concatenate([[0], cuts[1:-1], [n]]), 0, n))
+    return list(zip(cuts[:-1].tolist(), cuts[1:].tolist()))
+
+
+def _init_worker(spec: dict, bounds: list[tuple[int, int]]) -> None:
+    segments, arrays = SharedArrays.attach(spec)
+    _worker.update(arrays, segments=segments, bounds=bounds, matrices={})
+
+
+def _block_matrix(block: int) -> sparse.csr_matrix:
+    """Linhas do bloco como csr_matrix sobre a memória compartilhada."""
+    matrix = _worker["matrices"].get(block)
+    if matrix is None:
+        start, stop = _worker["bounds"][block]
+        indptr = _worker["indptr"][start : stop + 1]
+        first, last = indptr[0], indptr[-1]
+        matrix = sparse.csr_matrix(
+            (
+                _worker["data"][first:last],
+                _worker["indices"][first:last],
+                indptr - first,
+            ),
+            shape=(stop - start, len(_worker["dangling"])),
+            copy=False,
+        )
+        _worker["matrices"][block] = matrix
+    return matrix
+
+
+def _step(task: tuple[int, int, float, float]) -> tuple[float, float]:
+    """
+    Uma iteração no bloco: lê o rank da linha `source` de `ranks` e grava
+    as linhas do bloco na outra. Retorna a diferença L1 e a massa dos
+    dangling nodes do bloco, que o processo principal soma.
+    """
+    block, source, d, base = task
+    start, stop = _worker["bounds"][block]
+    rank = _worker["ranks"][source]
+    new_rank = d * (_block_matrix(block) @ rank) + base
+    _worker["ranks"][1 - source, start:stop] = new_rank
+    diff = np.abs(new_rank - rank[start:stop]).sum()
+    return float(diff), float(new_rank[_worker["dangling"][start:stop]].sum())
+
+
+class ParallelPageRank:
+    """
+    Motor de PageRank multiprocesso sobre um CSRGraph: a matriz de transição
+    (já ponderada por 1/grau de saída) fica em shared_memory, dividida em
+    blocos de linhas com número parecido de arestas, um por processo do
+    pool. Em cada iteração cada processo calcula as linhas do seu bloco e o
+    processo principal soma as diferenças e a massa dos dangling nodes. Os
+    dois vetores de rank também são compartilhados e alternam entre leitura
+    e escrita, então só escalares passam pelas filas do pool.
+
+    O pool e os segmentos vivem até close() (ou o fim do bloco with), e
+    run() pode ser chamado várias vezes sobre o mesmo grafo.
+    """
+
+    def __init__(
+        self, graph: CSRGraph, workers: int = PAGERANK_WORKERS, dtype=np.float64
+    ):
+        self.num_nodes = n = graph.num_nodes
+        self.dtype = dtype
+        matrix = transition_matrix(graph, dtype)
+        out_degree = graph.out_degree()
+        self.dangling = out_degree == 0
+        weight = np.zeros(n, dtype=dtype)
+        weight[~self.dangling] = 1.0 / out_degree[~self.dangling]
+        # Peso da fonte de cada aresta embutido na matriz (linha v = entradas de v)
+        matrix.data *= weight[matrix.indices]
+
+        self.bounds = row_blocks(matrix.indptr, workers)
+        self.shared = SharedArrays(
+            {
+                "indptr": matrix.indptr,
+                "indices": matrix.indices,
+                "data": matrix.data,
+                "dangling": self.dangling,
+                "ranks": np.zeros((2, n), dtype=dtype),
+            }
+        )
+        try:
+            # spawn: não herda threads nem conexões do processo da API
+            context = multiprocessing.get_context("spawn")
+            self.pool = context.Pool(
+                len(self.bounds),
+                initializer=_init_worker,
+                initargs=(self.shared.spec, self.bounds),
+            )
+        except Exception:
+            self.shared.close()
+            raise
+
+    def __enter__(self) -> "ParallelPageRank":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pool.terminate()
+        self.pool.join()
+        self.shared.close()
+
+    def run(
+        self,
+        d: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1e-6,
+        residuals: list | None = None,
+        start: np.ndarray | None = None,
+        accelerate: bool = False,
+    ) -> np.ndarray:
+        """Parâmetros e retorno como em pagerank_csr."""
+        n = self.num_nodes
+        ranks = self.shared["ranks"]
+        if start is None:
+            ranks[0] = 1.0 / n
+        else:
+            if start.shape != (n,):
+                raise ValueError("Vetor inicial com tamanho diferente do grafo")
+            ranks[0] = start / start.sum()
+
+        source = 0
+        dangling_mass = ranks[0][self.dangling].sum()
+        history = []
+        for iteration in range(1, max_iter + 1):
+            # teleporte + massa dos dangling nodes, igual para todos os nós
+            base = ((1.0 - d) + d * dangling_mass) / n
+            parts = self.pool.map(
+                _step, [(block, source, d, base) for block in range(len(self.bounds))]
+            )
+            source = 1 - source
+            diff = sum(part[0] for part in parts)
+            dangling_mass = sum(part[1] for part in parts)
+
+            if accelerate:
+                if iteration % EXTRAPOLATION_PERIOD == 0 and len(history) == 3:
+                    ranks[source] = extrapolate(history, ranks[source])
+                    diff = np.abs(ranks[source] - ranks[1 - source]).sum()
+                    dangling_mass = ranks[source][self.dangling].sum()
+                history = (history + [ranks[source].copy()])[-3:]
+
+            if residuals is not None:
+                residuals.append(float(diff))
+            if diff < tol:
+                break
+
+        return ranks[source].copy()
+
+
+def pagerank_parallel(
+    graph: CSRGraph,
+    workers: int = PAGERANK_WORKERS,
+    d: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    dtype=np.float64,
+    residuals: list | None = None,
+    start: np.ndarray | None = None,
+    accelerate: bool = False,
+) -> np.ndarray:
+    """
+    pagerank_csr com o produto matriz × vetor dividido entre `workers`
+    processos (ParallelPageRank). O resultado bate com o do motor serial a
+    menos de arredondamento, já que só a ordem das somas muda. Em grafos
+    pequenos, criar o pool e sincronizá-lo a cada iteração custa mais que
+    o cálculo: use pagerank_csr.
+    """
+    if graph.num_nodes == 0:
+        return np.empty(0, dtype=dtype)
+    with ParallelPageRank(graph, workers, dtype) as engine:
+        return engine.run(d, max_iter, tol, residuals, start, accelerate)
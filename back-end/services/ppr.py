@@ -0,0 +1,65 @@
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+from config.settings import PPR_MAX_PUSHES
+
+
+def push_ppr(
+    neighbors: Callable[[int], np.ndarray | list[int]],
+    seed: int,
+    alpha: float = 0.15,
+    epsilon: float = 1e-4,
+    max_pushes: int = PPR_MAX_PUSHES,
+) -> tuple[dict[int, float], float, int]:
+    """
+    PageRank personalizado a partir de `seed` por push local (Andersen,
+    Chung e Lang): cada nó guarda uma estimativa p e um resíduo r, e um nó
+    com r[u] ≥ ε·grau(u) passa α·r[u] para p[u] e divide o resto entre os
+    vizinhos de saída. Nós sem saída devolvem o resto à semente (o passeio
+    recomeça), como o teleporte do PageRank.
+
+    Só os nós alcançados são visitados e o total de pushes é O(1/(α·ε)),
+    independente do tamanho do grafo. `neighbors(page_id)` dá os alvos de
+    uma página (p.ex. CSRGraph.neighbors) e é chamado uma vez por nó.
+
+    Retorna (p, soma dos resíduos, pushes). p subestima o PPR exato: para
+    todo nó 0 ≤ ppr(v) − p(v) ≤ soma dos resíduos, que também é o erro L1
+    total. O limite vale mesmo se `max_pushes` interromper o laço.
+    """
+    estimate: dict[int, float] = {}
+    residual = {seed: 1.0}
+    out_links: dict[int, list[int]] = {}
+    queue = deque([seed])
+    queued = {seed}
+    pushes = 0
+
+    while queue and pushes < max_pushes:
+        u = queue.popleft()
+        queued.discard(u)
+        if u not in out_links:
+            out_links[u] = [int(v) for v in neighbors(u)]
+        targets = out_links[u]
+        mass = residual[u]
+        if mass < epsilon * max(len(targets), 1):
+            continue
+
+        pushes += 1
+        residual[u] = 0.0
+        estimate[u] = estimate.get(u, 0.0) + alpha * mass
+        spread = (1.0 - alpha) * mass
+        if targets:
+            share = spread / len(targets)
+        else:
+            targets, share = [seed], spread
+        for v in targets:
+            r = residual.get(v, 0.0) + share
+            residual[v] = r
+            # Grau ainda desconhecido: o limiar real é checado ao desenfileirar
+            degree = len(out_links[v]) if v in out_links else 1
+            if r >= epsilon * max(degree, 1) and v not in queued:
+                queue.append(v)
+                queued.add(v)
+
+    return estimate, sum(residual.values()), pushes
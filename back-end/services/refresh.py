@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+
+from scraper.wiki_scraper import MODE_LINKS
+
+# Limite de page_ids por consulta da API do MediaWiki
+BATCH_SIZE = 50
+
+
+def _as_utc(value) -> datetime | None:
+    """Converte o `touched` (string ISO da API ou datetime do banco) para UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class PageRefresher:
+    """
+    Re-crawl incremental: compara o `lastrevid` salvo de cada página com a
+    revisão atual (prop=info, 50 páginas por consulta) e só baixa de novo os
+    links das páginas que mudaram.
+
+    No modo HTML o parse é fixado na revisão (oldid), então só um novo
+    `lastrevid` dispara o re-parse. No modo links as tabelas de links também
+    mudam por edição de predefinições, sem nova revisão; ali um `touched`
+    mais recente também conta como mudança.
+    """
+
+    def __init__(self, repository, scraper, batch_size: int = BATCH_SIZE):
+        self.repository = repository
+        self.scraper = scraper
+        self.batch_size = batch_size
+
+    def _is_changed(self, stored: dict, current: dict) -> bool:
+        if stored["lastrevid"] is None or stored["lastrevid"] != current.get(
+            "lastrevid"
+        ):
+            return True
+        if self.scraper.mode == MODE_LINKS:
+            stored_touched = _as_utc(stored["touched"])
+            current_touched = _as_utc(current.get("touched"))
+            return stored_touched is None or (
+                current_touched is not None and current_touched > stored_touched
+            )
+        return False
+
+    def run(self) -> dict:
+        """Percorre todas as páginas salvas e retorna contadores do refresh."""
+        stats = {"checked": 0, "changed": 0, "unchanged": 0, "missing": 0}
+
+        for batch in self.repository.iter_page_revisions(self.batch_size):
+            page_ids = [row["page_id"] for row in batch]
+            missing = set()
+            current = self.scraper.api.fetch_page_info_batch(page_ids, missing=missing)
+
+            changed = [
+                row["page_id"]
+                for row in batch
+                if row["page_id"] in current
+                and self._is_changed(row, current[row["page_id"]])
+            ]
+            stats["checked"] += len(batch)
+            stats["missing"] += len(missing)
+            stats["changed"] += len(changed)
+            stats["unchanged"] += len(current) - len(changed)
+
+            if changed:
+                print(f"[Refresh] Re-scraping {len(changed)}/{len(batch)} pages...")
+                # Sem o cache da API: uma resposta de antes da edição
+                # gravaria o lastrevid e os links antigos
+                self.repository.save_pages_with_links(
+                    self.scraper.scrape_pages(changed, use_cache=False)
+                )
+
+        print(f"[Refresh] Done: {stats}")
+        return stats
@@ -0,0 +1,14 @@
+-- MySQL dump 10.19  Distrib 10.3.38-MariaDB, for debian-linux-gnu (x86_64)
+
+DROP TABLE IF EXISTS `linktarget`;
+CREATE TABLE `linktarget` (
+  `lt_id` bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  `lt_namespace` int(11) NOT NULL,
+  `lt_title` varbinary(255) NOT NULL,
+  PRIMARY KEY (`lt_id`),
+  UNIQUE KEY `lt_namespace_title` (`lt_namespace`,`lt_title`)
+) ENGINE=InnoDB AUTO_INCREMENT=18 DEFAULT CHARSET=binary ROW_FORMAT=COMPRESSED;
+
+LOCK TABLES `linktarget` WRITE;
+INSERT INTO `linktarget` VALUES (10,0,'Ciência'),(11,0,'Logica'),(12,0,'Lógica_(filosofia)'),(13,0,'Inexistente'),(14,4,'Esplanada'),(15,0,'D\'Alembert,_(matemático)'),(16,0,'Filosofia'),(17,0,'Lógica');
+UNLOCK TABLES;
@@ -0,0 +1,34 @@
+-- MySQL dump 10.19  Distrib 10.3.38-MariaDB, for debian-linux-gnu (x86_64)
+--
+-- Host: 10.64.32.82    Database: ptwiki
+-- ------------------------------------------------------
+
+DROP TABLE IF EXISTS `page`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `page` (
+  `page_id` int(8) unsigned NOT NULL AUTO_INCREMENT,
+  `page_namespace` int(11) NOT NULL DEFAULT 0,
+  `page_title` varbinary(255) NOT NULL DEFAULT '',
+  `page_is_redirect` tinyint(1) unsigned NOT NULL DEFAULT 0,
+  `page_is_new` tinyint(1) unsigned NOT NULL DEFAULT 0,
+  `page_random` double unsigned NOT NULL DEFAULT 0,
+  `page_touched` binary(14) NOT NULL,
+  `page_links_updated` varbinary(14) DEFAULT NULL,
+  `page_latest` int(8) unsigned NOT NULL DEFAULT 0,
+  `page_len` int(8) unsigned NOT NULL DEFAULT 0,
+  `page_content_model` varbinary(32) DEFAULT NULL,
+  `page_lang` varbinary(35) DEFAULT NULL,
+  PRIMARY KEY (`page_id`),
+  UNIQUE KEY `page_name_title` (`page_namespace`,`page_title`),
+  KEY `page_random` (`page_random`),
+  KEY `page_len` (`page_len`)
+) ENGINE=InnoDB AUTO_INCREMENT=100 DEFAULT CHARSET=binary ROW_FORMAT=COMPRESSED;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+LOCK TABLES `page` WRITE;
+/*!40000 ALTER TABLE `page` DISABLE KEYS */;
+INSERT INTO `page` VALUES (1,0,'Filosofia',0,0,0.123,'20250101120000','20250101120000',1001,5000,'wikitext',NULL),(2,0,'Ciência',0,0,0.456,'20250102120000','20250102120000',1002,4000,'wikitext',NULL),(3,0,'Lógica_(filosofia)',0,0,0.789,'20250103120000','20250103120000',1003,3000,'wikitext',NULL),(4,0,'Logica',1,0,0.1,'20250104120000','20250104120000',1004,30,'wikitext',NULL);
+INSERT INTO `page` VALUES (5,0,'Lógica',1,0,0.2,'20250105120000','20250105120000',1005,30,'wikitext',NULL),(6,4,'Esplanada',0,0,0.3,'20250106120000','20250106120000',1006,900,'wikitext',NULL),(7,0,'D\'Alembert,_(matemático)',0,0,0.4,'20250107120000','20250107120000',1007,2000,'wikitext',NULL);
+/*!40000 ALTER TABLE `page` ENABLE KEYS */;
+UNLOCK TABLES;
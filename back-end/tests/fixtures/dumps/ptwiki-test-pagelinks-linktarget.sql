@@ -0,0 +1,14 @@
+-- MySQL dump 10.19  Distrib 10.3.38-MariaDB, for debian-linux-gnu (x86_64)
+
+DROP TABLE IF EXISTS `pagelinks`;
+CREATE TABLE `pagelinks` (
+  `pl_from` int(8) unsigned NOT NULL DEFAULT 0,
+  `pl_from_namespace` int(11) NOT NULL DEFAULT 0,
+  `pl_target_id` bigint(20) unsigned NOT NULL,
+  PRIMARY KEY (`pl_from`,`pl_target_id`),
+  KEY `pl_target_id` (`pl_target_id`,`pl_from`)
+) ENGINE=InnoDB DEFAULT CHARSET=binary ROW_FORMAT=COMPRESSED;
+
+LOCK TABLES `pagelinks` WRITE;
+INSERT INTO `pagelinks` VALUES (1,0,10),(1,0,11),(1,0,12),(1,0,13),(1,0,14),(2,0,15),(2,0,16),(3,0,16),(4,0,17),(6,4,16),(7,0,17);
+UNLOCK TABLES;
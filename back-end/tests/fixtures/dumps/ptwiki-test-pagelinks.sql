@@ -0,0 +1,16 @@
+-- MySQL dump 10.19  Distrib 10.3.38-MariaDB, for debian-linux-gnu (x86_64)
+
+DROP TABLE IF EXISTS `pagelinks`;
+CREATE TABLE `pagelinks` (
+  `pl_from` int(8) unsigned NOT NULL DEFAULT 0,
+  `pl_namespace` int(11) NOT NULL DEFAULT 0,
+  `pl_title` varbinary(255) NOT NULL DEFAULT '',
+  `pl_from_namespace` int(11) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`pl_from`,`pl_namespace`,`pl_title`),
+  KEY `pl_namespace` (`pl_namespace`,`pl_title`,`pl_from`)
+) ENGINE=InnoDB DEFAULT CHARSET=binary ROW_FORMAT=COMPRESSED;
+
+LOCK TABLES `pagelinks` WRITE;
+INSERT INTO `pagelinks` VALUES (1,0,'Ciência',0),(1,0,'Logica',0),(1,0,'Lógica_(filosofia)',0),(1,0,'Inexistente',0),(1,4,'Esplanada',0);
+INSERT INTO `pagelinks` VALUES (2,0,'D\'Alembert,_(matemático)',0),(2,0,'Filosofia',0),(3,0,'Filosofia',0),(4,0,'Lógica',0),(6,0,'Filosofia',4),(7,0,'Lógica',0);
+UNLOCK TABLES;
@@ -18,3 +18,118 @@ def test_fetch_metadata():
     assert "title" in page_data
     assert "revisions" in page_data
     assert "contributors" in page_data
+
+
+class FakeResponse:
+    status_code = 200
+    content = b"{}"
+    headers = {}
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Responde em sequência, registrando os parâmetros de cada chamada."""
+
+    def __init__(self, responses):
+        self.headers = {}
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append(dict(params))
+        return FakeResponse(self.responses.pop(0))
+
+
+def test_metadata_batch_follows_continue():
+    session = FakeSession(
+        [
+            {
+                "continue": {"pccontinue": "1|7", "continue": "||info|revisions"},
+                "query": {
+                    "pages": {
+                        "1": {
+                            "pageid": 1,
+                            "title": "A",
+                            "contributors": [{"userid": 5}],
+                            "revisions": [{"revid": 10}],
+                        },
+                        "2": {"pageid": 2, "title": "B"},
+                        "3": {"ns": 0, "title": "C", "missing": ""},
+                    }
+                },
+            },
+            {
+                "query": {
+                    "pages": {
+                        "1": {
+                            "pageid": 1,
+                            "title": "A",
+                            "contributors": [{"userid": 7}],
+                        },
+                        "2": {
+                            "pageid": 2,
+                            "title": "B",
+                            "contributors": [{"userid": 8}],
+                        },
+                    }
+                }
+            },
+        ]
+    )
+    api = APIClient(session=session)
+
+    pages = api.fetch_metadata_batch([1, 2, 3, 1])
+
+    assert set(pages) == {1, 2}
+    assert len(pages[1]["contributors"]) == 2
+    assert len(pages[1]["revisions"]) == 1
+    assert len(pages[2]["contributors"]) == 1
+    assert session.calls[0]["pageids"] == "1|2|3"
+    assert session.calls[1]["pccontinue"] == "1|7"
+
+
+def test_fetch_links_batch_maps_titles_to_ids():
+    session = FakeSession(
+        [
+            {
+                "query": {
+                    "pages": {
+                        "1": {
+                            "pageid": 1,
+                            "title": "A",
+                            "links": [{"ns": 0, "title": "B"}, {"ns": 0, "title": "R"}],
+                        },
+                        "2": {
+                            "pageid": 2,
+                            "title": "B",
+                            "links": [{"ns": 0, "title": "Inexistente"}],
+                        },
+                    }
+                }
+            },
+            {
+                "query": {
+                    "redirects": [{"from": "R", "to": "C"}],
+                    "pages": {
+                        "2": {"pageid": 2, "ns": 0, "title": "B"},
+                        "3": {"pageid": 3, "ns": 0, "title": "C"},
+                        "-1": {"ns": 0, "title": "Inexistente", "missing": ""},
+                    },
+                }
+            },
+        ]
+    )
+    api = APIClient(session=session)
+
+    links = api.fetch_links_batch([1, 2])
+
+    assert links == {1: [2, 3], 2: []}
+    assert api.stats["requests"] == 2
@@ -0,0 +1,81 @@
+import json
+import os
+import zlib
+
+from scraper.cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def body(data):
+    return json.dumps(data).encode("utf-8")
+
+
+def test_cache_hit_and_key_normalization(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+
+    cache.put({"action": "query", "titles": "A", "redirects": 1}, body({"ok": 1}))
+
+    assert cache.get({"redirects": "1", "titles": "A", "action": "query"}) == {"ok": 1}
+    assert cache.get({"action": "query", "titles": "B"}) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_ttl_per_action(tmp_path):
+    clock = FakeClock()
+    cache = ResponseCache(
+        str(tmp_path / "cache.sqlite3"),
+        ttls={"query": 10, "parse": 100},
+        clock=clock,
+    )
+    query = {"action": "query", "titles": "A"}
+    parse_page = {"action": "parse", "pageid": 1}
+    parse_rev = {"action": "parse", "oldid": 42}
+    for params in (query, parse_page, parse_rev):
+        cache.put(params, body(params))
+
+    clock.now += 50
+    assert cache.get(query) is None
+    assert cache.get(parse_page) is not None
+
+    clock.now += 10_000
+    assert cache.get(parse_page) is None
+    assert cache.get(parse_rev) == {"action": "parse", "oldid": 42}
+
+
+def test_cache_lru_eviction(tmp_path):
+    clock = FakeClock()
+    entries = [body({"n": i, "p": os.urandom(1000).hex()}) for i in range(4)]
+    entry_size = max(len(zlib.compress(e)) for e in entries)
+    # cabem três entradas, não quatro
+    max_bytes = entry_size * 3 + entry_size // 2
+    cache = ResponseCache(
+        str(tmp_path / "cache.sqlite3"), max_bytes=max_bytes, clock=clock
+    )
+
+    for i in range(3):
+        clock.now += 1
+        cache.put({"action": "query", "n": i}, entries[i])
+    clock.now += 1
+    cache.get({"action": "query", "n": 0})
+    clock.now += 1
+    cache.put({"action": "query", "n": 3}, entries[3])
+
+    assert cache.stats()["bytes"] <= max_bytes
+    assert cache.stats()["evictions"] == 1
+    assert cache.get({"action": "query", "n": 0}) is not None
+    assert cache.get({"action": "query", "n": 1}) is None
+
+
+def test_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResponseCache(path).put({"action": "parse", "oldid": 7}, body({"html": "x"}))
+
+    assert ResponseCache(path).get({"action": "parse", "oldid": 7}) == {"html": "x"}
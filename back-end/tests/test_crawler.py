@@ -0,0 +1,121 @@
+import threading
+import time
+
+from models.graph_objects import PageBase, LinkBase
+from services.crawler import AsyncBFSCrawler
+
+# 1 → 2, 3, 2015 ; 2 → 4 ; 3 → 4, 5 ; 4 → 6 ; 5 → 1
+GRAPH = {1: [2, 3, 2015], 2: [4], 3: [4, 5], 4: [6], 5: [1], 6: [], 2015: [6]}
+TITLES = {i: ("2015" if i == 2015 else f"P{i}") for i in GRAPH}
+
+
+class FakeScraper:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _request(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+
+    def scrape_nodes(self, page_ids):
+        self._request()
+        return [
+            PageBase(page_id=pid, title=TITLES[pid], url=TITLES[pid])
+            for pid in page_ids
+        ]
+
+    def scrape_links(self, page_id, revid=None):
+        self._request()
+        return [
+            LinkBase(source_page_id=page_id, target_page_id=t) for t in GRAPH[page_id]
+        ]
+
+    def scrape_page(self, title=None, page_id=None):
+        if page_id is None:
+            page_id = next(i for i, t in TITLES.items() if t == title)
+        self._request()
+        node = PageBase(page_id=page_id, title=TITLES[page_id], url=TITLES[page_id])
+        edges = [
+            LinkBase(source_page_id=page_id, target_page_id=t) for t in GRAPH[page_id]
+        ]
+        return node, edges
+
+
+class MemoryRepository:
+    def __init__(self):
+        self.pages = {}
+        self.links = {}
+        self.queries = 0
+
+    async def get_page_by_id(self, page_id):
+        return self.pages.get(page_id)
+
+    async def get_page_by_title(self, title):
+        return next((p for p in self.pages.values() if p["title"] == title), None)
+
+    async def get_pages_by_titles(self, titles):
+        self.queries += 1
+        by_title = {p["title"]: p["page_id"] for p in self.pages.values()}
+        return {t: by_title[t] for t in titles if t in by_title}
+
+    async def get_neighbors_with_titles(self, page_ids, limit):
+        self.queries += 1
+        neighbors = {}
+        for page_id in page_ids:
+            for target in self.links.get(page_id, [])[:limit]:
+                page = self.pages.get(target)
+                neighbors.setdefault(target, page["title"] if page else None)
+        return list(neighbors.items())
+
+    async def save_page_with_links(self, node, edges):
+        self.pages[node.page_id] = node.model_dump()
+        self.links[node.page_id] = [e.target_page_id for e in edges]
+
+    async def save_pages_with_links(self, pairs):
+        for node, edges in pairs:
+            await self.save_page_with_links(node, edges)
+
+
+def is_year(title):
+    return title.isdigit() and len(title) == 4
+
+
+def test_crawler_visits_levels():
+    crawler = AsyncBFSCrawler(MemoryRepository(), FakeScraper(), skip_title=is_year)
+
+    assert crawler.run("P1", 0) == {1}
+    assert crawler.run("P1", 1) == {1, 2, 3}
+    assert crawler.run("P1", 2) == {1, 2, 3, 4, 5}
+
+
+def test_crawler_respects_concurrency_limit():
+    scraper = FakeScraper()
+    crawler = AsyncBFSCrawler(
+        MemoryRepository(), scraper, max_concurrency=2, skip_title=is_year
+    )
+
+    visited = crawler.run("P1", 3, max_neighbors=2)
+
+    assert visited == {1, 2, 3, 4, 5, 6}
+    assert scraper.max_in_flight <= 2
+
+
+def test_warm_crawl_expands_each_level_with_set_queries():
+    repository = MemoryRepository()
+    crawler = AsyncBFSCrawler(repository, FakeScraper(), skip_title=is_year)
+    crawler.run("P1", 2)
+
+    repository.queries = 0
+    scraper = FakeScraper()
+    visited = AsyncBFSCrawler(repository, scraper, skip_title=is_year).run("P1", 2)
+
+    assert visited == {1, 2, 3, 4, 5}
+    # Um lookup de títulos por nível + uma expansão por nível não final
+    assert repository.queries == 3 + 2
+    assert scraper.max_in_flight == 0
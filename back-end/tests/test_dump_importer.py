@@ -0,0 +1,123 @@
+import gzip
+import os
+import shutil
+
+import pytest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from db.base import Base
+from db.bulk import _copy_value
+from dumps.importer import DumpImporter
+from dumps.sql_reader import SQLDump
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "dumps")
+PAGE = os.path.join(FIXTURES, "ptwiki-test-page.sql")
+REDIRECT = os.path.join(FIXTURES, "ptwiki-test-redirect.sql")
+PAGELINKS = os.path.join(FIXTURES, "ptwiki-test-pagelinks.sql")
+
+EXPECTED_LINKS = [(1, 2), (1, 3), (2, 1), (2, 7), (3, 1), (7, 3)]
+
+
+def make_engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def gzipped(path, tmp_path):
+    target = tmp_path / (os.path.basename(path) + ".gz")
+    with open(path, "rb") as src, gzip.open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    return str(target)
+
+
+def read_graph(engine):
+    with engine.connect() as connection:
+        pages = {
+            row.page_id: row for row in connection.execute(text("SELECT * FROM pages"))
+        }
+        links = sorted(
+            tuple(row)
+            for row in connection.execute(
+                text("SELECT source_page_id, target_page_id FROM links")
+            )
+        )
+    return pages, links
+
+
+def test_sql_dump_reads_columns_and_escaped_values(tmp_path):
+    dump = SQLDump(gzipped(PAGE, tmp_path))
+
+    rows = list(dump.rows("page_id", "page_title", "page_lang"))
+
+    assert dump.table == "page"
+    assert dump.columns[:3] == ["page_id", "page_namespace", "page_title"]
+    assert len(rows) == 7
+    assert rows[2] == (3, "Lógica_(filosofia)", None)
+    assert rows[6] == (7, "D'Alembert,_(matemático)", None)
+
+
+def test_import_resolves_redirects_and_counts_links(tmp_path):
+    engine = make_engine()
+    importer = DumpImporter(engine, batch_size=2)
+
+    stats = importer.run(
+        gzipped(PAGE, tmp_path),
+        redirect_path=gzipped(REDIRECT, tmp_path),
+        pagelinks_path=gzipped(PAGELINKS, tmp_path),
+    )
+    pages, links = read_graph(engine)
+
+    # Só artigos do namespace 0; redirects (4, 5) e o ns 4 (6) ficam de fora
+    assert sorted(pages) == [1, 2, 3, 7]
+    assert pages[3].title == "Lógica (filosofia)"
+    assert pages[3].url == "https://pt.wikipedia.org/wiki/L%C3%B3gica_(filosofia)"
+    assert pages[1].lastrevid == 1001
+    assert pages[1].length_chars == 5000
+    # "Logica" → "Lógica" → "Lógica (filosofia)" (redirect duplo); sem duplicata
+    assert links == EXPECTED_LINKS
+    assert [pages[i].links_out_count for i in (1, 2, 3, 7)] == [2, 2, 1, 1]
+    assert [pages[i].links_in_count for i in (1, 2, 3, 7)] == [2, 1, 2, 1]
+    assert stats == {"pages": 4, "redirects": 2, "links": 6, "unresolved_links": 2}
+
+
+def test_import_with_linktarget_schema():
+    engine = make_engine()
+
+    DumpImporter(engine).run(
+        PAGE,
+        redirect_path=REDIRECT,
+        pagelinks_path=os.path.join(FIXTURES, "ptwiki-test-pagelinks-linktarget.sql"),
+        linktarget_path=os.path.join(FIXTURES, "ptwiki-test-linktarget.sql"),
+    )
+
+    assert read_graph(engine)[1] == EXPECTED_LINKS
+
+
+def test_copy_value_escapes_text_format():
+    assert _copy_value(None) == "\\N"
+    assert _copy_value("a\tb\\c\n") == "a\\tb\\\\c\\n"
+    assert _copy_value(3) == "3"
+    assert _copy_value(["ciência", "a\tb"]) == '["ciência", "a\\\\tb"]'
+
+
+def test_import_refuses_non_empty_database():
+    engine = make_engine()
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO pages (page_id, title, url) VALUES (1, 'Brasil', 'x')")
+        )
+    importer = DumpImporter(engine)
+
+    with pytest.raises(ValueError, match="--truncate"):
+        importer.run(PAGE, redirect_path=REDIRECT, pagelinks_path=PAGELINKS)
+    # Nada foi lido nem gravado
+    assert importer.stats["pages"] == 0 and not importer.title_to_id
+
+    importer.clear_tables()
+    importer.run(PAGE, redirect_path=REDIRECT, pagelinks_path=PAGELINKS)
+    assert read_graph(engine)[1] == EXPECTED_LINKS
@@ -0,0 +1,69 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db.base import Base
+from db.repositories.crawl import CrawlRepository
+from services.frontier import PersistentFrontier, run_progress
+
+# 0 → 1, 2 ; 1 → 3 ; 2 → 3, 4 ; 4 → 5
+GRAPH = {"P0": ["P1", "P2"], "P1": ["P3"], "P2": ["P3", "P4"], "P4": ["P5"]}
+
+
+def make_repository():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return CrawlRepository(sessionmaker(bind=engine))
+
+
+def crawl(frontier, stop_after=None):
+    """BFS do run_scraper.py sobre GRAPH; `stop_after` simula uma queda."""
+    order = []
+    while (entry := frontier.pop()) is not None:
+        title, depth = entry
+        if title in frontier.visited:
+            continue
+        if stop_after is not None and len(order) == stop_after:
+            return order
+        frontier.mark_visited(title)
+        order.append(title)
+        for neighbor in GRAPH.get(title, []):
+            if neighbor not in frontier.visited:
+                frontier.push(neighbor, depth + 1)
+    frontier.finish()
+    return order
+
+
+def test_frontier_is_fifo_and_finishes():
+    repository = make_repository()
+    frontier = PersistentFrontier.start(repository, "P0", 3, 10, checkpoint_every=2)
+
+    assert crawl(frontier) == ["P0", "P1", "P2", "P3", "P4", "P5"]
+
+    run = repository.get_latest_run()
+    progress = run_progress(run)
+    assert run["status"] == "done"
+    assert progress["pages_done"] == 6
+    assert progress["queue_size"] == 0
+    assert repository.load_visited(run["id"]) == {"P0", "P1", "P2", "P3", "P4", "P5"}
+
+
+def test_resume_continues_from_last_checkpoint():
+    repository = make_repository()
+    frontier = PersistentFrontier.start(repository, "P0", 3, 10, checkpoint_every=2)
+
+    # Cai na 4ª página, antes do checkpoint seguinte
+    assert crawl(frontier, stop_after=3) == ["P0", "P1", "P2"]
+    frontier.mark_visited("P3")
+    frontier.push("P9", 3)
+    run = repository.get_latest_run(status="running")
+    progress = run_progress(run)
+    assert (progress["pages_done"], progress["queue_size"]) == (3, 3)
+
+    # O que não chegou ao checkpoint (P3 visitada, P9 na fila) é refeito
+    resumed = PersistentFrontier(repository, run["id"], checkpoint_every=2)
+    assert resumed.visited == {"P0", "P1", "P2"}
+    assert crawl(resumed) == ["P3", "P4", "P5"]
+    assert repository.get_run(run["id"])["pages_done"] == 6
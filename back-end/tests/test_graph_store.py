@@ -0,0 +1,136 @@
+import random
+
+import numpy as np
+
+from services.graph_store import CSRGraph, GraphStore
+from services.pagerank import build_graph
+from models.graph_objects import LinkBase, PageResponse
+from tests.test_page_repository import links, make_repository, page
+
+
+def random_pairs(rnd, page_ids, num_pages=60):
+    return [
+        (page(pid), links(pid, rnd.sample(range(1, num_pages), rnd.randint(0, 6))))
+        for pid in page_ids
+    ]
+
+
+def adjacency(graph: CSRGraph) -> dict[int, set[int]]:
+    return {
+        int(pid): set(graph.neighbors(pid).tolist())
+        for pid in graph.page_ids
+        if len(graph.neighbors(pid))
+    }
+
+
+def db_adjacency(repository) -> dict[int, set[int]]:
+    found = {}
+    for source, target in repository.iter_links():
+        found.setdefault(source, set()).add(target)
+    return found
+
+
+def test_from_repository_matches_links_table():
+    repository = make_repository()
+    repository.save_pages_with_links(random_pairs(random.Random(1), range(1, 40)))
+
+    graph = CSRGraph.from_repository(repository)
+
+    assert graph.indptr.dtype == graph.indices.dtype == np.int32
+    assert adjacency(graph) == db_adjacency(repository)
+    assert set(range(1, 40)) <= set(graph.page_ids.tolist())
+
+
+def test_subgraph_matches_build_graph():
+    rnd = random.Random(2)
+    repository = make_repository()
+    repository.save_pages_with_links(random_pairs(rnd, range(1, 60)))
+    graph = CSRGraph.from_repository(repository)
+    node_ids = rnd.sample(range(1, 60), 25) + [999]
+
+    sub = graph.subgraph(node_ids)
+
+    _, out_neighbors, _ = build_graph(
+        [PageResponse(page_id=pid, title=str(pid), url="") for pid in node_ids],
+        [
+            LinkBase(source_page_id=s, target_page_id=t)
+            for s, t in repository.iter_links()
+        ],
+    )
+    assert sorted(sub.page_ids.tolist()) == sorted(node_ids)
+    assert adjacency(sub) == {u: vs for u, vs in out_neighbors.items() if vs}
+
+
+def test_snapshot_round_trip(tmp_path):
+    graph = CSRGraph.from_edges([1, 1, 3], [3, 7, 1], page_ids=[9])
+    graph = graph.with_versions(np.array([[1, 5], [9, 2**62]]))
+    path = str(tmp_path / "graph.csr")
+    graph.save(path, version=3)
+
+    loaded, meta = CSRGraph.load(path)
+
+    assert meta == {"version": 3}
+    assert isinstance(loaded.indices, np.memmap)
+    for name in ("page_ids", "indptr", "indices", "link_versions"):
+        assert np.array_equal(getattr(loaded, name), getattr(graph, name))
+
+
+def test_refresh_applies_only_changed_sources(tmp_path):
+    rnd = random.Random(3)
+    repository = make_repository()
+    repository.save_pages_with_links(random_pairs(rnd, range(1, 50)))
+    store = GraphStore(str(tmp_path / "graph.csr"))
+    store.get(repository)
+
+    # Páginas novas, links trocados e uma página movida (título reutilizado)
+    repository.save_pages_with_links(random_pairs(rnd, [3, 8, 70, 71]))
+    repository.save_pages_with_links([(page(80, "P5"), links(80, [1, 2]))])
+
+    # No máximo as 6 fontes tocadas (3, 8, 70, 71, 80 e a 5, removida)
+    assert 0 < store.refresh(repository) <= 6
+    assert adjacency(store.graph) == db_adjacency(repository)
+    assert 71 in store.graph.page_ids
+    assert store.refresh(repository) == 0
+
+    # O snapshot regravado é o grafo atualizado
+    loaded, _ = CSRGraph.load(store.snapshot_path)
+    assert adjacency(loaded) == adjacency(store.graph)
+
+
+def test_refresh_detects_links_with_same_summary(tmp_path):
+    repository = make_repository()
+    repository.save_pages_with_links([(page(1), links(1, [10, 20, 25, 30]))])
+    store = GraphStore(str(tmp_path / "graph.csr"))
+    store.get(repository)
+
+    # Mesma contagem, mínimo, máximo e soma dos alvos
+    repository.save_pages_with_links([(page(1), links(1, [10, 21, 24, 30]))])
+
+    assert store.refresh(repository) == 1
+    assert store.graph.neighbors(1).tolist() == [10, 21, 24, 30]
+    assert store.refresh(repository) == 0
+
+
+def test_refresh_rebuilds_snapshot_without_versions(tmp_path):
+    repository = make_repository()
+    repository.save_pages_with_links([(page(1), links(1, [2, 3]))])
+    path = str(tmp_path / "graph.csr")
+    CSRGraph.from_edges([1], [2], page_ids=[1]).save(path)
+    store = GraphStore(path)
+
+    assert store.refresh(repository) > 0
+    assert adjacency(store.graph) == db_adjacency(repository)
+    assert store.refresh(repository) == 0
+
+
+def test_get_fresh_refreshes_at_most_once_per_interval():
+    repository = make_repository()
+    repository.save_pages_with_links([(page(1), links(1, [2]))])
+    store = GraphStore(None, refresh_interval=3600)
+    store.get_fresh(repository)
+
+    repository.save_pages_with_links([(page(1), links(1, [3]))])
+    assert store.get_fresh(repository).neighbors(1).tolist() == [2]
+
+    store.refresh_interval = 0
+    assert store.get_fresh(repository).neighbors(1).tolist() == [3]
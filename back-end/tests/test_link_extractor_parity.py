@@ -0,0 +1,31 @@
+from pathlib import Path
+from urllib.parse import unquote
+
+from bs4 import BeautifulSoup
+
+from scraper.html_parser import HTMLParser
+
+CORPUS = sorted((Path(__file__).parent / "fixtures" / "html").glob("*.html"))
+
+
+def reference_extract_links(html: str):
+    """Extração anterior, baseada na árvore do BeautifulSoup ("html.parser")."""
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        text = a.get_text(strip=True)
+        if href.startswith("/wiki/"):
+            links.append((unquote(href.replace("/wiki/", "")), text.lower()))
+    return links
+
+
+def test_corpus_is_present():
+    assert len(CORPUS) >= 3
+
+
+def test_extract_links_matches_beautifulsoup_on_corpus():
+    parser = HTMLParser()
+    for path in CORPUS:
+        html = path.read_text(encoding="utf-8")
+        assert parser.extract_links(html) == reference_extract_links(html), path.name
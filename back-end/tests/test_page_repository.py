@@ -0,0 +1,278 @@
+import asyncio
+import os
+import random
+import tempfile
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db import engine as engine_module
+from db.base import Base
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.engine import make_async_engine, make_engine
+from db.repositories.page import AsyncPageRepository, PageRepository, aggregate_links
+from models.graph_objects import LinkBase, PageBase
+from services.crawler import AsyncBFSCrawler
+from services.graph_builder import assemble_graph
+from services.page import PageService
+from tests.test_crawler import GRAPH, TITLES, FakeScraper, is_year
+
+
+def make_repository():
+    engine = make_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return PageRepository(sessionmaker(bind=engine)())
+
+
+@asynccontextmanager
+async def async_repository():
+    # Arquivo, não ":memory:": as leituras em thread usam um engine síncrono
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "wiki_graph.db")
+        engine = make_async_engine(f"sqlite+aiosqlite:///{path}")
+        sync_engine = make_engine(f"sqlite:///{path}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield AsyncPageRepository(session, sessionmaker(bind=sync_engine))
+        await engine.dispose()
+        sync_engine.dispose()
+
+
+def page(page_id, title=None, **fields):
+    title = title or TITLES.get(page_id, f"P{page_id}")
+    return PageBase(page_id=page_id, title=title, url=title, **fields)
+
+
+def links(source, targets):
+    return [LinkBase(source_page_id=source, target_page_id=t) for t in targets]
+
+
+def graph_pairs(graph, page_ids=None):
+    return [(page(pid), links(pid, graph[pid])) for pid in page_ids or graph]
+
+
+def save_graph(repository, graph, page_ids=None):
+    repository.save_pages_with_links(graph_pairs(graph, page_ids))
+
+
+def links_in(repository):
+    rows = repository.db_session.execute(
+        text("SELECT page_id, links_in_count FROM pages")
+    )
+    return dict(rows.all())
+
+
+def test_database_url_falls_back_to_sqlite(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setattr(engine_module, "HOST", "")
+    assert engine_module.get_database_url() == "sqlite:///./wiki_graph.db"
+
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///outro.db")
+    assert engine_module.get_database_url() == "sqlite:///outro.db"
+
+
+def test_aggregate_links_groups_pairs():
+    rows = aggregate_links(
+        [
+            LinkBase(source_page_id=1, target_page_id=2, anchor_text="a"),
+            LinkBase(source_page_id=1, target_page_id=2, anchor_text="b"),
+            LinkBase(source_page_id=1, target_page_id=2, anchor_text="a"),
+            LinkBase(source_page_id=1, target_page_id=3),
+        ]
+    )
+    assert rows == [(1, 2, ["a", "b"], 3), (1, 3, None, 1)]
+
+
+def test_save_pages_with_links_upserts_and_replaces_links():
+    repository = make_repository()
+    repository.save_pages_with_links(
+        [(page(1, lastrevid=10), links(1, [2, 3, 3])), (page(2), links(2, [1]))]
+    )
+    repository.update_pagerank_scores({1: 0.7})
+
+    repository.save_pages_with_links([(page(1, lastrevid=11), links(1, [2]))])
+
+    saved = repository.get_page_by_id(1)
+    assert saved["lastrevid"] == 11
+    assert saved["pagerank_score"] == 0.7
+    _, rows = repository.get_subgraph([1, 2, 3])
+    assert sorted((r["source_page_id"], r["target_page_id"]) for r in rows) == [
+        (1, 2),
+        (2, 1),
+    ]
+    assert links_in(repository) == {1: 1, 2: 1}
+
+
+def test_release_titles_drops_stale_page():
+    repository = make_repository()
+    save_graph(repository, {1: [2], 2: [1]})
+
+    # A página 1 foi movida: o título "P1" agora é da página 7
+    repository.save_pages_with_links([(page(7, "P1"), links(7, [2]))])
+
+    assert repository.get_page_by_id(1) is None
+    assert repository.get_page_by_title("P1")["page_id"] == 7
+    assert links_in(repository) == {2: 1, 7: 0}
+
+
+def test_links_in_count_matches_rebuild():
+    rnd = random.Random(3)
+    repository = make_repository()
+    for _ in range(30):
+        batch = rnd.sample(range(1, 40), 6)
+        repository.save_pages_with_links(
+            [(page(pid), links(pid, rnd.sample(range(1, 40), 5))) for pid in batch],
+            batch_size=4,
+        )
+    repository.save_page_with_links(page(39), links(39, [1, 2]))
+
+    maintained = links_in(repository)
+    assert repository.rebuild_links_in_count() == 0
+    assert links_in(repository) == maintained
+
+
+def test_get_neighbors_with_titles_limits_per_source():
+    repository = make_repository()
+    save_graph(repository, {1: [5, 4, 9], 2: [4, 3]}, page_ids=[1, 2])
+    save_graph(repository, {4: [], 5: []})
+
+    assert repository.get_neighbors_with_titles([2, 1], limit=2) == [
+        (3, None),
+        (4, "P4"),
+        (5, "P5"),
+    ]
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+@pytest.mark.parametrize("max_neighbors", [1, 2, 50])
+def test_neighborhood_matches_python_bfs(depth, max_neighbors):
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(graph_pairs(GRAPH))
+            crawler = AsyncBFSCrawler(repository, FakeScraper(), skip_title=is_year)
+            visited = await crawler.crawl("P1", depth, max_neighbors)
+            return visited, await repository.get_neighborhood(
+                "P1", depth, max_neighbors
+            )
+
+    expected, (pages, pairs) = asyncio.run(scenario())
+
+    assert {p["page_id"] for p in pages} == expected
+    assert set(pairs) == {(s, t) for s in expected for t in GRAPH[s] if t in expected}
+
+
+def test_cached_neighborhood_scrapes_only_fringe():
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(graph_pairs(GRAPH, [1, 2, 3]))
+            service = PageService(repository, scraper=FakeScraper())
+            pages, _ = await service.cached_neighborhood("P1", 3)
+            assert {p["page_id"] for p in pages} == {1, 2, 3, 4, 5, 6}
+            # Como no BFS, a página de ano é baixada mas fica fora do grafo
+            assert await repository.get_page_by_title("2015") is not None
+            assert await service.cached_neighborhood("Inexistente", 3) is None
+
+    asyncio.run(scenario())
+
+
+def test_calculate_pagerank_persists_scores():
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(
+                graph_pairs({1: [2], 2: [1, 3], 3: [1]})
+            )
+            service = PageService(repository, scraper=FakeScraper())
+            result = await service.calculate_pagerank(["P1", "P2", "P3", "P9"])
+            return result.pagerank, await repository.get_page_by_id(1)
+
+    scores, saved = asyncio.run(scenario())
+
+    assert set(scores) == {"P1", "P2", "P3"}
+    assert abs(sum(scores.values()) - 1.0) < 1e-6
+    assert saved["pagerank_score"] == scores["P1"]
+
+
+def test_warm_start_pagerank_reuses_stored_scores():
+    graph = {1: [2, 3], 2: [3, 4], 3: [1], 4: [1, 5], 5: [2]}
+
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(graph_pairs(graph))
+            service = PageService(repository, scraper=FakeScraper())
+            titles = [f"P{i}" for i in graph]
+            cold = await service.calculate_pagerank(titles)
+            warm = await service.calculate_pagerank(titles, warm_start=True)
+            return cold, warm
+
+    cold, warm = asyncio.run(scenario())
+
+    assert warm.warm_start and not cold.warm_start
+    assert warm.iterations == len(warm.residuals) < cold.iterations
+    assert warm.residuals[-1] < 1e-6
+    for title, score in cold.pagerank.items():
+        assert abs(warm.pagerank[title] - score) < 1e-5
+
+
+def test_read_subgraph_streams_same_graph_as_get_subgraph():
+    threads = []
+
+    def consume(pages, links):
+        threads.append(threading.get_ident())
+        return assemble_graph(pages, links)
+
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(graph_pairs(GRAPH))
+            page_ids = [1, 2, 3, 4, 99]
+            streamed = await repository.read_subgraph(page_ids, consume)
+            return streamed, await repository.get_subgraph(page_ids)
+
+    streamed, (pages, rows) = asyncio.run(scenario())
+
+    # A montagem roda fora da thread do loop de eventos
+    assert threads and threads[0] != threading.get_ident()
+
+    titles = {p["page_id"]: p["title"] for p in pages}
+    assert sorted(streamed.nodes) == sorted(titles.values())
+    assert sorted((l.source, l.target) for l in streamed.links) == sorted(
+        (titles[r["source_page_id"]], titles[r["target_page_id"]]) for r in rows
+    )
+
+
+def test_anchor_texts_are_interned_and_resolved():
+    repository = make_repository()
+    repository.save_pages_with_links(
+        [
+            (
+                page(1),
+                [
+                    LinkBase(source_page_id=1, target_page_id=2, anchor_text="brasil"),
+                    LinkBase(source_page_id=1, target_page_id=2, anchor_text="país"),
+                    LinkBase(source_page_id=1, target_page_id=3),
+                ],
+            ),
+            (
+                page(2),
+                [LinkBase(source_page_id=2, target_page_id=1, anchor_text="brasil")],
+            ),
+        ]
+    )
+
+    _, rows = repository.get_subgraph([1, 2, 3])
+    anchors = {
+        (r["source_page_id"], r["target_page_id"]): r["anchor_texts"] for r in rows
+    }
+    assert anchors == {(1, 2): ["brasil", "país"], (1, 3): None, (2, 1): ["brasil"]}
+    stored = repository.db_session.execute(text("SELECT text FROM anchor_texts"))
+    assert sorted(stored.scalars()) == ["brasil", "país"]
+
+    # Ids criados em uma transação desfeita não ficam no cache
+    repository.anchors.get_ids(["novo"])
+    repository.db_session.rollback()
+    assert repository.anchors.cache.get_ids(["novo"]) == {}
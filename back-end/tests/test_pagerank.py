@@ -1,5 +1,9 @@
+import numpy as np
+
 from models.graph_objects import PageResponse, LinkBase
-from services.pagerank import build_graph, pagerank
+from services.graph_store import CSRGraph
+from services.pagerank import build_graph, pagerank, pagerank_csr, warm_start_vector
+from services.pagerank_parallel import ParallelPageRank, row_blocks
 
 
 def criar_grafo_teste():
@@ -120,7 +124,72 @@ def testar_pagerank():
     print("✅ pagerank parece consistente (ordem e soma ok).\n")
 
 
+def testar_pagerank_float32_e_arestas_externas():
+    nodes, edges = criar_grafo_teste()
+    # Aresta para um nó fora da lista: ignorada, como em build_graph
+    edges.append(LinkBase(source_page_id=3, target_page_id=99))
+
+    ranks64 = pagerank(nodes, edges, d=0.85, max_iter=100, tol=1e-8)
+    ranks32 = pagerank(nodes, edges, d=0.85, max_iter=100, tol=1e-8, dtype=np.float32)
+
+    assert set(ranks64) == {0, 1, 2, 3}
+    for page_id, score in ranks64.items():
+        assert abs(ranks32[page_id] - score) < 1e-6
+
+
+def testar_partida_aquecida_com_extrapolacao():
+    rng = np.random.default_rng(7)
+    # Dois aglomerados quase separados: a iteração de potência converge devagar
+    sources = np.repeat(np.arange(400), 5)
+    targets = (sources // 200) * 200 + rng.integers(0, 200, len(sources))
+    ponte = rng.random(len(sources)) < 0.01
+    targets[ponte] = rng.integers(0, 400, ponte.sum())
+    graph = CSRGraph.from_edges(sources, targets)
+    anterior = pagerank_csr(graph, tol=1e-10)
+
+    # Dois nós mudam de links e um nó novo (sem score salvo) aparece
+    mudados = np.array([0, 1, 400])
+    mudado = graph.replace_rows(mudados, mudados, np.array([7, 250, 3]))
+    scores = dict(zip(graph.page_ids.tolist(), anterior.tolist()))
+    inicio = warm_start_vector(mudado.page_ids, scores)
+    assert mudado.num_nodes == 401
+    assert abs(inicio.sum() - 1.0) < 1e-9
+    assert inicio[-1] == 1.0 / 401
+
+    fria, aquecida = [], []
+    esperado = pagerank_csr(mudado, tol=1e-8, residuals=fria)
+    ranks = pagerank_csr(
+        mudado, tol=1e-8, residuals=aquecida, start=inicio, accelerate=True
+    )
+    assert len(aquecida) < len(fria)
+    assert np.abs(ranks - esperado).sum() < 1e-6
+
+
+def testar_motor_paralelo_igual_ao_serial():
+    rng = np.random.default_rng(11)
+    sources = rng.integers(0, 2000, 12000)
+    targets = (2000 * rng.random(12000) ** 3).astype(np.int64)
+    graph = CSRGraph.from_edges(sources[sources % 7 != 0], targets[sources % 7 != 0])
+
+    blocos = row_blocks(graph.indptr, 3)
+    assert blocos[0][0] == 0 and blocos[-1][1] == graph.num_nodes
+    assert all(a[1] == b[0] for a, b in zip(blocos, blocos[1:]))
+
+    serial, paralelo = [], []
+    esperado = pagerank_csr(graph, tol=1e-10, residuals=serial)
+    with ParallelPageRank(graph, workers=3) as motor:
+        ranks = motor.run(tol=1e-10, residuals=paralelo)
+        # O mesmo pool e a mesma memória servem a uma segunda execução
+        acelerado = motor.run(tol=1e-10, start=esperado, accelerate=True)
+    assert len(paralelo) == len(serial)
+    assert np.abs(ranks - esperado).max() < 1e-12
+    assert np.abs(acelerado - esperado).sum() < 1e-8
+
+
 if __name__ == "__main__":
     testar_build_graph()
     testar_pagerank()
+    testar_pagerank_float32_e_arestas_externas()
+    testar_partida_aquecida_com_extrapolacao()
+    testar_motor_paralelo_igual_ao_serial()
     print("Todos os testes manuais passaram ✅")
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repositories.page import AsyncPageRepository
+from services.graph_store import GraphStore
+from services.page import PageService
+from services.ppr import push_ppr
+from tests.test_crawler import FakeScraper
+from tests.test_page_repository import async_repository, graph_pairs
+
+
+def exact_ppr(graph, seed, alpha):
+    """PPR exato por sistema linear; nós sem saída voltam à semente."""
+    ids = sorted(set(graph) | {t for targets in graph.values() for t in targets})
+    index = {pid: i for i, pid in enumerate(ids)}
+    walk = np.zeros((len(ids), len(ids)))
+    for pid in ids:
+        targets = graph.get(pid, [])
+        for t in targets:
+            walk[index[pid], index[t]] += 1.0 / len(targets)
+        if not targets:
+            walk[index[pid], index[seed]] = 1.0
+    restart = np.zeros(len(ids))
+    restart[index[seed]] = alpha
+    ppr = np.linalg.solve((np.eye(len(ids)) - (1 - alpha) * walk).T, restart)
+    return dict(zip(ids, ppr))
+
+
+def test_push_ppr_within_error_bound():
+    rng = np.random.default_rng(3)
+    graph = {
+        pid: sorted(set(rng.integers(0, 40, rng.integers(0, 6)).tolist()))
+        for pid in range(40)
+    }
+    exact = exact_ppr(graph, 0, 0.15)
+
+    for epsilon in (1e-2, 1e-4, 1e-7):
+        estimate, residual, pushes = push_ppr(
+            lambda u: graph.get(u, []), 0, 0.15, epsilon
+        )
+        errors = [exact[pid] - estimate.get(pid, 0.0) for pid in exact]
+        assert min(errors) > -1e-12
+        assert max(errors) <= residual + 1e-12
+        assert abs(sum(errors) - residual) < 1e-9
+    assert residual < 1e-5
+
+
+def test_push_ppr_work_bounded_by_epsilon():
+    # Cadeia longa: com ε grande o push para antes de percorrê-la
+    chain = lambda u: [u + 1] if u < 1_000_000 else []
+    estimate, residual, pushes = push_ppr(chain, 0, alpha=0.5, epsilon=1e-3)
+    assert pushes <= 1 / (0.5 * 1e-3)
+    assert len(estimate) < 20
+    assert residual < 1e-3
+
+
+def test_personalized_pagerank_scrapes_missing_seed():
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(graph_pairs({1: [2, 3]}))
+            service = PageService(
+                repository, scraper=FakeScraper(), graph_store=GraphStore(None)
+            )
+            # Carrega o GraphStore só com os links de P1
+            cached = await service.personalized_pagerank("P1", epsilon=1e-6)
+            assert {s.page_id for s in cached.scores} == {1, 2, 3}
+            assert await service.personalized_pagerank("P4") is None
+
+            result = await service.personalized_pagerank(
+                "P4", epsilon=1e-6, scrape=True
+            )
+            return result, await repository.get_page_by_title("P6")
+
+    result, scraped = asyncio.run(scenario())
+
+    # P4 → 6, ambas baixadas depois da carga do GraphStore
+    assert scraped is not None
+    assert [s.title for s in result.scores] == ["P4", "P6"]
+    assert result.residual < 1e-5
+    for score in result.scores:
+        assert score.upper_bound == score.score + result.residual
+    assert abs(sum(s.score for s in result.scores) + result.residual - 1) < 1e-9
+
+
+def test_concurrent_ppr_requests_before_graph_is_loaded():
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(
+                graph_pairs({1: [2, 3], 2: [3], 3: [1]})
+            )
+            # Uma sessão por requisição, como na API, e o mesmo GraphStore
+            store = GraphStore(None)
+            async with AsyncSession(repository.db_session.bind) as session:
+                other = AsyncPageRepository(session, repository.session_factory)
+                return await asyncio.gather(
+                    *(
+                        PageService(r, FakeScraper(), store).personalized_pagerank(
+                            seed, epsilon=1e-6
+                        )
+                        for r, seed in ((repository, "P1"), (other, "P2"))
+                    )
+                )
+
+    results = []
+    # Em outra thread: se o loop travar, o join expira em vez de travar o teste
+    worker = threading.Thread(
+        target=lambda: results.append(asyncio.run(scenario())), daemon=True
+    )
+    worker.start()
+    worker.join(timeout=30)
+
+    assert not worker.is_alive()
+    first, second = results[0]
+    assert first.seed == "P1" and second.seed == "P2"
+    assert {s.page_id for s in first.scores} == {s.page_id for s in second.scores}
+
+
+def test_personalized_pagerank_sees_links_saved_after_graph_load():
+    async def scenario():
+        async with async_repository() as repository:
+            await repository.save_pages_with_links(
+                graph_pairs({1: [2, 3], 2: [3], 3: [1]})
+            )
+            service = PageService(
+                repository,
+                scraper=FakeScraper(),
+                graph_store=GraphStore(None, refresh_interval=0),
+            )
+            before = await service.personalized_pagerank("P1", epsilon=1e-6)
+            # P3, a dois passos da semente e já no grafo, ganha um link para P7
+            await repository.save_pages_with_links(graph_pairs({3: [1, 7], 7: []}))
+            after = await service.personalized_pagerank("P1", epsilon=1e-6)
+            return before, after
+
+    before, after = asyncio.run(scenario())
+
+    assert {s.page_id for s in before.scores} == {1, 2, 3}
+    assert {s.page_id for s in after.scores} == {1, 2, 3, 7}
@@ -0,0 +1,111 @@
+from scraper.api_client import APIClient
+from scraper.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Relógio manual; `sleep` apenas avança o tempo."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class FakeResponse:
+    def __init__(self, status_code, data, headers=None):
+        self.status_code = status_code
+        self.data = data
+        self.headers = headers or {}
+        self.content = b"{}"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.headers = {}
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append(dict(params))
+        return self.responses.pop(0)
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_rate=10, burst=3)
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.now == 0.0
+
+    limiter.acquire()
+    assert abs(clock.now - 0.1) < 1e-9
+
+
+def test_throttle_halves_rate_and_honors_retry_after():
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_rate=10, burst=5, min_rate=1)
+
+    limiter.on_throttle(retry_after=2)
+    assert limiter.current_rate == 5
+    limiter.acquire()
+    assert clock.now >= 2
+
+    for _ in range(10):
+        limiter.on_throttle()
+    assert limiter.current_rate == 1
+
+    limiter.on_success()
+    assert limiter.current_rate > 1
+
+
+def test_client_retries_throttled_queries():
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_rate=100, burst=10)
+    ok = {"query": {"pages": {}}}
+    session = FakeSession(
+        [
+            FakeResponse(429, {}, {"Retry-After": "3"}),
+            FakeResponse(200, {"error": {"code": "maxlag", "lag": 7}}),
+            FakeResponse(200, ok),
+        ]
+    )
+    api = APIClient(session=session, rate_limiter=limiter)
+
+    assert api.call_api({"action": "query", "titles": "A"}) == ok
+    assert len(session.calls) == 3
+    assert all(call["maxlag"] == api.maxlag for call in session.calls)
+    assert clock.now >= 3
+    assert limiter.stats()["throttled"] == 2
+    assert limiter.stats()["retries"] == 2
+
+
+def test_client_does_not_retry_non_idempotent_actions():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    session = FakeSession([FakeResponse(503, {}), FakeResponse(200, {})])
+    api = APIClient(session=session, rate_limiter=limiter)
+
+    try:
+        api.call_api({"action": "purge", "titles": "A"})
+        assert False, "deveria ter falhado"
+    except RuntimeError:
+        pass
+    assert len(session.calls) == 1
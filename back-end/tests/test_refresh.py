@@ -0,0 +1,159 @@
+import json
+
+from models.graph_objects import PageBase, LinkBase
+from scraper.api_client import APIClient
+from scraper.cache import ResponseCache
+from scraper.wiki_scraper import MODE_HTML, MODE_LINKS, WikiScraper
+from services.refresh import PageRefresher
+
+TOUCHED = "2025-01-01T00:00:00Z"
+
+
+class FakeAPI:
+    def __init__(self, current, missing=()):
+        self.current = current
+        self.missing = set(missing)
+        self.info_calls = []
+
+    def fetch_page_info_batch(self, page_ids, missing=None):
+        self.info_calls.append(list(page_ids))
+        if missing is not None:
+            missing.update(pid for pid in page_ids if pid in self.missing)
+        return {pid: self.current[pid] for pid in page_ids if pid in self.current}
+
+
+class FakeScraper:
+    def __init__(self, api, mode=MODE_HTML):
+        self.api = api
+        self.mode = mode
+        self.scraped = []
+
+    def scrape_pages(self, page_ids, use_cache=True):
+        self.scraped.extend(page_ids)
+        return [
+            (
+                PageBase(
+                    page_id=pid,
+                    title=f"P{pid}",
+                    url=f"P{pid}",
+                    lastrevid=self.api.current[pid]["lastrevid"],
+                    touched=self.api.current[pid]["touched"],
+                ),
+                [LinkBase(source_page_id=pid, target_page_id=1)],
+            )
+            for pid in page_ids
+        ]
+
+
+class FakeRepository:
+    def __init__(self, rows):
+        self.rows = {row["page_id"]: row for row in rows}
+        self.saved = {}
+
+    def iter_page_revisions(self, batch_size=50):
+        ids = sorted(self.rows)
+        for i in range(0, len(ids), batch_size):
+            yield [dict(self.rows[pid]) for pid in ids[i : i + batch_size]]
+
+    def save_pages_with_links(self, pairs):
+        for page_data, links in pairs:
+            self.saved[page_data.page_id] = (page_data, links)
+
+
+def row(page_id, lastrevid, touched=TOUCHED):
+    return {
+        "page_id": page_id,
+        "title": f"P{page_id}",
+        "lastrevid": lastrevid,
+        "touched": touched,
+    }
+
+
+def info(lastrevid, touched=TOUCHED):
+    return {"lastrevid": lastrevid, "touched": touched}
+
+
+def test_refresh_rescrapes_only_changed_pages():
+    repository = FakeRepository([row(1, 100), row(2, 200), row(3, None), row(4, 400)])
+    api = FakeAPI({1: info(100), 2: info(201), 3: info(300)}, missing=[4])
+    scraper = FakeScraper(api)
+
+    stats = PageRefresher(repository, scraper, batch_size=2).run()
+
+    assert api.info_calls == [[1, 2], [3, 4]]
+    assert sorted(scraper.scraped) == [2, 3]
+    assert sorted(repository.saved) == [2, 3]
+    assert repository.saved[2][0].lastrevid == 201
+    assert stats == {"checked": 4, "changed": 2, "unchanged": 1, "missing": 1}
+
+
+def test_touched_only_counts_in_links_mode():
+    rows = [row(1, 100, "2025-01-01T00:00:00Z")]
+    current = {1: info(100, "2025-02-01T00:00:00Z")}
+
+    html_scraper = FakeScraper(FakeAPI(current), mode=MODE_HTML)
+    PageRefresher(FakeRepository(rows), html_scraper).run()
+    assert html_scraper.scraped == []
+
+    links_scraper = FakeScraper(FakeAPI(current), mode=MODE_LINKS)
+    PageRefresher(FakeRepository(rows), links_scraper).run()
+    assert links_scraper.scraped == [1]
+
+
+class FakeWikiResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, data):
+        self.data = data
+        self.content = json.dumps(data).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeWikiSession:
+    """Wiki de uma página (id 1) cuja revisão e links mudam entre as consultas."""
+
+    def __init__(self):
+        self.headers = {}
+        self.revision = 100
+        self.links = ["B"]
+
+    def get(self, url, params=None):
+        if params.get("generator") == "links":
+            pages = {
+                str(ord(title)): {"pageid": ord(title), "title": title}
+                for title in self.links
+            }
+            return FakeWikiResponse({"query": {"pages": pages}})
+        page = {
+            "pageid": 1,
+            "title": "A",
+            "fullurl": "https://pt.wikipedia.org/wiki/A",
+            "lastrevid": self.revision,
+            "touched": TOUCHED,
+        }
+        if params.get("prop") == "links":
+            page["links"] = [{"ns": 0, "title": title} for title in self.links]
+        return FakeWikiResponse({"query": {"pages": {"1": page}}})
+
+
+def test_refresh_bypasses_response_cache(tmp_path):
+    session = FakeWikiSession()
+    api = APIClient(session=session, cache=ResponseCache(str(tmp_path / "c.sqlite3")))
+    scraper = WikiScraper(api_client=api, mode=MODE_LINKS)
+    # Crawl inicial: metadados e links da revisão 100 ficam no cache
+    [(page, _)] = scraper.scrape_pages([1])
+    assert page.lastrevid == 100
+
+    session.revision, session.links = 101, ["C"]
+    repository = FakeRepository([row(1, 100)])
+    PageRefresher(repository, scraper).run()
+
+    saved_page, saved_links = repository.saved[1]
+    assert saved_page.lastrevid == 101
+    assert [link.target_page_id for link in saved_links] == [ord("C")]
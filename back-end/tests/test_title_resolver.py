@@ -0,0 +1,82 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db.base import Base
+from db.db_models import Page
+from db.repositories.title_alias import TitleAliasRepository
+from scraper.title_resolver import TitleLRU, TitleResolver
+
+WIKI = {
+    "Desenho": (10, "Desenho"),
+    "Cálculo": (20, "Cálculo"),
+    "Calculo": (20, "Cálculo"),
+}
+
+
+class FakeAPI:
+    def __init__(self):
+        self.calls = []
+
+    def resolve_titles_batch(self, titles, missing=None):
+        self.calls.append(sorted(titles))
+        if missing is not None:
+            missing.update(t for t in titles if t not in WIKI)
+        return {t: WIKI[t] for t in titles if t in WIKI}
+
+
+def make_store():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return TitleAliasRepository(sessionmaker(bind=engine))
+
+
+def test_resolver_only_asks_api_for_unseen_titles():
+    api = FakeAPI()
+    resolver = TitleResolver(api)
+
+    first = resolver.resolve(["Desenho", "Calculo", "Inexistente"])
+    second = resolver.resolve(["Calculo", "Inexistente", "Desenho"])
+
+    assert first == second == {"Desenho": (10, "Desenho"), "Calculo": (20, "Cálculo")}
+    assert api.calls == [["Calculo", "Desenho", "Inexistente"]]
+    assert resolver.stats["lru_hits"] == 3
+
+
+def test_resolver_uses_database_before_api():
+    store = make_store()
+    TitleResolver(FakeAPI(), store=store).resolve(["Calculo", "Inexistente"])
+    with store.session_factory() as session:
+        session.add(Page(page_id=30, title="Engenharia civil", url="x"))
+        session.commit()
+
+    api = FakeAPI()
+    resolver = TitleResolver(api, store=store)
+    resolved = resolver.resolve(["Calculo", "Inexistente", "engenharia_civil"])
+
+    assert resolved == {
+        "Calculo": (20, "Cálculo"),
+        "engenharia_civil": (30, "Engenharia civil"),
+    }
+    # Títulos inexistentes não são gravados: voltam a ser consultados na API
+    assert api.calls == [["Inexistente"]]
+    assert resolver.stats["db_hits"] == 2
+    assert store.get_many(["Inexistente"]) == {}
+
+
+def test_missing_titles_expire_from_lru():
+    api = FakeAPI()
+    resolver = TitleResolver(api, cache=TitleLRU(missing_ttl=0))
+
+    assert resolver.resolve(["Desenho", "Geometria"]) == {"Desenho": (10, "Desenho")}
+    # O link vermelho virou página depois da primeira consulta
+    WIKI["Geometria"] = (40, "Geometria")
+    try:
+        second = resolver.resolve(["Desenho", "Geometria"])
+    finally:
+        del WIKI["Geometria"]
+
+    assert second == {"Desenho": (10, "Desenho"), "Geometria": (40, "Geometria")}
+    assert api.calls == [["Desenho", "Geometria"], ["Geometria"]]
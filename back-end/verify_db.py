@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from db.session import SessionLocal
 from db.db_models import Page, Link
+from db.repositories.anchor_text import AnchorTextRepository
 from sqlalchemy import func
 
 
@@ -17,7 +18,7 @@ def verify_database():
         print(f"Total de Páginas no banco de dados: {page_count}")
 
         # Count links
-        link_count = session.query(func.count(Link.id)).scalar()
+        link_count = session.query(func.count()).select_from(Link).scalar()
         print(f"Total de Links no banco de dados: {link_count}")
 
         if page_count > 0:
@@ -28,10 +29,19 @@ def verify_database():
 
         if link_count > 0:
             print("\nÚltimos 5 Links:")
-            links = session.query(Link).order_by(Link.id.desc()).limit(5).all()
+            links = (
+                session.query(Link)
+                .order_by(Link.source_page_id.desc(), Link.target_page_id.desc())
+                .limit(5)
+                .all()
+            )
+            texts = AnchorTextRepository(session).get_texts(
+                i for l in links for i in l.anchor_ids or ()
+            )
             for l in links:
+                anchors = [texts.get(i) for i in l.anchor_ids or ()]
                 print(
-                    f" - Link ID {l.id}: Page {l.source_page_id} -> Page {l.target_page_id} (Anchor: {l.anchor_text})"
+                    f" - Page {l.source_page_id} -> Page {l.target_page_id} (x{l.multiplicity}, Anchors: {anchors})"
                 )
 
     except Exception as e: